@@ -0,0 +1,42 @@
+from typing import Optional
+
+from fastapi import APIRouter, Header, HTTPException
+
+from memory import memory_reporter
+from profiling import admin_token_matches, profiler
+
+# Operational endpoints, only reachable with the X-Admin-Token header matching ADMIN_TOKEN
+router = APIRouter(prefix="/admin")
+
+
+def _require_admin(token: Optional[str]):
+    if not admin_token_matches(token):
+        raise HTTPException(status_code=403, detail="Admin token required")
+
+
+@router.get("/profile")
+def get_profile(route: Optional[str] = None, top: int = 20,
+                x_admin_token: Optional[str] = Header(None)):
+    """Hottest functions per route from the sampled requests"""
+    _require_admin(x_admin_token)
+    return {"routes": profiler.report(route, top)}
+
+
+@router.delete("/profile")
+def reset_profile(x_admin_token: Optional[str] = Header(None)):
+    """Discard collected samples"""
+    _require_admin(x_admin_token)
+    profiler.reset()
+    return {"message": "Profile reset"}
+
+
+@router.get("/memory")
+def get_memory(top: int = 20, sample: int = 200, x_admin_token: Optional[str] = Header(None)):
+    """
+    Deep sizes of the session store and caches, plus allocation sites that
+    grew since the previous call (the first call records the baseline)
+    """
+    _require_admin(x_admin_token)
+    if not memory_reporter.enabled:
+        raise HTTPException(status_code=404, detail="Memory reporting is disabled, set MEMORY_REPORT=1")
+    return memory_reporter.report(top, sample)
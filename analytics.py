@@ -0,0 +1,132 @@
+"""
+Streaming aggregates of assessment outcomes
+Updated in O(1) from each session journal event and each final result, so
+/analytics reads a handful of preallocated counters instead of scanning
+sessions: how far sessions get, level and score distribution per domain,
+yes/no tallies per question and feedback volume
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+from domain_content import DOMAIN_QUESTIONS
+from state import ConversationState
+
+DOMAINS = list(DOMAIN_QUESTIONS)
+LEVELS = ("Beginner", "Intermediate", "Advanced")
+FUNNEL = ("started", "personal_info", "domain_selected", "answering", "completed")
+MAX_SCORE = 6
+
+_DOMAIN_IDS = {domain: i for i, domain in enumerate(DOMAINS)}
+_LEVEL_IDS = {level: i for i, level in enumerate(LEVELS)}
+
+# Question id = offset of its domain + its index in DOMAIN_QUESTIONS[domain]
+QUESTION_OFFSETS: Dict[str, int] = {}
+QUESTIONS: List[str] = []
+for _domain, _questions in DOMAIN_QUESTIONS.items():
+    QUESTION_OFFSETS[_domain] = len(QUESTIONS)
+    QUESTIONS.extend(question["q"] for question in _questions)
+
+# Funnel step each journal event moves a session to
+_EVENT_STEPS = {"start": 0, "personal_info": 1, "advance": 1, "domain": 2, "answer": 3}
+_COMPLETED = FUNNEL.index("completed")
+
+
+class AssessmentAnalytics:
+    """
+    Counters in flat lists indexed by funnel step, domain, level, score and
+    question id. One lock covers every update and the snapshot copy, so a
+    reader never sees a result counted in one place but not yet another
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._reached = [0] * len(FUNNEL)
+            self._furthest = [0] * len(FUNNEL)
+            self._levels = [0] * (len(DOMAINS) * len(LEVELS))
+            self._scores = [0] * (len(DOMAINS) * (MAX_SCORE + 1))
+            self._yes = [0] * len(QUESTIONS)
+            self._no = [0] * len(QUESTIONS)
+            # The last slot counts feedback without a domain
+            self._feedback = [0] * (len(DOMAINS) + 1)
+
+    def on_event(self, state: ConversationState, kind: str, args: tuple):
+        """Journal subscriber: funnel steps and per-question answers"""
+        step = _EVENT_STEPS.get(kind)
+        if step is None or (kind == "advance" and state.user_name is None):
+            return
+        with self._lock:
+            self._advance(state, step)
+            if kind == "answer":
+                question_id = QUESTION_OFFSETS[state.selected_domain] + args[0]
+                if args[1]:
+                    self._yes[question_id] += 1
+                else:
+                    self._no[question_id] += 1
+
+    def record_result(self, state: ConversationState, level: str):
+        """A completed assessment: its level and score, and the funnel's last step; once per session"""
+        domain = _DOMAIN_IDS.get(state.selected_domain)
+        with self._lock:
+            if self._advance(state, _COMPLETED) and domain is not None:
+                self._levels[domain * len(LEVELS) + _LEVEL_IDS[level]] += 1
+                self._scores[domain * (MAX_SCORE + 1) + min(state.score, MAX_SCORE)] += 1
+
+    def record_feedback(self, domain: Optional[str]):
+        with self._lock:
+            self._feedback[_DOMAIN_IDS.get(domain, len(DOMAINS))] += 1
+
+    def _advance(self, state: ConversationState, step: int) -> bool:
+        # Each session counts once per step it reaches and sits in "furthest"
+        # at the last one; the step lives on the state (runtime only).
+        # False if the session was already there
+        previous = state.__dict__.get("_funnel_step", -1)
+        if step <= previous:
+            return False
+        state._funnel_step = step
+        self._reached[step] += 1
+        self._furthest[step] += 1
+        if previous >= 0:
+            self._furthest[previous] -= 1
+        return True
+
+    def snapshot(self) -> Dict[str, Any]:
+        """All aggregates from one consistent copy of the counters"""
+        with self._lock:
+            reached, furthest = self._reached[:], self._furthest[:]
+            levels, scores = self._levels[:], self._scores[:]
+            yes, no, feedback = self._yes[:], self._no[:], self._feedback[:]
+
+        domains = {}
+        for d, domain in enumerate(DOMAINS):
+            offset, count = QUESTION_OFFSETS[domain], len(DOMAIN_QUESTIONS[domain])
+            domain_levels = levels[d * len(LEVELS):(d + 1) * len(LEVELS)]
+            domains[domain] = {
+                "completed": sum(domain_levels),
+                "levels": dict(zip(LEVELS, domain_levels)),
+                "scores": scores[d * (MAX_SCORE + 1):(d + 1) * (MAX_SCORE + 1)],
+                "questions": [
+                    {
+                        "question": QUESTIONS[q],
+                        "yes": yes[q],
+                        "no": no[q],
+                        "yes_rate": round(yes[q] / (yes[q] + no[q]), 3) if yes[q] + no[q] else None,
+                    }
+                    for q in range(offset, offset + count)
+                ],
+                "feedback": feedback[d],
+            }
+        return {
+            "funnel": [{"stage": stage, "reached": reached[i], "stopped_here": furthest[i]}
+                       for i, stage in enumerate(FUNNEL)],
+            "domains": domains,
+            "feedback": {"total": sum(feedback), "without_domain": feedback[-1]},
+        }
+
+
+# Global instance
+analytics = AssessmentAnalytics()
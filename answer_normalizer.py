@@ -0,0 +1,107 @@
+import re
+from enum import Enum
+from functools import lru_cache
+from typing import Dict, Tuple
+
+
+class Verdict(str, Enum):
+    """What an assessment answer amounts to; values are the acknowledgment answer types"""
+    YES = "positive"
+    NO = "negative"
+    PARTIAL = "partial"
+    NUMERIC = "numeric"
+    UNCLEAR = "unclear"
+
+
+_PHRASES = {
+    Verdict.YES: [
+        "yes", "y", "yeah", "yep", "yup", "sure", "definitely", "absolutely", "of course",
+        "correct", "that's right", "thats right", "true", "indeed", "done", "implemented",
+        "i have", "i do", "familiar",
+    ],
+    Verdict.NO: [
+        "no", "n", "nope", "nah", "never", "false", "incorrect", "wrong",
+        "not really", "not at all", "not yet", "haven't", "havent", "have not",
+        "don't think so", "dont think so", "i don't", "i dont", "i haven't", "i havent",
+    ],
+    Verdict.PARTIAL: [
+        "somewhat", "kind of", "sort of", "a little", "a bit", "partially", "maybe",
+        "sometimes", "occasionally", "not sure", "i think so",
+    ],
+}
+
+# Token tuple -> verdict, looked up longest phrase first
+PHRASES: Dict[Tuple[str, ...], Verdict] = {
+    tuple(phrase.split()): verdict for verdict, phrases in _PHRASES.items() for phrase in phrases
+}
+MAX_PHRASE = max(len(phrase) for phrase in PHRASES)
+
+# A negator right before a positive or partial phrase turns it into a no
+NEGATORS = {"not", "don't", "dont", "didn't", "didnt", "never", "hardly"}
+
+# Openers that say nothing on their own: "i have never used it", "i have no
+# idea". They only count as a yes if nothing later in the clause decides
+WEAK_PHRASES = {("i", "have"), ("i", "do")}
+
+# Their negative forms only answer on their own ("I don't."); "i don't know"
+# or "i don't understand" is not a no, so more words in the clause skip them
+BARE_PHRASES = {("i", "don't"), ("i", "dont"), ("i", "haven't"), ("i", "havent")}
+
+# Punctuation is kept as tokens so phrases and clauses stop at it
+_TOKEN = re.compile(r"[a-z0-9']+|[,.;!]")
+_CLAUSE_ENDS = {",", ".", ";", "!", "but"}
+
+# Short inputs ("yes", "no", "y") repeat constantly; longer ones are mostly unique
+_CACHE_MAX_LENGTH = 32
+
+
+def normalize_answer(text: str) -> Verdict:
+    """Classify a free-text assessment answer"""
+    if len(text) <= _CACHE_MAX_LENGTH:
+        return _normalize_cached(text)
+    return _normalize(text)
+
+
+@lru_cache(maxsize=4096)
+def _normalize_cached(text: str) -> Verdict:
+    return _normalize(text)
+
+
+def _normalize(text: str) -> Verdict:
+    # "is that right?" asks something, it does not answer
+    if text.rstrip().endswith("?"):
+        return Verdict.UNCLEAR
+
+    tokens = _TOKEN.findall(text.lower().replace("’", "'"))
+
+    # The first phrase in the answer decides it ("no, but I'd like to" is a no)
+    weak = None
+    start = 0
+    while start < len(tokens):
+        if weak is not None and tokens[start] in _CLAUSE_ENDS:
+            return weak
+        for length in range(min(MAX_PHRASE, len(tokens) - start), 0, -1):
+            phrase = tuple(tokens[start:start + length])
+            verdict = PHRASES.get(phrase)
+            if verdict is None:
+                continue
+            end = start + length
+            if phrase in BARE_PHRASES and end < len(tokens) and tokens[end] not in _CLAUSE_ENDS:
+                continue
+            if verdict is not Verdict.NO:
+                negated_before = start > 0 and tokens[start - 1] in NEGATORS
+                negated_after = start + length < len(tokens) and tokens[start + length] == "not"
+                if negated_before or negated_after:
+                    return Verdict.NO
+            if phrase in WEAK_PHRASES and weak is None:
+                weak = verdict
+                start += length - 1
+                break
+            return verdict
+        start += 1
+    if weak is not None:
+        return weak
+
+    if any(token.isdigit() for token in tokens):
+        return Verdict.NUMERIC
+    return Verdict.UNCLEAR
@@ -0,0 +1,92 @@
+"""
+Benchmark the shared Gemini client against building a GenerativeModel on
+every call, and the first request with and without the startup warm-up
+Runs against a local stub endpoint, no Gemini quota is used
+
+Steady state alternates short rounds of each variant and reports medians,
+so drift on the machine (CPU frequency, the stub's threads) hits both alike.
+The first request is timed in fresh processes, since it is only cold once
+
+Usage: python bench_gemini_client.py [--rounds 20] [--calls 25] [--processes 5]
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+from gemini_stub import start_server
+
+PROMPT = "Rephrase: Do you have experience with REST APIs?"
+
+# Run in a fresh process: time the first generate_content, after warm() or not
+_FIRST_CALL = """
+import time
+from gemini_client import gemini_client
+if {warm}:
+    gemini_client.warm()
+started = time.perf_counter()
+gemini_client.get_model("gemini-pro").generate_content({prompt!r}).text
+print((time.perf_counter() - started) * 1e6)
+"""
+
+
+def _round(call, calls: int) -> float:
+    started = time.perf_counter()
+    for _ in range(calls):
+        call()
+    return (time.perf_counter() - started) / calls * 1e6
+
+
+def _first_call(warm: bool, processes: int) -> float:
+    root = os.path.dirname(os.path.abspath(__file__))
+    script = _FIRST_CALL.format(warm=warm, prompt=PROMPT)
+    timings = [float(subprocess.run([sys.executable, "-W", "ignore", "-c", script], cwd=root, env=os.environ,
+                                    capture_output=True, text=True, check=True).stdout.split()[-1])
+               for _ in range(processes)]
+    return statistics.median(timings)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--calls", type=int, default=25, help="calls per round")
+    parser.add_argument("--processes", type=int, default=5, help="fresh processes per first-request timing")
+    args = parser.parse_args()
+
+    os.environ["GEMINI_API_KEY"] = "bench"
+    os.environ["GEMINI_API_ENDPOINT"] = f"http://127.0.0.1:{start_server().server_address[1]}"
+
+    import google.generativeai as genai
+    from gemini_client import gemini_client
+
+    gemini_client.warm()
+    variants = {
+        "construct only, per-call GenerativeModel": lambda: genai.GenerativeModel("gemini-pro"),
+        "construct only, shared get_model": lambda: gemini_client.get_model("gemini-pro"),
+        "call, new model per call": lambda: genai.GenerativeModel("gemini-pro").generate_content(PROMPT).text,
+        "call, shared model": lambda: gemini_client.get_model("gemini-pro").generate_content(PROMPT).text,
+    }
+    rounds = {label: [] for label in variants}
+    for _ in range(args.rounds):
+        for label, call in variants.items():
+            rounds[label].append(_round(call, args.calls))
+
+    print(f"Steady state, median of {args.rounds} alternating rounds of {args.calls} calls\n")
+    medians = {label: statistics.median(timings) for label, timings in rounds.items()}
+    for label, median in medians.items():
+        spread = statistics.quantiles(rounds[label], n=4)
+        print(f"  {label:<44}{median:10.1f} µs/call   (IQR {spread[0]:.1f}-{spread[2]:.1f})")
+    before, after = medians["call, new model per call"], medians["call, shared model"]
+    print(f"  {'end-to-end difference':<44}{before - after:10.1f} µs/call   ({(before - after) / before * 100:+.1f}%)")
+
+    print(f"\nFirst request in a fresh process, median of {args.processes}\n")
+    cold, warmed = _first_call(False, args.processes), _first_call(True, args.processes)
+    print(f"  {'without warm-up':<44}{cold:10.1f} µs")
+    print(f"  {'after gemini_client.warm()':<44}{warmed:10.1f} µs")
+
+
+if __name__ == "__main__":
+    main()
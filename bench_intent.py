@@ -0,0 +1,69 @@
+"""
+Benchmark the compiled intent matcher against the original implementation
+Runs detect_intent (with and without assessment context) over the answer
+corpus from bench_suite.py, plus the tech-keyword check on its own, then
+batch throughput of classify_many against a per-text loop
+
+Usage: python bench_intent.py [iterations] [batch size]
+"""
+
+import statistics
+import sys
+import time
+
+from bench_suite import ANSWER_CORPUS
+from intent_detector import IntentDetector, classify_many
+from test_intent_matcher import LegacyIntentDetector
+
+
+def _time(label: str, fn, iterations: int, calls: int) -> float:
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    per_call = (time.perf_counter() - started) / iterations / calls * 1e9
+    print(f"  {label:<12}{per_call:>10.0f} ns/call")
+    return per_call
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    detector, legacy = IntentDetector(), LegacyIntentDetector()
+    lowered = [text.lower().strip() for text in ANSWER_CORPUS]
+
+    for name, before, after, calls in [
+        ("detect_intent",
+         lambda: [legacy.detect_intent(text, context) for text in ANSWER_CORPUS for context in ("", "assessment")],
+         lambda: [detector.detect_intent(text, context) for text in ANSWER_CORPUS for context in ("", "assessment")],
+         len(ANSWER_CORPUS) * 2),
+        ("_is_tech_related",
+         lambda: [legacy._legacy_is_tech_related(text) for text in lowered],
+         lambda: [detector._is_tech_related(text) for text in lowered],
+         len(lowered)),
+    ]:
+        print(f"\n{name} ({calls} inputs)")
+        slow = _time("before", before, iterations, calls)
+        fast = _time("after", after, iterations, calls)
+        print(f"  speedup: {slow / fast:.2f}x")
+
+    size = int(sys.argv[2]) if len(sys.argv) > 2 else 200_000
+    texts = [f"{text} #{i}" for i, text in enumerate(ANSWER_CORPUS * (size // len(ANSWER_CORPUS)))]
+    runs = {
+        "loop": lambda: [(detector.detect_intent(text), detector.classify_answer_type(text)) for text in texts],
+        "in-process": lambda: sum(1 for _ in classify_many(texts, max_workers=1)),
+        "pool": lambda: sum(1 for _ in classify_many(texts)),
+    }
+    # Alternating repeats, so drift on the machine hits every variant alike
+    rates = {label: [] for label in runs}
+    for _ in range(5):
+        for label, run in runs.items():
+            started = time.perf_counter()
+            run()
+            rates[label].append(len(texts) / (time.perf_counter() - started))
+    print(f"\nbatch of {len(texts)} distinct texts, median of 5 alternating runs")
+    for label, rate in rates.items():
+        rate = statistics.median(rate)
+        print(f"  {label:<12}{rate:>10.0f} texts/s   {rate / statistics.median(rates['loop']):.2f}x loop")
+
+if __name__ == "__main__":
+    main()
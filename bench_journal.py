@@ -0,0 +1,76 @@
+"""
+Benchmark the session journal: append throughput and replay time
+Appends whole assessments (start, personal info, domain, six answers, chats)
+for many sessions, compared with dumping the full state on every turn, then
+times replaying one session from its latest snapshot and the whole file
+
+Usage: python bench_journal.py [sessions]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+import orjson
+
+from journal import SessionJournal, replay
+from state import ConversationState
+
+TURNS = [("start",), ("personal_info", "Asha", "Pune", "BSc"), ("domain", "devops")] + \
+        [("answer", index, index % 3 != 0) for index in range(6)] + [("chat",), ("docs_shown",), ("chat",)]
+
+
+def _per_event(label: str, elapsed: float, events: int):
+    print(f"  {label:<44}{elapsed / events * 1e6:>8.2f} µs/event{events / elapsed:>12.0f} events/s")
+
+
+def _full_state_dumps(path: str, sessions: int) -> float:
+    """The alternative: rewrite the session's whole state after every turn"""
+    log = SessionJournal()
+    started = time.perf_counter()
+    with open(path, "ab") as f:
+        for n in range(sessions):
+            state = ConversationState()
+            for kind, *args in TURNS:
+                log.record("", state, kind, *args)
+                f.write(orjson.dumps([str(n), state.to_dict()]) + b"\n")
+    return time.perf_counter() - started
+
+
+def main_bench():
+    sessions = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+    events = sessions * len(TURNS)
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sessions.journal")
+        # Twelve events per assessment, so each session gets a snapshot part way
+        log = SessionJournal(path, snapshot_every=8)
+        started = time.perf_counter()
+        for n in range(sessions):
+            state = ConversationState()
+            for kind, *args in TURNS:
+                log.record(f"session-{n}", state, kind, *args)
+        log.close()
+        appended = time.perf_counter() - started
+        size = os.path.getsize(path)
+
+        print(f"\nappend ({sessions} sessions, {events} events, {size / events:.0f} bytes/event with snapshots)")
+        _per_event(f"journal: event + snapshot every {log.snapshot_every}", appended, events)
+        _per_event("before: full state dump per turn", _full_state_dumps(os.path.join(directory, "dumps"), sessions), events)
+
+        print("\nreplay")
+        last = f"session-{sessions - 1}"
+        started = time.perf_counter()
+        replay(path, last)
+        elapsed = time.perf_counter() - started
+        print(f"  {'one session from its snapshot':<44}{elapsed * 1e3:>8.2f} ms (scans the file)")
+
+        started = time.perf_counter()
+        states = replay(path)
+        elapsed = time.perf_counter() - started
+        print(f"  {'all sessions':<44}{elapsed * 1e3:>8.2f} ms{len(states) / elapsed:>12.0f} sessions/s")
+
+
+if __name__ == "__main__":
+    main_bench()
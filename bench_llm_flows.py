@@ -0,0 +1,72 @@
+"""
+Offline throughput and tail-latency benchmark of the AI-assisted flows
+Drives SafeGeminiWrapper against the local Gemini stub, no network or quota needed
+
+Usage: python bench_llm_flows.py --latency lognormal:300:0.6 --error-rate 0.02 --concurrency 16
+       python bench_llm_flows.py --server   (go through the SDK and the stub HTTP server)
+"""
+
+import argparse
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _percentile(ordered, pct):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100.0))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=400, help="calls per method")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--latency", default="lognormal:200:0.5")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--server", action="store_true", help="use the stub HTTP server via the SDK")
+    args = parser.parse_args()
+
+    os.environ["GEMINI_STUB_LATENCY"] = args.latency
+    os.environ["GEMINI_STUB_ERROR_RATE"] = str(args.error_rate)
+    os.environ["GEMINI_STUB_SEED"] = str(args.seed)
+    if args.server:
+        from gemini_stub import start_server
+        os.environ["GEMINI_API_ENDPOINT"] = f"http://127.0.0.1:{start_server().server_address[1]}"
+    else:
+        os.environ["GEMINI_STUB"] = "1"
+
+    from safe_gemini import safe_gemini
+
+    flows = {
+        "rephrase": lambda i: safe_gemini.rephrase_question(f"Have you worked with tool number {i}?", "backend"),
+        "acknowledgment": lambda i: safe_gemini.generate_acknowledgment(f"yes, for {i} months", "positive"),
+        "clarification": lambda i: safe_gemini.answer_clarification_question(f"What is concept {i}?", "Domain: backend"),
+        "recommendation": lambda i: safe_gemini.generate_final_recommendation(
+            "Alex", "backend", "Intermediate", ["Caching", "Databases"], ["REST API"]
+        ),
+    }
+
+    print(f"Stub latency {args.latency}, error rate {args.error_rate}, "
+          f"concurrency {args.concurrency}, {'HTTP server' if args.server else 'in-process'}\n")
+    print(f"{'method':<16}{'calls/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+
+    for method, flow in flows.items():
+        def timed(i):
+            started = time.perf_counter()
+            flow(i)
+            return time.perf_counter() - started
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.concurrency) as pool:
+            latencies = sorted(pool.map(timed, range(args.calls)))
+        elapsed = time.perf_counter() - started
+
+        print(f"{method:<16}{args.calls / elapsed:>10.1f}"
+              f"{_percentile(latencies, 50) * 1000:>10.1f}"
+              f"{_percentile(latencies, 95) * 1000:>10.1f}"
+              f"{_percentile(latencies, 99) * 1000:>10.1f}"
+              f"{latencies[-1] * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
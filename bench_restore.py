@@ -0,0 +1,59 @@
+"""
+Benchmark the shutdown dump and startup restore of in-memory sessions
+Builds sessions at a mix of stages (fresh, mid-assessment, completed with
+chat flags), dumps them to a snapshot file and streams them back, at a few
+sizes to show the restore time grows linearly
+
+Usage: python bench_restore.py [sessions]       largest size, default 100000
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from domain_content import DOMAIN_QUESTIONS
+from journal import SessionJournal
+from lifecycle import dump_sessions, restore_sessions
+from state import ConversationState
+
+
+def _sessions(count: int):
+    log = SessionJournal()
+    domains = list(DOMAIN_QUESTIONS)
+    sessions = {}
+    for n in range(count):
+        state = sessions[f"{n:08x}-5f0c-4d1e-9a5b-6b3c2d1e0f9a"] = ConversationState()
+        log.record("", state, "personal_info", "Asha", "Pune", "BSc Computer Science")
+        if n % 4 == 0:
+            continue
+        log.record("", state, "domain", domains[n % len(domains)])
+        for index in range(n % 7):
+            log.record("", state, "answer", index, index % 2 == 0)
+        if n % 7 == 6:
+            log.record("", state, "docs_shown")
+    return sessions
+
+
+def main_bench():
+    largest = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    print(f"{'sessions':>10}{'dump ms':>10}{'restore ms':>12}{'µs/session':>12}{'MB':>8}")
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sessions.snapshot")
+        for count in (largest // 4, largest // 2, largest):
+            sessions = _sessions(count)
+            started = time.perf_counter()
+            dump_sessions(sessions, path)
+            dumped = time.perf_counter() - started
+            size = os.path.getsize(path)
+
+            restored = {}
+            started = time.perf_counter()
+            restore_sessions(restored, path)
+            elapsed = time.perf_counter() - started
+            assert len(restored) == count
+            print(f"{count:>10}{dumped * 1e3:>10.0f}{elapsed * 1e3:>12.0f}{elapsed / count * 1e6:>12.2f}{size / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main_bench()
@@ -0,0 +1,68 @@
+"""
+Benchmark the response serialisation path at realistic payload sizes
+Compares the old dict + jsonable_encoder + json.dumps path with the typed
+response models + orjson path for final results and the detailed roadmap
+
+Usage: python bench_serialization.py [iterations]
+"""
+
+import json
+import sys
+import time
+
+import orjson
+from fastapi.encoders import jsonable_encoder
+
+import main
+
+
+def _final_results_payload():
+    """Run one full assessment through the handlers and return the final payload"""
+    session_id = main.start_conversation()["session_id"]
+    main.submit_answer(main.UserAnswerRequest(session_id=session_id, answer="backend"))
+    payload = None
+    for i in range(6):
+        payload = main.submit_answer(main.UserAnswerRequest(session_id=session_id, answer="yes" if i % 3 else "no"))
+    return payload
+
+
+def _json_response_render(content) -> bytes:
+    # What JSONResponse.render does
+    return json.dumps(content, ensure_ascii=False, allow_nan=False, indent=None, separators=(",", ":")).encode("utf-8")
+
+
+def _time(label: str, fn, iterations: int, size: int):
+    fn()
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    elapsed = time.perf_counter() - started
+    per_op = elapsed / iterations * 1e6
+    print(f"  {label:<44}{per_op:>10.1f} µs{iterations / elapsed:>12.0f} ops/s{size * iterations / elapsed / 1e6:>9.1f} MB/s")
+    return per_op
+
+
+def main_bench():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 5000
+
+    results = _final_results_payload()
+    roadmap = main.get_detailed_roadmap(main.RoadmapRequest(domain="backend"))
+
+    for name, payload, model in [
+        ("final results", results, main.AnswerResponse),
+        ("detailed roadmap", roadmap, main.DetailedRoadmap),
+    ]:
+        size = len(orjson.dumps(payload))
+        print(f"\n{name} ({size / 1024:.1f} KiB)")
+
+        before = _time("before: jsonable_encoder + json.dumps",
+                       lambda: _json_response_render(jsonable_encoder(payload)), iterations, size)
+        after = _time("after: response model + orjson",
+                      lambda: orjson.dumps(model.model_validate(payload).model_dump(mode="json", exclude_unset=True)),
+                      iterations, size)
+        _time("floor: orjson.dumps only", lambda: orjson.dumps(payload), iterations, size)
+        print(f"  speedup: {before / after:.2f}x")
+
+
+if __name__ == "__main__":
+    main_bench()
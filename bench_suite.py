@@ -0,0 +1,326 @@
+"""
+Microbenchmarks for the per-turn CPU paths, with saved baselines
+Each benchmark runs one pass over a realistic input corpus; timings are
+reported per input (ns/op) over several repeats
+
+Usage: python bench_suite.py                         run everything
+       python bench_suite.py -k intent               only names containing "intent"
+       python bench_suite.py --save before           write .benchmarks/before.json
+       python bench_suite.py --compare before        flag regressions against it
+       python bench_suite.py --compare before --threshold 5
+Exits with status 1 when --compare finds a regression above the threshold
+Baselines are timings of one machine, so .benchmarks/ is kept out of git:
+save one on the machine you compare on, before the change under test
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+BASELINE_DIR = ".benchmarks"
+
+# Free-text turns as users actually type them during the assessment
+ANSWER_CORPUS = [
+    "yes", "Yes", "no", "No.", "yeah", "nope", "y", "n", "sure", "not really",
+    "yes, I have used it at work", "no, never touched it", "kind of, a little bit",
+    "I've been using Docker for 2 years", "maybe", "sometimes at my internship",
+    "absolutely!", "not at all", "correct", "I think so but not sure",
+    "What is a REST API?", "can you explain what caching means?", "huh?",
+    "i don't understand the question", "hi", "hello there", "how are you",
+    "what's the weather like today?", "tell me a joke", "Why does this matter for backend?",
+    "I used Kubernetes and Terraform for deployment", "3 projects with React",
+    "definitely, every day", "never heard of it", "partially, in a course", "sort of",
+    "okay", "done", "implemented it last year", "eh",
+]
+
+NAME_CORPUS = ["Alex", "priya", "  John  ", "María", "Li", "x", "John Smith", "R2D2", "Christopher", "ab"]
+LOCATION_CORPUS = ["New York", "bangalore", "São Paulo", "London UK", "x", "Berlin", "  Tokyo ", "123 Main St"]
+EDUCATION_CORPUS = ["Computer Science", "BSc Physics", "self-taught", "MBA", "12th grade", "no", "B.Tech in IT"]
+DOMAIN_CORPUS = [
+    "backend", "Frontend", "I want to do machine learning", "devops please", "Data Analytics",
+    "cyber security", "algorithms", "data engineering", "web dev", "mobile apps", "ML", "game development",
+    "dsa", "infra", "a", "bakend", "cybersecurty",
+]
+# Domain answers that only match with typos, one word to a sentence
+TYPO_CORPUS = [
+    "bakend", "frontnd", "devopps", "algoritms", "sequrity", "infrastucture", "bakcend", "kubernetis",
+    "cybersecurty", "dev opps", "machne lerning", "data enginering", "data analitics", "fornt end",
+    "I want to do machine lerning", "fronted development please",
+]
+
+BENCHMARKS: Dict[str, Callable[[], Tuple[Callable[[], None], int]]] = {}
+
+
+def benchmark(name: str):
+    """Register a setup function returning (one pass over the corpus, inputs per pass)"""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+@benchmark("intent.detect_intent")
+def _detect_intent():
+    from intent_detector import IntentDetector
+    detector = IntentDetector()
+
+    def run():
+        for text in ANSWER_CORPUS:
+            detector.detect_intent(text, "assessment")
+    return run, len(ANSWER_CORPUS)
+
+
+@benchmark("intent.classify_answer_type")
+def _classify_answer_type():
+    from intent_detector import IntentDetector
+    detector = IntentDetector()
+
+    def run():
+        for text in ANSWER_CORPUS:
+            detector.classify_answer_type(text)
+    return run, len(ANSWER_CORPUS)
+
+
+@benchmark("answers.normalize_uncached")
+def _normalize_uncached():
+    # Bypasses the LRU front cache, i.e. the cost of a first-seen answer
+    from answer_normalizer import _normalize
+
+    def run():
+        for text in ANSWER_CORPUS:
+            _normalize(text)
+    return run, len(ANSWER_CORPUS)
+
+
+@benchmark("state.extract_name_location_education")
+def _extract_entities():
+    from state import ConversationState
+    state = ConversationState()
+    corpus = [(state.extract_name, text) for text in NAME_CORPUS] + \
+             [(state.extract_location, text) for text in LOCATION_CORPUS] + \
+             [(state.extract_education, text) for text in EDUCATION_CORPUS]
+
+    def run():
+        for extract, text in corpus:
+            extract(text)
+    return run, len(corpus)
+
+
+@benchmark("state_controller.advance")
+def _advance():
+    from state import ConversationState
+    from state_controller import StateController
+    controller = StateController()
+    # Personal-info walks with a rejected input at each stage
+    turns = ["R2D2", "Alex", "123", "Berlin", "x", "Computer Science"]
+
+    def run():
+        state = ConversationState()
+        for text in turns:
+            controller.advance(state, text)
+    return run, len(turns)
+
+
+@benchmark("state_controller.get_current_question")
+def _current_question():
+    from state import ConversationState, ConversationStage
+    from state_controller import StateController
+    controller = StateController()
+    states = []
+    for stage in ConversationStage:
+        state = ConversationState()
+        state.user_name = "Alex"
+        state.stage = stage
+        states.append(state)
+
+    def run():
+        for state in states:
+            controller.get_current_question(state)
+    return run, len(states)
+
+
+@benchmark("main.match_domain")
+def _match_domain():
+    import main
+
+    def run():
+        for text in DOMAIN_CORPUS:
+            main._match_domain(text)
+    return run, len(DOMAIN_CORPUS)
+
+
+@benchmark("domains.resolve_uncached")
+def _resolve_uncached():
+    # Bypasses the LRU front cache, i.e. the cost of a first-seen input
+    from domain_resolver import domain_resolver
+
+    def run():
+        for text in DOMAIN_CORPUS:
+            domain_resolver._rank(text)
+    return run, len(DOMAIN_CORPUS)
+
+
+@benchmark("domains.resolve_uncached_typos")
+def _resolve_uncached_typos():
+    from domain_resolver import domain_resolver
+
+    def run():
+        for text in TYPO_CORPUS:
+            domain_resolver._rank(text)
+    return run, len(TYPO_CORPUS)
+
+
+@benchmark("retrieval.chat_best")
+def _chat_best():
+    from retrieval import chat_index
+    queries = [
+        ("what is docker?", "devops"), ("what jobs can I get", "backend"), ("tell me about react hooks", "frontend"),
+        ("how does kafka stream processing work", "frontend"), ("explain dynamic programming", "algorithms"),
+        ("what is the weather", "backend"), ("how long does the roadmap take", "machine learning"), ("ok cool", None),
+    ]
+
+    def run():
+        for text, domain in queries:
+            chat_index.best(text, domain)
+    return run, len(queries)
+
+
+@benchmark("analytics.assessment_events")
+def _analytics_events():
+    from analytics import AssessmentAnalytics
+    from journal import SessionJournal
+    from state import ConversationState
+    log = SessionJournal()
+    log.subscribe(AssessmentAnalytics().on_event)
+    turns = [("start",), ("personal_info", "Asha", "Pune", "BSc"), ("domain", "devops")] + \
+            [("answer", index, index % 2 == 0) for index in range(6)]
+
+    def run():
+        state = ConversationState()
+        for kind, *args in turns:
+            log.record("", state, kind, *args)
+    return run, len(turns)
+
+
+@benchmark("analytics.snapshot")
+def _analytics_snapshot():
+    from analytics import AssessmentAnalytics
+    stats = AssessmentAnalytics()
+
+    def run():
+        stats.snapshot()
+    return run, 1
+
+
+@benchmark("main.generate_detailed_results")
+def _generate_detailed_results():
+    import main
+    from journal import journal
+    from state import ConversationState
+
+    cases = []
+    for i, domain in enumerate(main.VALID_DOMAINS):
+        session_id = f"bench-{i}"
+        questions = main._get_session_questions(session_id, domain)
+        state = ConversationState()
+        journal.record(session_id, state, "domain", domain)
+        for j, question in enumerate(questions):
+            main._record_answer(session_id, state, question, (i + j) % 3 != 0)
+        cases.append((state, questions))
+
+    def run():
+        for state, questions in cases:
+            main._generate_detailed_results(state, questions)
+    return run, len(cases)
+
+
+def measure(run: Callable[[], None], ops: int, repeats: int) -> Dict[str, float]:
+    """ns per input: median and min over `repeats` timings of an auto-ranged loop"""
+    timer = timeit.Timer(run)
+    number, _ = timer.autorange()
+    per_op = [elapsed / number / ops * 1e9 for elapsed in timer.repeat(repeat=repeats, number=number)]
+    return {
+        "median_ns": statistics.median(per_op),
+        "min_ns": min(per_op),
+        "stdev_ns": statistics.stdev(per_op) if len(per_op) > 1 else 0.0,
+        "rounds": number * repeats,
+    }
+
+
+def run_suite(pattern: str, repeats: int) -> Dict[str, Dict[str, float]]:
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if pattern and pattern not in name:
+            continue
+        run, ops = setup()
+        results[name] = measure(run, ops, repeats)
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float, stat: str = "min") -> List[str]:
+    """Print results against a baseline; return names slower by more than threshold percent"""
+    key = f"{stat}_ns"
+    regressions = []
+    print(f"{'benchmark':<40}{'base ns':>12}{'now ns':>12}{'change':>10}   ({stat})")
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None:
+            print(f"{name:<40}{'-':>12}{result[key]:>12.1f}{'new':>10}")
+            continue
+        change = (result[key] / base[key] - 1) * 100
+        flag = ""
+        if change > threshold:
+            flag = "  REGRESSION"
+            regressions.append(name)
+        print(f"{name:<40}{base[key]:>12.1f}{result[key]:>12.1f}{change:>+9.1f}%{flag}")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="pattern", default="", help="only run benchmarks whose name contains this")
+    parser.add_argument("--repeats", type=int, default=7)
+    parser.add_argument("--save", metavar="NAME", help="save results as a baseline")
+    parser.add_argument("--compare", metavar="NAME", help="compare against a saved baseline")
+    parser.add_argument("--threshold", type=float, default=10.0, help="regression threshold in percent")
+    # The minimum is the least sensitive to other load on the machine
+    parser.add_argument("--stat", choices=("min", "median"), default="min", help="statistic compared against the baseline")
+    args = parser.parse_args()
+
+    results = run_suite(args.pattern, args.repeats)
+
+    if args.compare:
+        with open(os.path.join(BASELINE_DIR, f"{args.compare}.json")) as f:
+            baseline = json.load(f)["benchmarks"]
+        regressions = compare(results, baseline, args.threshold, args.stat)
+    else:
+        regressions = []
+        print(f"{'benchmark':<40}{'median ns':>12}{'min ns':>12}{'stdev':>10}")
+        for name, result in results.items():
+            print(f"{name:<40}{result['median_ns']:>12.1f}{result['min_ns']:>12.1f}{result['stdev_ns']:>10.1f}")
+
+    if args.save:
+        os.makedirs(BASELINE_DIR, exist_ok=True)
+        with open(os.path.join(BASELINE_DIR, f"{args.save}.json"), "w") as f:
+            json.dump({
+                "python": platform.python_version(),
+                "machine": platform.machine(),
+                "saved_at": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "benchmarks": results,
+            }, f, indent=2)
+        print(f"\nSaved baseline {args.save!r}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) above {args.threshold:.0f}%: {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
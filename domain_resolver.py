@@ -0,0 +1,297 @@
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+# Canonical domain -> what users type for it; covers every Data/*.json domain
+DOMAIN_ALIASES: Dict[str, List[str]] = {
+    'backend': [
+        "backend", "back end", "backend development", "backend dev", "backend engineering",
+        "server side", "server development", "api development",
+    ],
+    'frontend': [
+        "frontend", "front end", "frontend development", "frontend dev", "frontend engineering",
+        "web development", "web dev", "ui development",
+    ],
+    'data analytics': [
+        "data analytics", "data analysis", "data analyst", "analytics", "business intelligence", "bi",
+    ],
+    'machine learning': [
+        "machine learning", "ml", "ai", "artificial intelligence", "deep learning", "data science",
+    ],
+    'devops': [
+        "devops", "dev ops", "infra", "infrastructure", "sre", "site reliability", "cloud engineering",
+        "platform engineering",
+    ],
+    'cybersecurity': [
+        "cybersecurity", "cyber security", "security", "sec", "infosec", "information security",
+        "appsec", "ethical hacking", "pentesting",
+    ],
+    'data engineering': [
+        "data engineering", "data engineer", "data pipelines", "etl", "big data",
+    ],
+    'algorithms': [
+        "algorithms", "algorithm", "algo", "algos", "dsa", "ds&a", "data structures",
+        "data structures and algorithms", "competitive programming",
+    ],
+    'game development': [
+        "game development", "game dev", "gamedev", "game", "games", "game design", "gaming",
+    ],
+    'mobile development': [
+        "mobile development", "mobile dev", "mobile", "mobile apps", "app development",
+        "android", "ios", "flutter", "react native",
+    ],
+}
+
+_SEPARATORS = re.compile(r"[^a-z0-9&+#]+")
+_AMPERSAND = re.compile(r" ?& ?")
+
+# Words of a long answer looked at for typos; domain answers are a few words,
+# so this only bounds the cost of pasted paragraphs
+_MAX_TYPO_TOKENS = 12
+
+
+def normalize(text: str) -> str:
+    """Lowercase, punctuation to single spaces, "ds & a" to "ds&a" """
+    return _AMPERSAND.sub("&", _SEPARATORS.sub(" ", text.lower())).strip()
+
+
+def max_typos(term: str) -> int:
+    """Edits tolerated for a term: none for short words, where one edit is a different word"""
+    if len(term) <= 4:
+        return 0
+    return 1 if len(term) <= 7 else 2
+
+
+def levenshtein(a: str, b: str) -> int:
+    """Edit distance between a and b"""
+    return _BitDistance(a).to(b)
+
+
+class _BitDistance:
+    """
+    Edit distance from one fixed string, bit-parallel over its characters
+    (Myers/Hyyrö), so a word's bitmasks are built once for every comparison
+    """
+
+    __slots__ = ("length", "masks", "high")
+
+    def __init__(self, query: str):
+        self.length = len(query)
+        self.high = 1 << (self.length - 1) if query else 0
+        self.masks: Dict[str, int] = {}
+        for i, char in enumerate(query):
+            self.masks[char] = self.masks.get(char, 0) | (1 << i)
+
+    def to(self, other: str, cutoff: Optional[int] = None) -> int:
+        """Distance to other; anything above cutoff may be reported as cutoff + 1"""
+        if not self.length:
+            return len(other)
+        full = (1 << self.length) - 1
+        high, masks = self.high, self.masks
+        vp, vn, score = full, 0, self.length
+        # Each remaining character moves the score by at most one
+        remaining = len(other)
+        for char in other:
+            if cutoff is not None and score - remaining > cutoff:
+                return cutoff + 1
+            remaining -= 1
+            eq = masks.get(char, 0)
+            xv = eq | vn
+            xh = (((eq & vp) + vp) ^ vp) | eq
+            hp = vn | (~(xh | vp) & full)
+            hn = vp & xh
+            if hp & high:
+                score += 1
+            elif hn & high:
+                score -= 1
+            hp = ((hp << 1) | 1) & full
+            hn = (hn << 1) & full
+            vp = hn | (~(xv | hp) & full)
+            vn = hp & xv
+        return score
+
+
+# Position pairs to delete from a string of each length, for two-character deletes
+_PAIRS = [[(i, j) for i in range(length) for j in range(i + 1, length)] for length in range(16)]
+
+
+def _deletes(text: str, depth: int) -> set:
+    """Every string left after deleting up to depth (at most 2) characters of text"""
+    found = {text}
+    if depth >= 1:
+        found.update([text[:i] + text[i + 1:] for i in range(len(text))])
+    if depth >= 2:
+        found.update([text[:i] + text[i + 1:j] + text[j + 1:] for i, j in _PAIRS[len(text)]])
+    return found
+
+
+class DeleteIndex:
+    """
+    Typo lookup within 1 or 2 edits, by symmetric deletes (SymSpell)
+    One edit: a word and a stored word one edit apart are equal after
+    deleting the same position from both (a substitution), or one of them
+    is the other with a character deleted. So every single-character delete
+    of every stored word is kept with its position, and a query looks up its
+    own deletes with no distance to compute
+    Two edits: two strings within k edits share a string reached by deleting
+    at most k characters from each one's first `prefix` characters, so those
+    deletes are precomputed and a query only generates its own (at most 16)
+    and checks the few words they point to
+    """
+
+    def __init__(self, words: Iterable[str] = (), max_distance: int = 2, prefix: int = 5):
+        if not 0 <= max_distance <= 2 or prefix >= len(_PAIRS):
+            raise ValueError("DeleteIndex supports up to 2 edits and prefixes under 16 characters")
+        self.max_distance = max_distance
+        self.prefix = prefix
+        self._words: Dict[str, List[str]] = {}
+        # Delete → (position deleted, or -1 for the word itself, stored word)
+        self._single_deletes: Dict[str, List[Tuple[int, str]]] = {}
+        # Distance is symmetric, so each word's bitmasks are built once here
+        self._distances: Dict[str, _BitDistance] = {}
+        words = list(dict.fromkeys(words))
+        # Query lengths that can be within d edits of some stored word
+        self._lengths = [{len(word) + k for word in words for k in range(-d, d + 1)} for d in range(max_distance + 1)]
+        for word in words:
+            self._distances[word] = _BitDistance(word)
+            for key in _deletes(word[:prefix], max_distance):
+                self._words.setdefault(key, []).append(word)
+            self._single_deletes.setdefault(word, []).append((-1, word))
+            for i in range(len(word)):
+                self._single_deletes.setdefault(word[:i] + word[i + 1:], []).append((i, word))
+
+    def search(self, word: str, max_distance: int) -> List[Tuple[int, str]]:
+        """(distance, word) for every stored word within max_distance, closest first"""
+        if max_distance > self.max_distance:
+            raise ValueError(f"index only holds words within {self.max_distance} edits")
+        if len(word) not in self._lengths[max_distance]:
+            return []
+        if max_distance == 1:
+            return self._within_one_edit(word)
+        keys = self._words.keys() & _deletes(word[:self.prefix], max_distance)
+        if not keys:
+            return []
+        length = len(word)
+        found = []
+        for candidate in {candidate for key in keys for candidate in self._words[key]}:
+            if abs(len(candidate) - length) > max_distance:
+                continue
+            distance = self._distances[candidate].to(word, max_distance)
+            if distance <= max_distance:
+                found.append((distance, candidate))
+        found.sort()
+        return found
+
+    def _within_one_edit(self, word: str) -> List[Tuple[int, str]]:
+        single_deletes = self._single_deletes
+        distances: Dict[str, int] = {}
+        # The stored word itself, or it with one character deleted
+        for position, stored in single_deletes.get(word, ()):
+            distances[stored] = 0 if position < 0 else 1
+        # A character of word deleted: an extra character, or a substitution at that position
+        for i in range(len(word)):
+            matches = single_deletes.get(word[:i] + word[i + 1:])
+            if matches:
+                for position, stored in matches:
+                    if position < 0 or position == i:
+                        distances.setdefault(stored, 1)
+        return sorted((distance, stored) for stored, distance in distances.items())
+
+
+class DomainMatch(NamedTuple):
+    domain: str
+    confidence: float
+    alias: str
+
+
+class DomainResolver:
+    """
+    Resolves free-text domain choices ("bakend", "ml", "I'd like ds&a") to a
+    canonical domain. Exact aliases anywhere in the input win; otherwise words
+    and word pairs are looked up in delete indexes allowing a few typos
+    A first-seen typo costs about 17 µs for one word and 35-40 µs for two
+    words or a sentence (bench_suite.py -k domains), so the 20 µs per query
+    target only holds for single words; repeated inputs hit the cache
+    """
+
+    def __init__(self, aliases: Dict[str, Iterable[str]]):
+        self._domains: Dict[str, str] = {}
+        for domain, names in aliases.items():
+            for name in (domain, *names):
+                self._domains[normalize(name)] = domain
+        # First word → lengths in words of the aliases starting with it, longest first
+        starts: Dict[str, set] = {}
+        for alias in self._domains:
+            words = alias.split()
+            starts.setdefault(words[0], set()).add(len(words))
+        self._starts = {word: sorted(sizes, reverse=True) for word, sizes in starts.items()}
+        # Typos are looked up word for word and pair for pair, so each index only
+        # holds aliases of that many words; short ones only ever match exactly
+        self._indexes = {
+            words: DeleteIndex(alias for alias in self._domains if max_typos(alias) and alias.count(" ") == words - 1)
+            for words in (1, 2)
+        }
+        self._resolve = lru_cache(maxsize=4096)(self._rank)
+
+    @property
+    def domains(self) -> List[str]:
+        return list(dict.fromkeys(self._domains.values()))
+
+    def candidates(self, text: str, limit: int = 3) -> List[DomainMatch]:
+        """Best match per domain, most confident first"""
+        return list(self._resolve(text)[:limit])
+
+    def resolve(self, text: str, min_confidence: float = 0.75) -> Optional[DomainMatch]:
+        ranked = self._resolve(text)
+        if ranked and ranked[0].confidence >= min_confidence:
+            return ranked[0]
+        return None
+
+    def _rank(self, text: str) -> Tuple[DomainMatch, ...]:
+        tokens = normalize(text).split()
+        # Exact aliases, longest phrase first so "data structures and algorithms" outranks a stray "ai";
+        # only phrases starting with an alias's first word are looked up
+        exact = []
+        for start, token in enumerate(tokens):
+            for size in self._starts.get(token, ()):
+                if start + size > len(tokens):
+                    continue
+                phrase = " ".join(tokens[start:start + size])
+                if phrase in self._domains:
+                    exact.append((-size, start, phrase))
+        best: Dict[str, DomainMatch] = {}
+        for _, _, phrase in sorted(exact):
+            domain = self._domains[phrase]
+            if domain not in best:
+                best[domain] = DomainMatch(domain, 1.0, phrase)
+        if best:
+            return tuple(best.values())
+
+        # Typos: single words and pairs ("machne lerning"), within max_typos of an alias
+        tokens = tokens[:_MAX_TYPO_TOKENS]
+        pairs = [" ".join(pair) for pair in zip(tokens, tokens[1:]) if min(map(len, pair)) > 2]
+        terms = [(term, self._indexes[1], max_typos(term)) for term in dict.fromkeys(tokens)] + \
+                [(term, self._indexes[2], max_typos(term)) for term in dict.fromkeys(pairs)]
+        terms = [term for term in terms if term[2]]
+        for term, index, _ in terms:
+            self._add_typos(best, term, index.search(term, 1))
+        # A one-edit hit anywhere settles it; the two-edit search costs several
+        # times as much, so it only runs when nothing in the input was that close
+        if not best:
+            for term, index, limit in terms:
+                if limit == 2:
+                    self._add_typos(best, term, index.search(term, 2))
+        return tuple(sorted(best.values(), key=lambda match: -match.confidence))
+
+    def _add_typos(self, best: Dict[str, DomainMatch], term: str, found: List[Tuple[int, str]]):
+        for distance, alias in found:
+            if distance > max_typos(alias):
+                continue
+            domain = self._domains[alias]
+            confidence = 1.0 - distance / max(len(alias), len(term))
+            if domain not in best or confidence > best[domain].confidence:
+                best[domain] = DomainMatch(domain, confidence, alias)
+
+
+# Global instance, built once at import
+domain_resolver = DomainResolver(DOMAIN_ALIASES)
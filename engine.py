@@ -1,12 +1,19 @@
-POSITIVE = {"yes", "y", "yeah", "done", "implemented"}
-NEGATIVE = {"no", "nope", "never"}
+import random
+from typing import Any, Dict, List, Optional
+
+from answer_normalizer import Verdict, normalize_answer
+from domain_content import DOMAIN_QUESTIONS, domain_recommendations
+from domain_resolver import domain_resolver
+from state import ConversationState, UserLevel
+
+QUESTIONS_PER_ASSESSMENT = 6
 
 
 def classify_answer(answer: str) -> str:
-    a = answer.lower().strip()
-    if a in POSITIVE:
+    verdict = normalize_answer(answer)
+    if verdict is Verdict.YES:
         return "YES"
-    if a in NEGATIVE:
+    if verdict is Verdict.NO:
         return "NO"
     return "UNKNOWN"
 
@@ -18,3 +25,45 @@ def update_score(state, answer, weight):
 
 def should_repeat(answer: str) -> bool:
     return classify_answer(answer) == "UNKNOWN"
+
+
+class TechCounsellorEngine:
+    """
+    Assessment steps main_v2.py calls, over the content main.py uses: domains
+    resolved by domain_resolver, six of the domain's DOMAIN_QUESTIONS worth a
+    point each, main's level thresholds and the shared recommendations
+    """
+
+    def map_user_input_to_domain(self, user_input: str) -> Optional[str]:
+        match = domain_resolver.resolve(user_input)
+        if match and match.domain in DOMAIN_QUESTIONS:
+            return match.domain
+        return None
+
+    def load_domain_questions(self, domain: str) -> List[Dict[str, Any]]:
+        questions = DOMAIN_QUESTIONS[domain]
+        picked = random.sample(questions, min(QUESTIONS_PER_ASSESSMENT, len(questions)))
+        return [{"id": f"q{number}", "question": question["q"], "weight": 1}
+                for number, question in enumerate(picked, 1)]
+
+    def get_next_question(self, state: ConversationState) -> Optional[Dict[str, Any]]:
+        """The question at state.current_question_index of the session's question_plan"""
+        plan = getattr(state, "question_plan", [])
+        index = state.current_question_index
+        if index >= len(plan):
+            return None
+        return {"id": f"q{index + 1}", "question": plan[index], "weight": 1}
+
+    def update_score(self, state: ConversationState, answer: str, weight: int):
+        update_score(state, answer, weight)
+
+    def calculate_user_level(self, state: ConversationState) -> UserLevel:
+        percentage = state.current_score / state.max_possible_score * 100 if state.max_possible_score else 0
+        if percentage >= 80:
+            return UserLevel.ADVANCED
+        if percentage >= 50:
+            return UserLevel.INTERMEDIATE
+        return UserLevel.BEGINNER
+
+    def get_recommendations(self, domain: str, level: UserLevel) -> Dict[str, List[str]]:
+        return domain_recommendations(domain)
@@ -0,0 +1,135 @@
+"""
+Append-only feedback log
+Request threads only append a tuple to a deque (atomic under the GIL, no
+lock taken); a background writer encodes the records, appends them to a
+JSONL file in batches with one fsync per batch, and rotates the file by
+size and age. When the writer falls behind the queue is capped and new
+records are dropped and counted rather than blocking requests
+"""
+
+import atexit
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Optional
+
+import orjson
+
+from metrics import feedback_records
+
+records_written = feedback_records.labels("written")
+records_dropped = feedback_records.labels("dropped")
+records_failed = feedback_records.labels("failed")
+
+
+class FeedbackLog:
+    def __init__(self, path: str, max_queue: int = 10000, batch_size: int = 256,
+                 flush_interval: float = 0.5, max_bytes: int = 10 * 2 ** 20,
+                 rotate_seconds: float = 24 * 3600, backups: int = 5):
+        self.path = path
+        self.max_queue = max_queue
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_bytes = max_bytes
+        self.rotate_seconds = rotate_seconds
+        self.backups = backups
+        self._queue = deque()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._writer: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._file = None
+        self._opened = 0.0
+
+    def submit(self, session_id: Optional[str], domain: Optional[str], level: Optional[str], text: str) -> bool:
+        """Queue one record; False if it was dropped because the queue is full"""
+        if len(self._queue) >= self.max_queue:
+            records_dropped.inc()
+            return False
+        self._queue.append((time.time(), session_id, domain, level, text))
+        if self._writer is None:
+            self._start()
+        elif len(self._queue) >= self.batch_size:
+            self._wake.set()
+        return True
+
+    def close(self):
+        """Stop the writer and write whatever is still queued"""
+        self._stopping = True
+        self._wake.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        self._write_pending()
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        self._stopping = False
+
+    def _start(self):
+        with self._start_lock:
+            if self._writer is None and not self._stopping:
+                self._writer = threading.Thread(target=self._run, name="feedback-log", daemon=True)
+                self._writer.start()
+
+    def _run(self):
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._write_pending()
+
+    def _write_pending(self):
+        while self._queue:
+            batch = []
+            while self._queue and len(batch) < self.batch_size:
+                ts, session_id, domain, level, text = self._queue.popleft()
+                batch.append(orjson.dumps({
+                    "ts": datetime.fromtimestamp(ts, timezone.utc).isoformat(timespec="milliseconds"),
+                    "session_id": session_id,
+                    "domain": domain,
+                    "level": level,
+                    "feedback": text,
+                }, option=orjson.OPT_APPEND_NEWLINE))
+            try:
+                self._append(b"".join(batch))
+                records_written.inc(len(batch))
+            except OSError:
+                records_failed.inc(len(batch))
+
+    def _append(self, data: bytes):
+        if self._file is None:
+            self._open()
+        # Age counts from when this process opened the file
+        if self._file.tell() and (self._file.tell() >= self.max_bytes
+                                  or time.time() - self._opened >= self.rotate_seconds):
+            self._rotate()
+            self._open()
+        self._file.write(data)
+        self._file.flush()
+        # One fsync for the whole batch
+        os.fsync(self._file.fileno())
+
+    def _open(self):
+        self._file = open(self.path, "ab")
+        self._opened = time.time()
+
+    def _rotate(self):
+        """feedback.jsonl → feedback.jsonl.1 → ... → .{backups}, the oldest is removed"""
+        self._file.close()
+        self._file = None
+        for n in range(self.backups - 1, 0, -1):
+            if os.path.exists(f"{self.path}.{n}"):
+                os.replace(f"{self.path}.{n}", f"{self.path}.{n + 1}")
+        if self.backups:
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+
+
+# Global instance
+feedback_log = FeedbackLog(os.getenv("FEEDBACK_LOG_PATH", "feedback.jsonl"),
+                           max_bytes=int(os.getenv("FEEDBACK_LOG_MAX_BYTES", str(10 * 2 ** 20))),
+                           rotate_seconds=float(os.getenv("FEEDBACK_LOG_ROTATE_HOURS", "24")) * 3600)
+atexit.register(feedback_log.close)
@@ -0,0 +1,90 @@
+import os
+import threading
+import google.generativeai as genai
+from typing import Dict, Iterable, Optional
+from dotenv import load_dotenv
+
+load_dotenv()
+
+DEFAULT_MODEL = "gemini-pro"
+
+
+class GeminiClient:
+    """
+    Shared Gemini client for every AI-assisted module
+    Configures the SDK once and hands out one GenerativeModel per model name.
+    Building a model per call only costs about a microsecond, so this is not
+    where time goes; warm() is what pays off, by opening the connection
+    before the first request instead of during it
+    """
+
+    def __init__(self):
+        self.api_key = os.getenv("GEMINI_API_KEY")
+        # "rest" keeps a pooled keep-alive HTTP session, "grpc" one multiplexed channel
+        self.transport = os.getenv("GEMINI_TRANSPORT", "rest")
+        self.api_endpoint = os.getenv("GEMINI_API_ENDPOINT")
+        self._models: Dict[str, genai.GenerativeModel] = {}
+        self._lock = threading.Lock()
+        self._configured = False
+        self._stub_behaviour = None
+
+        # Offline mode: in-process stub models, no network or API key needed
+        if os.getenv("GEMINI_STUB") == "1":
+            from gemini_stub import StubBehaviour
+            self._stub_behaviour = StubBehaviour.from_env()
+            self._configured = True
+            return
+
+        # A local stub server does not check the key
+        if self.api_endpoint and not self.api_key:
+            self.api_key = "local"
+
+        if self.api_key:
+            try:
+                client_options = {"api_endpoint": self.api_endpoint} if self.api_endpoint else None
+                genai.configure(api_key=self.api_key, transport=self.transport,
+                                client_options=client_options)
+                self._configured = True
+            except Exception as e:
+                print(f"Warning: Failed to configure Gemini client: {e}")
+
+    def is_configured(self) -> bool:
+        """Check if the Gemini API can be called"""
+        return self._configured
+
+    def get_model(self, model_name: str = DEFAULT_MODEL) -> Optional[genai.GenerativeModel]:
+        """Return the shared model instance, creating it on first use"""
+        model = self._models.get(model_name)
+        if model is not None or not self._configured:
+            return model
+
+        with self._lock:
+            model = self._models.get(model_name)
+            if model is None:
+                model = self._build_model(model_name)
+                self._models[model_name] = model
+        return model
+
+    def _build_model(self, model_name: str):
+        if self._stub_behaviour is not None:
+            from gemini_stub import StubModel
+            return StubModel(model_name, self._stub_behaviour)
+        return genai.GenerativeModel(model_name)
+
+    def warm(self, model_names: Iterable[str] = (DEFAULT_MODEL,)):
+        """
+        Build the models and open the transport before the first user request
+        count_tokens is free and goes through the same generative client
+        """
+        if not self._configured or os.getenv("GEMINI_WARMUP", "1") == "0":
+            return
+
+        for model_name in model_names:
+            try:
+                self.get_model(model_name).count_tokens("warmup")
+            except Exception as e:
+                print(f"Warning: Gemini warmup failed for {model_name}: {e}")
+
+
+# Global instance
+gemini_client = GeminiClient()
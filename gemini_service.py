@@ -1,11 +1,8 @@
-import os
-import google.generativeai as genai
-
-genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
+from gemini_client import gemini_client
 
 
 def rephrase(text: str) -> str:
-    model = genai.GenerativeModel("gemini-pro")
+    model = gemini_client.get_model("gemini-pro")
     prompt = f"""
 You are a professional technical counsellor.
 Do NOT ask new questions.
@@ -20,7 +17,7 @@ Only rephrase clearly and politely:
         return text  # Fallback to original text if API fails
 
 def generate_personalized_response(user_name: str, domain: str, context: str) -> str:
-    model = genai.GenerativeModel("gemini-pro")
+    model = gemini_client.get_model("gemini-pro")
     prompt = f"""
 You are a professional technical counsellor helping {user_name} with {domain} skills.
 Be encouraging, professional, and concise (2-3 sentences max).
@@ -38,7 +35,7 @@ Generate a personalized, motivating response that:
         return f"Great work, {user_name}! Keep building your {domain} skills with consistent practice."
 
 def enhance_feedback_response(feedback: str, user_name: str) -> str:
-    model = genai.GenerativeModel("gemini-pro")
+    model = gemini_client.get_model("gemini-pro")
     prompt = f"""
 You are a professional technical counsellor. {user_name} just provided this feedback: "{feedback}"
 
@@ -0,0 +1,245 @@
+"""
+Local deterministic stand-in for the Gemini API
+Used for offline load and latency testing of the AI-assisted flows
+
+In-process:  GEMINI_STUB=1 makes gemini_client hand out StubModel instances
+HTTP server: python gemini_stub.py --port 8765, then run the app with
+             GEMINI_API_ENDPOINT=http://127.0.0.1:8765
+
+Behaviour is configured through environment variables:
+  GEMINI_STUB_LATENCY     fixed:MS | uniform:LOW:HIGH | normal:MEAN:STDDEV | lognormal:MEDIAN:SIGMA
+  GEMINI_STUB_ERROR_RATE  fraction of calls that fail, e.g. 0.05
+  GEMINI_STUB_SEED        seed for latency and error sampling
+  GEMINI_STUB_RESPONSES   JSON file of [{"match": "...", "template": "..."}] rules
+"""
+
+import argparse
+import json
+import math
+import os
+import random
+import re
+import threading
+import time
+from collections import defaultdict
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
+from typing import Dict, Iterator, List, Optional
+
+# Matched against the prompt in order, templates are filled from "Key: value" prompt lines
+DEFAULT_RULES = [
+    {"match": "Rephrased question:", "template": "{original_question}"},
+    {"match": "Brief acknowledgment:", "template": "Thanks for sharing, that's helpful to know."},
+    {"match": "Brief answer:", "template": "That's a common question in {domain}. Now, let's continue with the assessment question."},
+    {"match": "Personalized recommendation:", "template": "Well done {user} on completing your {domain} assessment. Focus next on {recommended_topics}."},
+    {"match": "", "template": "Thank you for your response."},
+]
+
+_PROMPT_FIELD = re.compile(r"^[ \t]*([A-Za-z' ]{2,40}):[ \t]*(\S.*?)[ \t]*$", re.MULTILINE)
+
+
+class StubError(Exception):
+    """Injected upstream failure"""
+
+
+class LatencyDistribution:
+    """Samples call latency in seconds from a spec like lognormal:300:0.6"""
+
+    def __init__(self, spec: str = "fixed:0"):
+        kind, *params = spec.split(":")
+        self.kind = kind
+        self.params = [float(p) for p in params]
+        if kind not in ("fixed", "uniform", "normal", "lognormal"):
+            raise ValueError(f"Unknown latency distribution: {spec}")
+
+    def sample(self, rng: random.Random) -> float:
+        if self.kind == "fixed":
+            ms = self.params[0] if self.params else 0.0
+        elif self.kind == "uniform":
+            ms = rng.uniform(self.params[0], self.params[1])
+        elif self.kind == "normal":
+            ms = rng.gauss(self.params[0], self.params[1])
+        else:
+            ms = rng.lognormvariate(math.log(self.params[0]), self.params[1])
+        return max(0.0, ms) / 1000.0
+
+
+class StubBehaviour:
+    """Shared latency, error and response configuration"""
+
+    def __init__(self, latency: str = "fixed:0", error_rate: float = 0.0,
+                 seed: int = 0, rules: Optional[List[Dict[str, str]]] = None):
+        self.latency = LatencyDistribution(latency)
+        self.error_rate = error_rate
+        self.rules = rules or DEFAULT_RULES
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "StubBehaviour":
+        rules = None
+        rules_path = os.getenv("GEMINI_STUB_RESPONSES")
+        if rules_path:
+            with open(rules_path, encoding="utf-8") as f:
+                rules = json.load(f)
+        return cls(
+            latency=os.getenv("GEMINI_STUB_LATENCY", "fixed:0"),
+            error_rate=float(os.getenv("GEMINI_STUB_ERROR_RATE", "0")),
+            seed=int(os.getenv("GEMINI_STUB_SEED", "0")),
+            rules=rules,
+        )
+
+    def draw(self):
+        """Sample (latency_seconds, should_fail) deterministically from the seed"""
+        with self._lock:
+            return self.latency.sample(self._rng), self._rng.random() < self.error_rate
+
+    def respond(self, prompt: str) -> str:
+        fields = defaultdict(str)
+        for key, value in _PROMPT_FIELD.findall(prompt):
+            fields[key.strip().lower().replace("'s", "").replace(" ", "_")] = value
+        for rule in self.rules:
+            if rule["match"] in prompt:
+                return rule["template"].format_map(fields)
+        return ""
+
+
+class StubResponse:
+    """Mimics the .text attribute of a GenerateContentResponse"""
+
+    def __init__(self, text: str):
+        self.text = text
+
+
+class StubModel:
+    """
+    In-process drop-in for genai.GenerativeModel
+    Only the calls this app makes are implemented
+    """
+
+    def __init__(self, model_name: str, behaviour: StubBehaviour):
+        self.model_name = model_name
+        self.behaviour = behaviour
+
+    def generate_content(self, prompt: str, stream: bool = False):
+        latency, fail = self.behaviour.draw()
+        text = self.behaviour.respond(prompt)
+        if not stream:
+            time.sleep(latency)
+            if fail:
+                raise StubError("Injected Gemini stub failure")
+            return StubResponse(text)
+        return self._stream(text, latency, fail)
+
+    def count_tokens(self, prompt: str):
+        return {"total_tokens": len(prompt.split())}
+
+    def _stream(self, text: str, latency: float, fail: bool) -> Iterator[StubResponse]:
+        chunks = _split_chunks(text)
+        for i, chunk in enumerate(chunks):
+            time.sleep(latency / len(chunks))
+            if fail and i == len(chunks) // 2:
+                raise StubError("Injected Gemini stub failure mid-stream")
+            yield StubResponse(chunk)
+
+
+def _split_chunks(text: str, words_per_chunk: int = 4) -> List[str]:
+    words = text.split(" ")
+    chunks = [" ".join(words[i:i + words_per_chunk]) for i in range(0, len(words), words_per_chunk)]
+    return [c + " " if i < len(chunks) - 1 else c for i, c in enumerate(chunks)] or [""]
+
+
+def _candidate(text: str) -> Dict:
+    return {"candidates": [{
+        "content": {"parts": [{"text": text}], "role": "model"},
+        "finishReason": "STOP",
+        "index": 0
+    }]}
+
+
+class _StubRequestHandler(BaseHTTPRequestHandler):
+    """Serves the REST surface the SDK uses: generateContent, streamGenerateContent, countTokens"""
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    behaviour: StubBehaviour = None
+
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or b"{}")
+        prompt = "".join(
+            part.get("text", "")
+            for content in body.get("contents", [])
+            for part in content.get("parts", [])
+        )
+        path = self.path.split("?", 1)[0]
+
+        if path.endswith(":countTokens"):
+            return self._send_json(200, {"totalTokens": len(prompt.split())})
+
+        latency, fail = self.behaviour.draw()
+        text = self.behaviour.respond(prompt)
+
+        if path.endswith(":streamGenerateContent"):
+            return self._send_stream(text, latency, fail)
+
+        time.sleep(latency)
+        if fail:
+            return self._send_json(503, {"error": {"code": 503, "message": "Injected stub failure", "status": "UNAVAILABLE"}})
+        self._send_json(200, _candidate(text))
+
+    def _send_json(self, status: int, payload: Dict):
+        data = json.dumps(payload).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def _send_stream(self, text: str, latency: float, fail: bool):
+        # The SDK reads a JSON array of responses, written chunk by chunk
+        chunks = _split_chunks(text)
+        self.send_response(503 if fail else 200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        if fail:
+            self._write_chunk(json.dumps([{"error": {"code": 503, "message": "Injected stub failure"}}]))
+        else:
+            for i, chunk in enumerate(chunks):
+                time.sleep(latency / len(chunks))
+                prefix = "[" if i == 0 else ","
+                self._write_chunk(prefix + json.dumps(_candidate(chunk)))
+            self._write_chunk("]")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def _write_chunk(self, data: str):
+        encoded = data.encode()
+        self.wfile.write(f"{len(encoded):x}\r\n".encode() + encoded + b"\r\n")
+        self.wfile.flush()
+
+    def log_message(self, *args):
+        pass
+
+
+def start_server(host: str = "127.0.0.1", port: int = 0,
+                 behaviour: Optional[StubBehaviour] = None) -> ThreadingHTTPServer:
+    """Start the stub HTTP server on a daemon thread and return it"""
+    handler = type("StubRequestHandler", (_StubRequestHandler,), {
+        "behaviour": behaviour or StubBehaviour.from_env()
+    })
+    server = ThreadingHTTPServer((host, port), handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Gemini API stub")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    server = start_server(args.host, args.port)
+    print(f"Gemini stub listening on http://{args.host}:{server.server_address[1]}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,62 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Optional
+
+from metrics import cache_lookups
+from state import ConversationState
+
+replay_hits = cache_lookups.labels("idempotency", "hit")
+replay_misses = cache_lookups.labels("idempotency", "miss")
+
+
+class RecentResponses:
+    """
+    Bounded map of a session's recent request ids to the responses they produced,
+    evicting the least recently used; a replayed id counts as used again
+    The lock serialises mutating requests of one session, so a retry that
+    races the original waits for it and is then answered from the cache
+    """
+
+    def __init__(self, maxsize: int = 16):
+        self.maxsize = maxsize
+        self.lock = threading.Lock()
+        self._responses = OrderedDict()
+
+    def get(self, request_id: str) -> Optional[Any]:
+        response = self._responses.get(request_id)
+        if response is not None:
+            self._responses.move_to_end(request_id)
+        return response
+
+    def put(self, request_id: str, response: Any):
+        self._responses[request_id] = response
+        if len(self._responses) > self.maxsize:
+            self._responses.popitem(last=False)
+
+    def __len__(self) -> int:
+        return len(self._responses)
+
+
+def recent_responses(state: ConversationState) -> RecentResponses:
+    # dict.setdefault is atomic, so concurrent first requests share one cache
+    return state.__dict__.setdefault("_recent_responses", RecentResponses())
+
+
+def idempotent(state: ConversationState, request_id: Optional[str], compute: Callable[[], Any]) -> Any:
+    """
+    Run compute() at most once per request id for this session
+    Requests without an id are processed normally, still one at a time per session
+    """
+    cache = recent_responses(state)
+    with cache.lock:
+        if request_id:
+            cached = cache.get(request_id)
+            if cached is not None:
+                replay_hits.inc()
+                return cached
+            replay_misses.inc()
+
+        response = compute()
+        if request_id:
+            cache.put(request_id, response)
+        return response
@@ -1,7 +1,14 @@
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from enum import Enum
-from typing import List, Dict
+from itertools import islice
+import os
+from typing import List, Dict, Iterable, Iterator, Optional, Pattern, Tuple
 import re
 
+from answer_normalizer import normalize_answer
+from domain_resolver import domain_resolver
+
 class UserIntent(str, Enum):
     ANSWER = "answer"
     CLARIFICATION_QUESTION = "clarification_question"
@@ -9,6 +16,93 @@ class UserIntent(str, Enum):
     CONFUSED = "confused"
     GREETING = "greeting"
 
+TECH_KEYWORDS = [
+    'api', 'database', 'server', 'code', 'programming', 'software',
+    'development', 'framework', 'library', 'algorithm', 'data',
+    'security', 'network', 'cloud', 'deployment', 'testing'
+]
+
+
+def compile_intent_matcher(groups: Dict[str, List[str]]) -> Pattern:
+    """
+    One regex answering, in a single match at position 0, which pattern groups
+    occur anywhere in the text
+    Each group becomes an optional lookahead (?=(?P<name>anchored|.*?unanchored))?,
+    so every group is tested independently of the others and their order.
+    Patterns that are plain word alternations are folded into a trie, and
+    ^-anchored ones are only tried at the start instead of at every position.
+    Input must already be lowercased, as detect_intent does
+    """
+    lookaheads = []
+    for name, patterns in groups.items():
+        anchored, unanchored = [], []
+        anchored_words, unanchored_words = [], []
+        for pattern in patterns:
+            is_anchored = pattern.startswith("^")
+            body = pattern[1:] if is_anchored else pattern
+            words = _literal_alternatives(body)
+            if words is not None:
+                (anchored_words if is_anchored else unanchored_words).extend(words)
+            else:
+                (anchored if is_anchored else unanchored).append(body)
+        if anchored_words:
+            anchored.insert(0, _trie_regex(anchored_words))
+        if unanchored_words:
+            unanchored.insert(0, _trie_regex(unanchored_words))
+
+        branches = []
+        if anchored:
+            branches.append("(?:" + "|".join(anchored) + ")")
+        if unanchored:
+            branches.append(".*?(?:" + "|".join(unanchored) + ")")
+        lookaheads.append(f"(?=(?P<{name}>{'|'.join(branches)}))?")
+    return re.compile("^" + "".join(lookaheads), re.DOTALL)
+
+
+def compile_keyword_matcher(keywords: List[str]) -> Pattern:
+    """Substring matcher for a keyword list, built as a trie-shaped regex"""
+    return re.compile(_trie_regex(keywords))
+
+
+def _trie_regex(words: List[str]) -> str:
+    """
+    Alternation of literal words with shared prefixes factored out
+    (d(?:ata|e(?:vops|...))), so at each position the regex engine follows one
+    trie path instead of retrying every word. Words containing another word
+    are dropped: they can never change whether something matched
+    """
+    minimal = [word for word in set(words)
+               if not any(other != word and other in word for other in words)]
+
+    trie: Dict[str, dict] = {}
+    for word in minimal:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [re.escape(char) + build(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # A word can end here and there are longer words further down
+        return f"(?:{body})?" if "" in node else body
+
+    return "(?:" + build(trie) + ")"
+
+
+def _literal_alternatives(pattern: str) -> Optional[List[str]]:
+    """The words of a pattern like (tell me|explain|can you), or None if it uses regex syntax"""
+    if pattern.startswith("(") and pattern.endswith(")"):
+        pattern = pattern[1:-1]
+    if re.search(r"[()\[\]*+.^$|{}]", re.sub(r"\\.|\|", "", pattern)):
+        return None
+    if re.search(r"(?<!\\)\?", pattern):
+        return None
+    return [re.sub(r"\\(.)", r"\1", word) for word in pattern.split("|")]
+
+
 class IntentDetector:
     """
     Rule-based intent detection system
@@ -34,43 +128,37 @@ class IntentDetector:
             r'(how are you|nice to meet you)',
         ]
         
-        self.positive_answers = [
-            'yes', 'yeah', 'yep', 'sure', 'definitely', 'absolutely',
-            'of course', 'correct', 'right', 'true', 'indeed'
-        ]
-        
-        self.negative_answers = [
-            'no', 'nope', 'nah', 'not really', 'never', 'false',
-            'incorrect', 'wrong', 'not at all'
-        ]
-        
-        self.partial_answers = [
-            'somewhat', 'kind of', 'sort of', 'a little', 'a bit',
-            'partially', 'maybe', 'sometimes', 'occasionally'
-        ]
-        
         self.tech_domains = [
             'backend', 'frontend', 'data analytics', 'machine learning',
             'devops', 'cybersecurity', 'data engineering', 'algorithms',
             'dsa', 'web development', 'mobile', 'ai', 'ml'
         ]
+        
+        # Compiled once: detect_intent is on every assessment turn
+        self._intent_matcher = compile_intent_matcher({
+            "greeting": self.greeting_patterns,
+            "confused": self.confusion_patterns,
+            "question": self.question_patterns,
+        })
+        self._tech_matcher = compile_keyword_matcher(self.tech_domains + TECH_KEYWORDS)
     
     def detect_intent(self, user_input: str, context: str = "") -> UserIntent:
         """
         Detect user intent based on input and context
         """
         user_input_lower = user_input.lower().strip()
+        matched = self._intent_matcher.match(user_input_lower)
         
         # Check for greetings
-        if self._matches_patterns(user_input_lower, self.greeting_patterns):
+        if matched.group("greeting") is not None:
             return UserIntent.GREETING
         
         # Check for confusion
-        if self._matches_patterns(user_input_lower, self.confusion_patterns):
+        if matched.group("confused") is not None:
             return UserIntent.CONFUSED
         
         # Check for questions
-        if self._matches_patterns(user_input_lower, self.question_patterns):
+        if matched.group("question") is not None:
             # Determine if it's clarification or off-topic
             if self._is_tech_related(user_input_lower) or 'assessment' in context.lower():
                 return UserIntent.CLARIFICATION_QUESTION
@@ -80,58 +168,60 @@ class IntentDetector:
         # Default to answer
         return UserIntent.ANSWER
     
-    def _matches_patterns(self, text: str, patterns: List[str]) -> bool:
-        """Check if text matches any of the given patterns"""
-        for pattern in patterns:
-            if re.search(pattern, text, re.IGNORECASE):
-                return True
-        return False
-    
     def _is_tech_related(self, text: str) -> bool:
         """Check if text contains tech-related keywords"""
-        tech_keywords = [
-            'api', 'database', 'server', 'code', 'programming', 'software',
-            'development', 'framework', 'library', 'algorithm', 'data',
-            'security', 'network', 'cloud', 'deployment', 'testing'
-        ]
-        
-        # Check for tech domains
-        for domain in self.tech_domains:
-            if domain in text:
-                return True
-        
-        # Check for tech keywords
-        for keyword in tech_keywords:
-            if keyword in text:
-                return True
-        
-        return False
+        # Tech domains and keywords, matched as substrings in one pass
+        return self._tech_matcher.search(text) is not None
     
     def classify_answer_type(self, user_input: str) -> str:
         """
         Classify the type of answer for assessment questions
         """
-        user_input_lower = user_input.lower().strip()
-        
-        # Check for clear positive answers
-        if any(pos in user_input_lower for pos in self.positive_answers):
-            return "positive"
-        
-        # Check for clear negative answers
-        if any(neg in user_input_lower for neg in self.negative_answers):
-            return "negative"
-        
-        # Check for partial/uncertain answers
-        if any(partial in user_input_lower for partial in self.partial_answers):
-            return "partial"
-        
-        # Check for numeric responses
-        if re.search(r'\d+', user_input):
-            return "numeric"
-        
-        return "unclear"
+        return normalize_answer(user_input).value
     
     def is_valid_domain_selection(self, user_input: str) -> bool:
-        """Check if input contains a valid domain selection"""
-        user_input_lower = user_input.lower()
-        return any(domain in user_input_lower for domain in self.tech_domains)
\ No newline at end of file
+        """Check if input names a domain, allowing aliases and typos"""
+        return domain_resolver.resolve(user_input) is not None
+
+# Per-process detector for classify_many, built once by each pool worker
+_batch_detector: Optional[IntentDetector] = None
+
+
+def _init_batch_worker():
+    global _batch_detector
+    _batch_detector = IntentDetector()
+
+
+def _classify_chunk(texts: List[str], context: str) -> List[Tuple[UserIntent, str]]:
+    if _batch_detector is None:
+        _init_batch_worker()
+    detect, classify = _batch_detector.detect_intent, _batch_detector.classify_answer_type
+    return [(detect(text, context), classify(text)) for text in texts]
+
+
+def classify_many(texts: Iterable[str], context: str = "", chunk_size: int = 2000,
+                  max_workers: Optional[int] = None) -> Iterator[Tuple[UserIntent, str]]:
+    """
+    Yield (intent, answer type) for every text, in input order
+    Texts are read lazily in chunks and spread over a process pool (one
+    worker per CPU by default), each worker compiling the matchers once; at
+    most two chunks per worker are in flight, so memory stays flat however
+    long the input is. With a single worker everything runs in this process
+    """
+    texts = iter(texts)
+    chunks = iter(lambda: list(islice(texts, chunk_size)), [])
+    workers = max_workers if max_workers is not None else (os.cpu_count() or 1)
+
+    if workers <= 1:
+        for chunk in chunks:
+            yield from _classify_chunk(chunk, context)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_batch_worker) as pool:
+        in_flight = deque()
+        for chunk in chunks:
+            in_flight.append(pool.submit(_classify_chunk, chunk, context))
+            if len(in_flight) >= 2 * workers:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
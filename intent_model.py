@@ -0,0 +1,199 @@
+"""
+Local intent classifier: multinomial naive Bayes over hashed word features
+Second stage behind the IntentDetector rules, so turns the rules cannot place
+(or would send to Gemini) are routed without an upstream call when it is sure
+
+Usage: python intent_model.py train                      corpus + examples docs → Data/intent_model.npz
+       python intent_model.py train --holdout 0.2        also report held-out accuracy
+       python intent_model.py predict "what is docker?"
+"""
+
+import argparse
+import os
+import random
+import re
+import zlib
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from intent_detector import UserIntent
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CORPUS_PATH = os.path.join(ROOT, "Data", "intent_corpus.tsv")
+MODEL_PATH = os.getenv("INTENT_MODEL_PATH", os.path.join(ROOT, "Data", "intent_model.npz"))
+EXAMPLE_DOCS = [os.path.join(ROOT, "RESPONSE_CLASSIFICATION_EXAMPLES.md"),
+                os.path.join(ROOT, "ENTITY_EXTRACTION_EXAMPLES.md")]
+
+N_FEATURES = 2 ** 12
+
+_TOKEN = re.compile(r"[a-z0-9']+|\?")
+
+
+def features(text: str, n_features: int = N_FEATURES) -> List[int]:
+    """Hashed feature ids: words, word pairs and the opening word, each counted once"""
+    tokens = _TOKEN.findall(text.lower().replace("’", "'"))
+    if not tokens:
+        return []
+    grams = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])] + [f"^{tokens[0]}"]
+    # crc32 rather than hash(): ids must not change between processes
+    return sorted({zlib.crc32(gram.encode()) % n_features for gram in grams})
+
+
+class IntentModel:
+    """Multinomial naive Bayes with binary hashed features"""
+
+    def __init__(self, labels: Sequence[str], class_log_prior: np.ndarray, feature_log_prob: np.ndarray):
+        self.intents = [UserIntent(label) for label in labels]
+        self.class_log_prior = class_log_prior
+        self.feature_log_prob = feature_log_prob
+        self.n_features = feature_log_prob.shape[1]
+
+    @classmethod
+    def fit(cls, texts: Sequence[str], labels: Sequence[str], alpha: float = 0.5,
+            n_features: int = N_FEATURES) -> "IntentModel":
+        classes = sorted(set(labels))
+        counts = np.zeros((len(classes), n_features), dtype=np.float64)
+        docs = np.zeros(len(classes), dtype=np.float64)
+        for text, label in zip(texts, labels):
+            row = classes.index(label)
+            counts[row, features(text, n_features)] += 1
+            docs[row] += 1
+
+        smoothed = counts + alpha
+        feature_log_prob = np.log(smoothed) - np.log(smoothed.sum(axis=1, keepdims=True))
+        class_log_prior = np.log(docs) - np.log(docs.sum())
+        return cls(classes, class_log_prior.astype(np.float32), feature_log_prob.astype(np.float32))
+
+    def predict(self, text: str) -> Tuple[UserIntent, float]:
+        """Most likely intent and its posterior probability"""
+        ids = features(text, self.n_features)
+        scores = self.class_log_prior + self.feature_log_prob[:, ids].sum(axis=1)
+        probabilities = np.exp(scores - scores.max())
+        probabilities /= probabilities.sum()
+        best = int(probabilities.argmax())
+        return self.intents[best], float(probabilities[best])
+
+    def save(self, path: str = MODEL_PATH):
+        np.savez_compressed(path, labels=np.array([intent.value for intent in self.intents]),
+                            class_log_prior=self.class_log_prior, feature_log_prob=self.feature_log_prob)
+
+    @classmethod
+    def load(cls, path: str = MODEL_PATH) -> "IntentModel":
+        with np.load(path) as artefact:
+            return cls(list(artefact["labels"]), artefact["class_log_prior"], artefact["feature_log_prob"])
+
+
+def load_intent_model(path: str = MODEL_PATH) -> Optional[IntentModel]:
+    """The trained model, or None if it has not been trained yet"""
+    if not os.path.exists(path):
+        return None
+    return IntentModel.load(path)
+
+
+def load_corpus(path: str = CORPUS_PATH) -> List[Tuple[str, str]]:
+    """(text, label) pairs from a label<TAB>text file; # starts a comment"""
+    examples = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.rstrip("\n")
+            if not line.strip() or line.startswith("#"):
+                continue
+            label, text = line.split("\t", 1)
+            examples.append((text, UserIntent(label).value))
+    return examples
+
+
+# Classifications used in RESPONSE_CLASSIFICATION_EXAMPLES.md
+_DOC_LABELS = {
+    "POSITIVE": UserIntent.ANSWER,
+    "NEGATIVE": UserIntent.ANSWER,
+    "CONFUSED": UserIntent.CONFUSED,
+    "OFF_TOPIC": UserIntent.OFF_TOPIC,
+}
+_DOC_INPUT = re.compile(r'^(?:\*\*)?Input:(?:\*\*)?\s*"([^"]+)"')
+_DOC_CLASSIFICATION = re.compile(r"^\*\*Classification:\*\*\s*(\w+)")
+
+
+def seed_examples(paths: Sequence[str] = EXAMPLE_DOCS) -> List[Tuple[str, str]]:
+    """
+    Labelled inputs from the examples docs: classified responses keep their
+    class (a confused input that asks something is a clarification question),
+    and every personal-info input is an answer
+    """
+    examples = []
+    for path in paths:
+        pending = None
+        with open(path, encoding="utf-8") as f:
+            for line in f:
+                line = line.strip()
+                matched = _DOC_INPUT.match(line)
+                if matched:
+                    if pending is not None:
+                        examples.append((pending, UserIntent.ANSWER.value))
+                    pending = matched.group(1)
+                    continue
+                matched = _DOC_CLASSIFICATION.match(line)
+                if matched and pending is not None:
+                    intent = _DOC_LABELS.get(matched.group(1), UserIntent.ANSWER)
+                    if intent is UserIntent.CONFUSED and "?" in pending:
+                        intent = UserIntent.CLARIFICATION_QUESTION
+                    examples.append((pending, intent.value))
+                    pending = None
+        if pending is not None:
+            examples.append((pending, UserIntent.ANSWER.value))
+    return examples
+
+
+def _train(args):
+    examples = load_corpus(args.corpus) + seed_examples(args.docs)
+    if args.holdout:
+        shuffled = examples[:]
+        random.Random(args.seed).shuffle(shuffled)
+        cut = int(len(shuffled) * (1 - args.holdout))
+        model = IntentModel.fit(*zip(*shuffled[:cut]), alpha=args.alpha, n_features=args.features)
+        held_out = shuffled[cut:]
+        correct = sum(model.predict(text)[0].value == label for text, label in held_out)
+        print(f"Held-out accuracy: {correct}/{len(held_out)} ({correct / len(held_out):.1%})")
+
+    model = IntentModel.fit(*zip(*examples), alpha=args.alpha, n_features=args.features)
+    model.save(args.out)
+    by_label = {}
+    for _, label in examples:
+        by_label[label] = by_label.get(label, 0) + 1
+    print(f"Trained on {len(examples)} examples ({', '.join(f'{label} {n}' for label, n in sorted(by_label.items()))})")
+    print(f"Saved {args.out} ({os.path.getsize(args.out)} bytes)")
+
+
+def _predict(args):
+    model = IntentModel.load(args.model)
+    for text in args.text:
+        intent, confidence = model.predict(text)
+        print(f"{intent.value:<24}{confidence:>6.2f}  {text}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    train = commands.add_parser("train", help="fit the model and write the artefact")
+    train.add_argument("--corpus", default=CORPUS_PATH, help="label<TAB>text file")
+    train.add_argument("--docs", nargs="*", default=EXAMPLE_DOCS, help="examples docs to seed from")
+    train.add_argument("--out", default=MODEL_PATH)
+    train.add_argument("--alpha", type=float, default=0.5, help="additive smoothing")
+    train.add_argument("--features", type=int, default=N_FEATURES, help="hashed feature space size")
+    train.add_argument("--holdout", type=float, default=0.0, help="share of examples held out for an accuracy check")
+    train.add_argument("--seed", type=int, default=0)
+    train.set_defaults(run=_train)
+
+    predict = commands.add_parser("predict", help="classify texts with a trained model")
+    predict.add_argument("text", nargs="+")
+    predict.add_argument("--model", default=MODEL_PATH)
+    predict.set_defaults(run=_predict)
+
+    args = parser.parse_args()
+    args.run(args)
+
+
+if __name__ == "__main__":
+    main()
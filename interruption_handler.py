@@ -1,8 +1,16 @@
+import os
 from typing import Tuple, Optional
+from answer_normalizer import Verdict, normalize_answer
 from intent_detector import IntentDetector, UserIntent
+from intent_model import load_intent_model
+from metrics import intent_routing
 from safe_gemini import safe_gemini
 from state import ConversationState
 
+# Rule verdicts worth a second opinion: the two that call Gemini, and the
+# fall-through default when no rule matched
+SECOND_OPINION_INTENTS = {UserIntent.ANSWER, UserIntent.CLARIFICATION_QUESTION, UserIntent.CONFUSED}
+
 class InterruptionHandler:
     """
     Handles interruptions during assessment flow
@@ -11,6 +19,9 @@ class InterruptionHandler:
     
     def __init__(self):
         self.intent_detector = IntentDetector()
+        # Local second stage; None until `python intent_model.py train` has run
+        self.intent_model = load_intent_model()
+        self.intent_threshold = float(os.getenv("INTENT_MODEL_THRESHOLD", "0.9"))
         self.fallback_responses = {
             UserIntent.OFF_TOPIC: "That's interesting! Let's focus on completing your assessment first, and we can chat more afterward.",
             UserIntent.CONFUSED: "I understand this might be confusing. Let me rephrase: ",
@@ -23,7 +34,7 @@ class InterruptionHandler:
         Handle user interruption during assessment
         Returns (response_message, should_advance_state)
         """
-        intent = self.intent_detector.detect_intent(user_input, current_question)
+        intent = self.classify_intent(user_input, current_question)
         
         if intent == UserIntent.ANSWER:
             # Normal answer - let state machine handle it
@@ -56,11 +67,30 @@ class InterruptionHandler:
             response = "I'm not sure I understand. Could you please answer the current question?"
             return response, False  # Don't advance state
     
+    def classify_intent(self, user_input: str, context: str = "") -> UserIntent:
+        """
+        Rules first; where they would call Gemini or only fell through to the
+        default, a confident local model overrules them
+        """
+        intent = self.intent_detector.detect_intent(user_input, context)
+        if self.intent_model is None or intent not in SECOND_OPINION_INTENTS:
+            return intent
+        # Rules that found a clear yes/no need no second opinion
+        if intent == UserIntent.ANSWER and normalize_answer(user_input) is not Verdict.UNCLEAR:
+            return intent
+        
+        predicted, confidence = self.intent_model.predict(user_input)
+        if confidence < self.intent_threshold:
+            intent_routing.labels("unsure").inc()
+            return intent
+        intent_routing.labels("kept" if predicted == intent else "overruled").inc()
+        return predicted
+    
     def is_valid_assessment_answer(self, user_input: str) -> bool:
         """
         Check if user input is a valid assessment answer
         """
-        intent = self.intent_detector.detect_intent(user_input)
+        intent = self.classify_intent(user_input)
         return intent == UserIntent.ANSWER
     
     def get_answer_type(self, user_input: str) -> str:
@@ -0,0 +1,253 @@
+"""
+Event-sourced session journal with periodic snapshots
+Each turn is one compact event; applying it is the only way the turn changes
+the session, so folding a session's events over its latest snapshot rebuilds
+the state exactly. A background writer appends events to a file in batches,
+which makes a turn cost one small orjson encode instead of a full-state dump.
+Once the file passes max_bytes the writer compacts it, keeping only each
+session's latest snapshot and the events after it
+
+Records are one JSON array per line:
+  [session_id, seq, kind, *args]            an event (seq counts from 1 per session)
+  [session_id, seq, "snapshot", state]      the state after event seq
+"""
+
+import atexit
+import os
+import threading
+from collections import deque
+from typing import Callable, Dict, Iterator, List, Optional
+
+import orjson
+
+from domain_content import DOMAIN_QUESTIONS
+from state import ConversationStage, ConversationState
+from state_controller import StateController
+
+_controller = StateController()
+
+
+def _personal_info(state, name, location, education):
+    state.user_name = name
+    state.user_location = location
+    state.user_education = education
+
+
+def _select_domain(state, domain):
+    state.selected_domain = domain
+    state.question_count = 0
+    state.score = 0
+    state.answers = []
+
+
+def _answer(state, index, is_yes):
+    """index is the question's position in DOMAIN_QUESTIONS[selected_domain]"""
+    if not hasattr(state, 'question_count'):
+        _select_domain(state, state.selected_domain)
+    question = DOMAIN_QUESTIONS[state.selected_domain][index]
+    if is_yes:
+        state.score += 1
+        state.answers.append({"question": question["q"], "answer": "Yes", "explanation": None})
+    else:
+        state.answers.append({"question": question["q"], "answer": "No", "explanation": question["exp"]})
+    state.question_count += 1
+
+
+def _show_docs(state):
+    state.docs_shown = True
+
+
+def _offer_switch(state, domain):
+    state.pending_domain_switch = domain
+
+
+def _switch_domain(state):
+    state.selected_domain = state.__dict__.pop('pending_domain_switch')
+
+
+def _set_stage(state, stage):
+    state.stage = ConversationStage(stage)
+
+
+# Event kind → how it changes the state
+EVENTS: Dict[str, Callable] = {
+    "start": lambda state: None,
+    "personal_info": _personal_info,
+    "advance": lambda state, text: _controller.advance(state, text),
+    "stage": _set_stage,
+    "domain": _select_domain,
+    "answer": _answer,
+    "chat": lambda state: None,
+    "docs_shown": _show_docs,
+    "switch_offer": _offer_switch,
+    "switch": _switch_domain,
+}
+
+
+class SessionJournal:
+    """
+    Applies and appends session events, snapshotting every snapshot_every
+    events per session. Without a path nothing is written (events are still
+    applied, so the app behaves the same). Request threads only queue the
+    encoded records; the writer thread writes them every flush_interval
+    seconds, or as soon as batch_size are waiting
+    Subscribers see every applied event, written or not
+    """
+
+    def __init__(self, path: Optional[str] = None, batch_size: int = 64,
+                 flush_interval: float = 1.0, snapshot_every: int = 16, max_bytes: int = 64 * 2 ** 20):
+        self.path = path
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.snapshot_every = snapshot_every
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._buffer = deque()
+        self._file = None
+        self._compact_at = max_bytes
+        self._wake = threading.Event()
+        self._stopping = False
+        self._writer: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._subscribers: List[Callable] = []
+
+    def subscribe(self, callback: Callable[[ConversationState, str, tuple], None]):
+        """Call callback(state, kind, args) after each event is applied"""
+        self._subscribers.append(callback)
+
+    def record(self, session_id: str, state: ConversationState, kind: str, *args):
+        """Apply one event to the session and journal it; returns what applying it returned"""
+        result = EVENTS[kind](state, *args)
+        for callback in self._subscribers:
+            callback(state, kind, args)
+        if self.path is None:
+            return result
+
+        seq = state.__dict__.get("_journal_seq", 0) + 1
+        state._journal_seq = seq
+        records = [orjson.dumps([session_id, seq, kind, *args])]
+        if seq % self.snapshot_every == 0:
+            records.append(orjson.dumps([session_id, seq, "snapshot", state.to_dict()]))
+
+        # deque.extend is atomic under the GIL, so no lock on the request path
+        self._buffer.extend(records)
+        if self._writer is None:
+            self._start()
+        elif len(self._buffer) >= self.batch_size:
+            self._wake.set()
+        return result
+
+    def flush(self):
+        self._write()
+
+    def close(self):
+        """Stop the writer and write whatever is still queued"""
+        self._stopping = True
+        self._wake.set()
+        if self._writer is not None:
+            self._writer.join()
+            self._writer = None
+        with self._lock:
+            self._write_pending()
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+            self._compact_at = self.max_bytes
+        self._stopping = False
+
+    def _start(self):
+        with self._start_lock:
+            if self._writer is None and not self._stopping:
+                self._writer = threading.Thread(target=self._run, name="session-journal", daemon=True)
+                self._writer.start()
+
+    def _run(self):
+        while not self._stopping:
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            self._write()
+
+    def _write(self):
+        with self._lock:
+            self._write_pending()
+            if self._file is not None and self._file.tell() >= self._compact_at:
+                self._file.close()
+                self._file = None
+                size = compact(self.path)
+                # Compact again only once the file has doubled, in case live sessions alone pass max_bytes
+                self._compact_at = max(self.max_bytes, 2 * size)
+
+    def _write_pending(self):
+        if not self._buffer:
+            return
+        records = []
+        while self._buffer:
+            records.append(self._buffer.popleft())
+        if self._file is None:
+            self._file = open(self.path, "ab")
+        records.append(b"")
+        self._file.write(b"\n".join(records))
+        self._file.flush()
+
+
+def read_records(path: str, session_id: Optional[str] = None) -> Iterator[list]:
+    """Stream decoded records, optionally only one session's (filtered before decoding)"""
+    prefix = orjson.dumps([session_id])[:-1] + b"," if session_id else b""
+    with open(path, "rb") as f:
+        for line in f:
+            if line.startswith(prefix) and line.strip():
+                yield orjson.loads(line)
+
+
+def compact(path: str) -> int:
+    """
+    Rewrite the journal keeping, per session, only its latest snapshot and
+    the events after it; replay() gives the same states. Returns the new size
+    """
+    latest: Dict[str, int] = {}
+    for sid, seq, kind, *_ in read_records(path):
+        if kind == "snapshot":
+            latest[sid] = seq
+
+    temporary = f"{path}.tmp"
+    with open(path, "rb") as source, open(temporary, "wb") as target:
+        for line in source:
+            if not line.strip():
+                continue
+            sid, seq, kind = orjson.loads(line)[:3]
+            since = latest.get(sid)
+            if since is None or seq > since or (seq == since and kind == "snapshot"):
+                target.write(line if line.endswith(b"\n") else line + b"\n")
+    os.replace(temporary, path)
+    return os.path.getsize(path)
+
+
+def replay(path: str, session_id: Optional[str] = None) -> Dict[str, ConversationState]:
+    """
+    Rebuild sessions from the journal: each snapshot replaces the state built
+    so far and later events are applied on top. With a session_id, only its
+    latest snapshot and the events after it are applied
+    """
+    records = read_records(path, session_id)
+    if session_id:
+        records = list(records)
+        latest = max((i for i, record in enumerate(records) if record[2] == "snapshot"), default=0)
+        records = records[latest:]
+
+    states: Dict[str, ConversationState] = {}
+    for sid, seq, kind, *args in records:
+        if kind == "snapshot":
+            state = states[sid] = ConversationState.from_dict(args[0])
+        elif kind == "start":
+            state = states[sid] = ConversationState()
+        else:
+            state = states.setdefault(sid, ConversationState())
+            EVENTS[kind](state, *args)
+        state._journal_seq = seq
+    return states
+
+
+# Global instance; set SESSION_JOURNAL_PATH to write the journal
+journal = SessionJournal(os.getenv("SESSION_JOURNAL_PATH") or None,
+                         max_bytes=int(os.getenv("SESSION_JOURNAL_MAX_BYTES", str(64 * 2 ** 20))))
+atexit.register(journal.close)
@@ -0,0 +1,148 @@
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeout
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Dict, Optional
+
+from metrics import llm_calls, llm_latency
+
+# Absolute perf_counter() deadline for the current conversational turn
+_turn_deadline: ContextVar[Optional[float]] = ContextVar("turn_deadline", default=None)
+
+
+class MethodBudget:
+    """
+    Latency budget for one LLM-assisted method
+    Tracks recent call latencies to derive a percentile-based hedge point
+    """
+
+    def __init__(self, budget_ms: float, hedge_percentile: float = 95.0,
+                 min_hedge_ms: float = 150.0, min_samples: int = 20, window: int = 200):
+        self.budget = budget_ms / 1000.0
+        self.hedge_percentile = hedge_percentile
+        self.min_hedge = min_hedge_ms / 1000.0
+        self.min_samples = min_samples
+        self._latencies = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def observe(self, latency: float):
+        """Record the latency (seconds) of a finished call, late ones included"""
+        with self._lock:
+            self._latencies.append(latency)
+
+    def hedge_point(self) -> float:
+        """Seconds to wait before serving the fallback"""
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return self.budget
+            ordered = sorted(self._latencies)
+
+        index = min(len(ordered) - 1, int(len(ordered) * self.hedge_percentile / 100.0))
+        return max(self.min_hedge, min(self.budget, ordered[index]))
+
+
+class LatencyBudgetScheduler:
+    """
+    Runs LLM calls against per-method deadlines
+    If a call has not returned by its hedge point the fallback is served
+    immediately; the late result is dropped or handed to an on_late callback
+    """
+
+    def __init__(self, budgets: Dict[str, MethodBudget], max_workers: int = 8):
+        self.budgets = budgets
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="llm")
+
+    def run(self, method: str, call: Callable[[], Any], fallback: Any,
+            on_late: Optional[Callable[[Any], None]] = None) -> Any:
+        """
+        Run call() within the method's budget
+        Exceptions raised by call() propagate to the caller
+        """
+        budget = self.budgets.get(method)
+        if budget is None:
+            return call()
+
+        wait = budget.hedge_point()
+        remaining = turn_remaining()
+        if remaining is not None:
+            wait = min(wait, remaining)
+        if wait <= 0:
+            llm_calls.labels(method, "hedged").inc()
+            return fallback
+
+        started = time.perf_counter()
+        future = self._executor.submit(call)
+        future.add_done_callback(lambda f: _observe(method, budget, time.perf_counter() - started))
+
+        try:
+            result = future.result(timeout=wait)
+        except FutureTimeout:
+            llm_calls.labels(method, "hedged").inc()
+            if on_late is not None:
+                future.add_done_callback(lambda f: _deliver_late(f, on_late))
+            return fallback
+        except Exception:
+            llm_calls.labels(method, "error").inc()
+            raise
+        llm_calls.labels(method, "ok").inc()
+        return result
+
+    @contextmanager
+    def turn(self, budget_ms: Optional[float] = None):
+        """Bound the total LLM wait of every call made inside one turn"""
+        if budget_ms is None:
+            budget_ms = _env_ms("LLM_TURN_BUDGET_MS", 4000)
+        token = _turn_deadline.set(time.perf_counter() + budget_ms / 1000.0)
+        try:
+            yield
+        finally:
+            _turn_deadline.reset(token)
+
+
+def turn_remaining() -> Optional[float]:
+    """Seconds left in the current turn's LLM budget, None outside a turn"""
+    deadline = _turn_deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.perf_counter()
+
+
+def _observe(method: str, budget: MethodBudget, latency: float):
+    budget.observe(latency)
+    llm_latency.labels(method).observe(latency)
+
+
+def _deliver_late(future, on_late: Callable[[Any], None]):
+    """Hand a late successful result to its callback; failures are dropped"""
+    if future.cancelled() or future.exception() is not None:
+        return
+    try:
+        on_late(future.result())
+    except Exception as e:
+        print(f"Warning: Late LLM result handling failed: {e}")
+
+
+def _env_ms(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
+
+
+def _budget_from_env(method: str, default_ms: float) -> MethodBudget:
+    return MethodBudget(
+        budget_ms=_env_ms(f"LLM_BUDGET_{method.upper()}_MS", default_ms),
+        hedge_percentile=_env_ms("LLM_HEDGE_PERCENTILE", 95.0),
+    )
+
+
+# Global instance, budgets configurable per method via LLM_BUDGET_<METHOD>_MS
+llm_scheduler = LatencyBudgetScheduler({
+    "rephrase": _budget_from_env("rephrase", 1500),
+    "acknowledgment": _budget_from_env("acknowledgment", 1200),
+    "clarification": _budget_from_env("clarification", 3000),
+    "recommendation": _budget_from_env("recommendation", 6000),
+})
@@ -0,0 +1,178 @@
+"""
+Graceful shutdown and warm restart for the in-memory sessions
+On SIGTERM the app stops opening new sessions and waits for in-flight
+requests to finish while uvicorn still has its sockets open; uvicorn then
+shuts down and the lifespan writes every live session to a snapshot file.
+The next process loads it back at startup, so a redeploy does not reset
+assessments
+
+Snapshot format: one [session_id, state] orjson array per line, written to
+a temporary file and renamed into place so a killed dump leaves no half file
+"""
+
+import asyncio
+import gc
+import os
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, Optional, Tuple
+
+import orjson
+import uvicorn
+
+from state import ConversationState
+
+SNAPSHOT_PATH = os.getenv("SESSION_SNAPSHOT_PATH") or None
+DRAIN_SECONDS = float(os.getenv("SHUTDOWN_DRAIN_SECONDS", "10"))
+
+_CHUNK = 4096
+
+
+@contextmanager
+def _gc_paused():
+    """
+    Bulk dumps and loads allocate hundreds of thousands of long-lived
+    containers; left on, the cyclic collector rescans them over and over
+    and roughly doubles the time
+    """
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def dump_sessions(sessions: Dict[str, ConversationState], path: str) -> int:
+    """Write every session to the snapshot file; returns how many were written"""
+    items = list(sessions.items())
+    temporary = f"{path}.tmp"
+    with _gc_paused(), open(temporary, "wb") as f:
+        for start in range(0, len(items), _CHUNK):
+            f.write(b"".join(orjson.dumps([session_id, state.to_dict()], option=orjson.OPT_APPEND_NEWLINE)
+                             for session_id, state in items[start:start + _CHUNK]))
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+    return len(items)
+
+
+def load_sessions(path: str) -> Iterator[Tuple[str, ConversationState]]:
+    """Stream (session_id, state) pairs from a snapshot file, one line at a time"""
+    from_dict = ConversationState.from_dict
+    loads = orjson.loads
+    with open(path, "rb") as f:
+        for line in f:
+            session_id, data = loads(line)
+            yield session_id, from_dict(data)
+
+
+def restore_sessions(sessions: Dict[str, ConversationState], path: str) -> int:
+    """
+    Load a snapshot into the session store and remove it, so a later crash
+    cannot bring back states that have moved on since. Returns the count
+    """
+    if not os.path.exists(path):
+        return 0
+    before = len(sessions)
+    with _gc_paused():
+        sessions.update(load_sessions(path))
+    os.remove(path)
+    return len(sessions) - before
+
+
+class SessionDrain:
+    """In-flight request count and the draining flag, shared with DrainMiddleware"""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.draining = False
+
+    async def drain(self, timeout: float = DRAIN_SECONDS) -> bool:
+        """Stop new sessions and wait for in-flight requests; False if the timeout ran out"""
+        self.draining = True
+        deadline = time.monotonic() + timeout
+        while self.in_flight and time.monotonic() < deadline:
+            await asyncio.sleep(0.05)
+        return not self.in_flight
+
+
+# Global instance
+session_drain = SessionDrain()
+
+_exit_tasks = set()
+
+
+def drain_before_exit(server_class=uvicorn.Server, drain: Optional[SessionDrain] = None,
+                      timeout: float = DRAIN_SECONDS):
+    """
+    Wrap the server's signal handler so the first SIGTERM or SIGINT drains
+    before the server is told to exit. uvicorn closes its sockets and
+    connections before the lifespan shutdown runs, so draining there would
+    find nothing left in flight. A second signal exits straight away
+    """
+    handle_exit = server_class.handle_exit
+    if getattr(handle_exit, "drains", False):
+        return
+    drain = drain or session_drain
+
+    def draining_exit(self, sig, frame):
+        if drain.draining:
+            handle_exit(self, sig, frame)
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            handle_exit(self, sig, frame)
+            return
+
+        async def drain_then_exit():
+            await drain.drain(timeout)
+            handle_exit(self, sig, frame)
+        task = loop.create_task(drain_then_exit())
+        _exit_tasks.add(task)
+        task.add_done_callback(_exit_tasks.discard)
+
+    draining_exit.drains = True
+    server_class.handle_exit = draining_exit
+
+
+class DrainMiddleware:
+    """
+    Pure ASGI middleware counting in-flight HTTP requests; once draining,
+    requests that would open a session get a 503 so clients retry against
+    the next instance. WebSocket connections are long-lived and not waited for
+    """
+
+    def __init__(self, app, drain: Optional[SessionDrain] = None, new_session_paths=("/start",)):
+        self.app = app
+        self.drain = drain or session_drain
+        self.new_session_paths = new_session_paths
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        if self.drain.draining and scope["path"] in self.new_session_paths:
+            await _unavailable(send)
+            return
+        self.drain.in_flight += 1
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            self.drain.in_flight -= 1
+
+
+async def _unavailable(send):
+    body = orjson.dumps({"detail": "Server is restarting, please retry shortly."})
+    await send({
+        "type": "http.response.start",
+        "status": 503,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", b"1"),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
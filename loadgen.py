@@ -0,0 +1,179 @@
+"""
+Async load generator simulating realistic assessment traffic
+Each synthetic user walks /start → /personal-info → /answer (domain, then
+yes/no until the results) → /detailed-roadmap → /download-roadmap → /feedback,
+with the last three steps taken by a configurable share of users and a
+random think time between steps
+
+Runs against the app in-process (default, via httpx's ASGI transport, with
+the rate limiter off) or against a live server with --url
+Needs httpx: pip install httpx
+
+Usage: python loadgen.py --users 2000 --think-ms 300 --ramp-seconds 5
+       python loadgen.py --url http://localhost:8000 --users 200 --mix roadmap=1,download=0.1,feedback=0.5
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from collections import defaultdict
+
+import httpx
+
+DOMAINS = ['backend', 'frontend', 'data analytics', 'machine learning', 'devops',
+           'cybersecurity', 'data engineering', 'algorithms']
+
+DEFAULT_MIX = {"roadmap": 0.6, "download": 0.15, "feedback": 0.3}
+
+
+def _percentile(ordered, pct):
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100.0))]
+
+
+def _parse_mix(raw: str):
+    mix = dict(DEFAULT_MIX)
+    for part in filter(None, raw.split(",")):
+        name, _, share = part.partition("=")
+        if name not in mix:
+            raise SystemExit(f"Unknown mix step {name!r}, expected one of {', '.join(mix)}")
+        mix[name] = float(share)
+    return mix
+
+
+class LoadStats:
+    """Latencies and failures per route"""
+
+    def __init__(self):
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.users_done = 0
+        self.users_failed = 0
+
+    def record(self, route: str, latency: float, ok: bool):
+        self.latencies[route].append(latency)
+        if not ok:
+            self.errors[route] += 1
+
+    def print_report(self, elapsed: float):
+        print(f"{'route':<20}{'requests':>10}{'errors':>8}{'req/s':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+        total = 0
+        for route, latencies in self.latencies.items():
+            ordered = sorted(latencies)
+            total += len(ordered)
+            print(f"{route:<20}{len(ordered):>10}{self.errors[route]:>8}{len(ordered) / elapsed:>10.1f}"
+                  f"{_percentile(ordered, 50) * 1000:>10.1f}"
+                  f"{_percentile(ordered, 95) * 1000:>10.1f}"
+                  f"{_percentile(ordered, 99) * 1000:>10.1f}"
+                  f"{ordered[-1] * 1000:>10.1f}")
+        print(f"\n{total} requests in {elapsed:.1f}s ({total / elapsed:.1f} req/s), "
+              f"{self.users_done} users finished, {self.users_failed} failed")
+
+
+class SyntheticUser:
+    """One user's walk through the assessment"""
+
+    def __init__(self, client: httpx.AsyncClient, stats: LoadStats, rng: random.Random,
+                 think_ms: float, mix: dict):
+        self.client = client
+        self.stats = stats
+        self.rng = rng
+        self.think_ms = think_ms
+        self.mix = mix
+
+    async def run(self):
+        data = await self._post("/start", None)
+        session_id = data["session_id"]
+        domain = self.rng.choice(DOMAINS)
+
+        await self._post("/personal-info", {"session_id": session_id, "name": f"User {self.rng.randrange(10**6)}",
+                                             "location": "Remote", "education": "Computer Science"})
+        data = await self._post("/answer", {"session_id": session_id, "answer": domain})
+        # Every question needs an answer; cap the walk in case the flow never completes
+        for _ in range(20):
+            if data.get("completed"):
+                break
+            answer = self.rng.choice(["yes", "no", "yes, I have", "not really"])
+            data = await self._post("/answer", {"session_id": session_id, "answer": answer})
+
+        if self.rng.random() < self.mix["roadmap"]:
+            await self._post("/detailed-roadmap", {"session_id": session_id, "domain": domain})
+        if self.rng.random() < self.mix["download"]:
+            await self._post("/download-roadmap", {"session_id": session_id, "domain": domain}, json_response=False)
+        if self.rng.random() < self.mix["feedback"]:
+            await self._post("/feedback", {"session_id": session_id, "feedback": "Helpful, thanks!"})
+
+    async def _post(self, route: str, body, json_response: bool = True):
+        await self._think()
+        started = time.perf_counter()
+        try:
+            response = await self.client.post(route, json=body)
+            ok = response.status_code < 400
+            payload = response.json() if json_response and ok else {}
+        except (httpx.HTTPError, ValueError):
+            ok, payload = False, {}
+        self.stats.record(route, time.perf_counter() - started, ok)
+        if not ok:
+            raise RuntimeError(f"{route} failed")
+        return payload
+
+    async def _think(self):
+        if self.think_ms > 0:
+            # Exponential think times: most pauses short, a few long
+            await asyncio.sleep(self.rng.expovariate(1000.0 / self.think_ms))
+
+
+async def _run_users(client, args, stats):
+    mix = _parse_mix(args.mix)
+    rng = random.Random(args.seed)
+
+    async def one(index):
+        await asyncio.sleep(args.ramp_seconds * index / max(1, args.users))
+        user = SyntheticUser(client, stats, random.Random(rng.random()), args.think_ms, mix)
+        try:
+            await user.run()
+            stats.users_done += 1
+        except RuntimeError:
+            stats.users_failed += 1
+
+    await asyncio.gather(*(one(i) for i in range(args.users)))
+
+
+async def main_async(args):
+    limits = httpx.Limits(max_connections=args.max_connections, max_keepalive_connections=args.max_connections)
+    if args.url:
+        client = httpx.AsyncClient(base_url=args.url, limits=limits, timeout=args.timeout)
+    else:
+        # In-process: every user shares one client address, so the limiter would throttle the run
+        os.environ.setdefault("RATE_LIMIT_ENABLED", "0")
+        import main
+        client = httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://loadgen",
+                                   limits=limits, timeout=args.timeout)
+
+    stats = LoadStats()
+    async with client:
+        started = time.perf_counter()
+        await _run_users(client, args, stats)
+        elapsed = time.perf_counter() - started
+
+    print(f"{args.users} users, think {args.think_ms:.0f} ms, ramp {args.ramp_seconds:.0f}s, "
+          f"{'against ' + args.url if args.url else 'in-process'}\n")
+    stats.print_report(elapsed)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--url", help="base URL of a running server; omit to drive main.py in-process")
+    parser.add_argument("--users", type=int, default=500)
+    parser.add_argument("--think-ms", type=float, default=200.0, help="mean think time between steps")
+    parser.add_argument("--ramp-seconds", type=float, default=2.0, help="spread user arrivals over this long")
+    parser.add_argument("--mix", default="", help="share of users taking optional steps, e.g. roadmap=0.6,download=0.1")
+    parser.add_argument("--max-connections", type=int, default=200)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
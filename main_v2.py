@@ -1,19 +1,32 @@
 from fastapi import FastAPI, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import PlainTextResponse
 from pydantic import BaseModel
 from typing import Dict, Any, Optional
 import uuid
 
 from state import ConversationState, ConversationStage, UserLevel
-from state_controller import StateController
+from state_controller import PERSONAL_INFO_STAGES, StateController
 from intent_detector import IntentDetector
 from interruption_handler import InterruptionHandler
 from safe_gemini import safe_gemini
+from gemini_client import gemini_client
+from latency_budget import llm_scheduler
+from rephrase_prefetch import RephrasePrefetcher
+from retrieval import chat_index
+from rate_limit import RateLimitMiddleware
+from profiling import ProfilingMiddleware
+from admin import router as admin_router
+from memory import memory_reporter
+from metrics import CONTENT_TYPE, MetricsMiddleware, metrics
 from engine import TechCounsellorEngine
 
 # Initialize FastAPI app
 app = FastAPI(title="AI Tech Counsellor", version="2.0.0")
 
+# Rate limit per client and session (added first so CORS headers still wrap 429s)
+app.add_middleware(RateLimitMiddleware, routes={"/answer": "llm", "/chat": "llm"})
+
 # Add CORS middleware for frontend
 app.add_middleware(
     CORSMiddleware,
@@ -23,14 +36,33 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Profiles sampled or admin-flagged requests; passes straight through unless configured
+app.add_middleware(ProfilingMiddleware)
+
+# Outermost, so rejected and failed requests are counted too
+app.add_middleware(MetricsMiddleware)
+
+app.include_router(admin_router)
+
 # Initialize components
 state_controller = StateController()
 intent_detector = IntentDetector()
 interruption_handler = InterruptionHandler()
 engine = TechCounsellorEngine()
+rephrase_prefetcher = RephrasePrefetcher(safe_gemini.rephrase_question)
+
+@app.on_event("startup")
+def warm_gemini_client():
+    """Open the shared Gemini transport before the first request"""
+    gemini_client.warm()
 
 # In-memory session storage
 sessions: Dict[str, ConversationState] = {}
+metrics.gauge_func("sessions_active", "Conversation sessions held in memory", lambda: len(sessions))
+memory_reporter.track("sessions", lambda: sessions)
+memory_reporter.track("rephrase_cache", lambda: safe_gemini._rephrase_cache)
+memory_reporter.track("acknowledgment_cache", lambda: safe_gemini._acknowledgment_cache)
+memory_reporter.track("chat_index", lambda: chat_index)
 
 # Request/Response models
 class StartConversationResponse(BaseModel):
@@ -77,18 +109,18 @@ async def submit_answer(request: UserAnswerRequest):
     state = sessions[request.session_id]
     user_input = request.answer.strip()
     
-    # Handle different stages with state machine
-    if state.stage == ConversationStage.PERSONAL_INFO:
-        return _handle_personal_info_stage(state, user_input)
-    
-    elif state.stage == ConversationStage.INTEREST_SELECTION:
-        return _handle_domain_selection_stage(state, user_input)
-    
-    elif state.stage == ConversationStage.DOMAIN_EVALUATION:
-        return _handle_assessment_stage(state, user_input)
+    # Handle different stages with state machine, all LLM calls share one turn budget
+    with llm_scheduler.turn():
+        if state.stage in PERSONAL_INFO_STAGES:
+            return _handle_personal_info_stage(state, user_input)
+        
+        elif state.stage == ConversationStage.DOMAIN_SELECTION:
+            return _handle_domain_selection_stage(state, user_input)
+        
+        elif state.stage == ConversationStage.DOMAIN_EVALUATION:
+            return _handle_assessment_stage(state, user_input)
     
-    else:
-        raise HTTPException(status_code=400, detail="Invalid conversation stage")
+    raise HTTPException(status_code=400, detail="Invalid conversation stage")
 
 def _handle_personal_info_stage(state: ConversationState, user_input: str) -> ConversationResponse:
     """Handle personal information collection stage"""
@@ -113,7 +145,7 @@ def _handle_personal_info_stage(state: ConversationState, user_input: str) -> Co
         )
     
     # Valid input - advance state
-    success, next_question = state_controller.advance_state(state, user_input)
+    success, next_question = state_controller.advance(state, user_input)
     
     if not success:
         return ConversationResponse(
@@ -165,12 +197,14 @@ def _handle_domain_selection_stage(state: ConversationState, user_input: str) ->
         state.stage = ConversationStage.DOMAIN_EVALUATION
         state.total_questions = len(questions)
         state.current_question_index = 0
+        state.question_plan = [question["question"] for question in questions]
         
-        # Get first question (potentially rephrased)
+        # Get first question (potentially rephrased) and prefetch the ones after it
         first_question = engine.get_next_question(state)
         rephrased_question = safe_gemini.rephrase_question(
             first_question["question"], selected_domain
         )
+        rephrase_prefetcher.schedule(state, state.question_plan, 0, selected_domain)
         
         return ConversationResponse(
             message=f"Perfect! Let's assess your {selected_domain.replace('_', ' ')} skills.",
@@ -220,9 +254,12 @@ def _handle_assessment_stage(state: ConversationState, user_input: str) -> Conve
     next_question = engine.get_next_question(state)
     
     if next_question:
-        # Rephrase next question
-        rephrased_question = safe_gemini.rephrase_question(
-            next_question["question"], state.selected_domain
+        # Pick up the prefetched rephrasing and start on the questions after it
+        rephrased_question = rephrase_prefetcher.take(
+            state, next_question["question"], state.selected_domain
+        )
+        rephrase_prefetcher.schedule(
+            state, state.question_plan, state.current_question_index, state.selected_domain
         )
         
         return ConversationResponse(
@@ -234,6 +271,7 @@ def _handle_assessment_stage(state: ConversationState, user_input: str) -> Conve
         )
     else:
         # Assessment complete
+        rephrase_prefetcher.discard(state)
         result = _generate_final_results(state)
         result.message = acknowledgment + " " + result.message
         return result
@@ -276,6 +314,11 @@ def _generate_final_results(state: ConversationState) -> ConversationResponse:
         completed=True
     )
 
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics():
+    """Prometheus text exposition of request, LLM and cache metrics"""
+    return PlainTextResponse(metrics.render(), media_type=CONTENT_TYPE)
+
 @app.get("/session/{session_id}")
 async def get_session_status(session_id: str):
     """Get current session status"""
@@ -309,9 +352,14 @@ async def post_assessment_chat(request: UserAnswerRequest):
             completed=False
         )
     
-    # Use safe Gemini for post-assessment questions
-    context = f"User completed {state.selected_domain} assessment with {state.user_level.value} level."
-    response = safe_gemini.answer_clarification_question(request.answer, context)
+    # Answer from the roadmap and explanation content; Gemini only when retrieval is unsure
+    hit = chat_index.best(request.answer, state.selected_domain.replace('_', ' '))
+    if hit:
+        response = hit.snippet.answer
+    else:
+        context = f"User completed {state.selected_domain} assessment with {state.user_level.value} level."
+        with llm_scheduler.turn():
+            response = safe_gemini.answer_clarification_question(request.answer, context)
     
     return ConversationResponse(
         message=response,
@@ -0,0 +1,132 @@
+import os
+import sys
+import threading
+import tracemalloc
+from collections import deque
+from enum import Enum
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import Any, Callable, Dict, Optional
+
+# Shared by every session, so never part of one object's footprint
+_SHARED = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType, Enum)
+
+
+def deep_sizeof(root: Any, seen: Optional[set] = None) -> int:
+    """
+    Approximate bytes reachable from root: containers, instance dicts and slots
+    Pass the same `seen` set across calls to count shared objects only once
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    pending = [root]
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen or isinstance(obj, _SHARED):
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+
+        try:
+            if isinstance(obj, dict):
+                for key, value in list(obj.items()):
+                    pending.append(key)
+                    pending.append(value)
+            elif isinstance(obj, (list, tuple, set, frozenset, deque)):
+                pending.extend(list(obj))
+            else:
+                attributes = getattr(obj, "__dict__", None)
+                if attributes is not None:
+                    pending.append(attributes)
+                for cls in type(obj).__mro__:
+                    for slot in getattr(cls, "__slots__", ()):
+                        if hasattr(obj, slot):
+                            pending.append(getattr(obj, slot))
+        except RuntimeError:
+            # Container changed size under a concurrent request; skip its contents
+            continue
+    return total
+
+
+class MemoryReporter:
+    """
+    Memory introspection behind /admin/memory, off unless MEMORY_REPORT=1
+    Tracked objects are sized on demand; tracemalloc runs from startup and
+    each report diffs against the snapshot taken by the previous one
+    """
+
+    def __init__(self):
+        self.enabled = os.getenv("MEMORY_REPORT", "0") == "1"
+        self._tracked: Dict[str, Callable[[], Any]] = {}
+        self._previous: Optional[tracemalloc.Snapshot] = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Begin tracing allocations if reporting is enabled"""
+        if self.enabled and not tracemalloc.is_tracing():
+            tracemalloc.start(int(os.getenv("MEMORY_TRACE_FRAMES", "1")))
+
+    def track(self, name: str, read: Callable[[], Any]):
+        """Register an object (read lazily) to be sized in every report"""
+        self._tracked[name] = read
+
+    def report(self, top: int = 20, sample: int = 200) -> Dict[str, Any]:
+        with self._lock:
+            return {
+                "rss_bytes": _rss_bytes(),
+                "objects": {name: deep_sizeof(read()) for name, read in self._tracked.items()},
+                "sessions": self._session_sizes(sample),
+                "allocations": self._allocation_diff(top),
+            }
+
+    def _session_sizes(self, sample: int) -> Dict[str, Any]:
+        read = self._tracked.get("sessions")
+        states = list(read().values())[:sample] if read else []
+        # Measured one by one, so objects shared between sessions count in each
+        sizes = sorted(deep_sizeof(state) for state in states)
+        if not sizes:
+            return {"sampled": 0}
+        return {
+            "sampled": len(sizes),
+            "mean_bytes": sum(sizes) // len(sizes),
+            "median_bytes": sizes[len(sizes) // 2],
+            "max_bytes": sizes[-1],
+        }
+
+    def _allocation_diff(self, top: int):
+        if not tracemalloc.is_tracing():
+            return {"tracing": False}
+        snapshot = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+        ))
+        previous, self._previous = self._previous, snapshot
+        if previous is None:
+            stats = snapshot.statistics("lineno")[:top]
+            return {"tracing": True, "baseline": True, "top": [_stat_row(stat, stat.size, stat.count) for stat in stats]}
+
+        stats = snapshot.compare_to(previous, "lineno")[:top]
+        return {"tracing": True, "baseline": False,
+                "top": [_stat_row(stat, stat.size_diff, stat.count_diff, stat.size) for stat in stats]}
+
+
+def _stat_row(stat, size: int, count: int, total: Optional[int] = None):
+    frame = stat.traceback[0]
+    row = {"site": f"{os.path.relpath(frame.filename) if frame.filename.startswith(os.getcwd()) else frame.filename}:{frame.lineno}",
+           "bytes": size, "blocks": count}
+    if total is not None:
+        row["total_bytes"] = total
+    return row
+
+
+def _rss_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
+# Global instance, shared by the apps and the admin endpoint
+memory_reporter = MemoryReporter()
+memory_reporter.start()
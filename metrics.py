@@ -0,0 +1,291 @@
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# PlainTextResponse appends the charset
+CONTENT_TYPE = "text/plain; version=0.0.4"
+
+
+def log_linear_buckets(low_exponent: int = -3, high_exponent: int = 2) -> List[float]:
+    """1, 2 .. 9 steps in every decade from 10**low up to (not including) 10**high"""
+    return [round(step * 10.0 ** exponent, 9)
+            for exponent in range(low_exponent, high_exponent)
+            for step in range(1, 10)]
+
+
+class _Shards:
+    """
+    Per-thread cells of a metric
+    Each thread only ever writes its own cell, so updates need no lock;
+    readers sum across the cells. The lock is only taken the first time a
+    thread touches the metric
+    """
+
+    def __init__(self, width: int):
+        self.width = width
+        self._cells: Dict[int, list] = {}
+        self._lock = threading.Lock()
+
+    def cell(self) -> list:
+        ident = threading.get_ident()
+        cell = self._cells.get(ident)
+        if cell is None:
+            with self._lock:
+                cell = self._cells.setdefault(ident, [0] * self.width)
+        return cell
+
+    def totals(self) -> list:
+        totals = [0] * self.width
+        for cell in list(self._cells.values()):
+            for i, value in enumerate(cell):
+                totals[i] += value
+        return totals
+
+
+class _CounterChild:
+    __slots__ = ("_shards",)
+
+    def __init__(self):
+        self._shards = _Shards(1)
+
+    def inc(self, amount: float = 1):
+        self._shards.cell()[0] += amount
+
+    def value(self) -> float:
+        return self._shards.totals()[0]
+
+
+class _HistogramChild:
+    __slots__ = ("_bounds", "_shards")
+
+    def __init__(self, bounds: List[float]):
+        self._bounds = bounds
+        # One slot per bound, one for +Inf, then the running sum
+        self._shards = _Shards(len(bounds) + 2)
+
+    def observe(self, value: float):
+        cell = self._shards.cell()
+        cell[bisect_left(self._bounds, value)] += 1
+        cell[-1] += value
+
+    def time(self) -> "_Timer":
+        """Context manager observing the elapsed seconds of its block"""
+        return _Timer(self)
+
+    def snapshot(self) -> Tuple[List[int], float]:
+        totals = self._shards.totals()
+        return totals[:-1], totals[-1]
+
+
+class _Timer:
+    __slots__ = ("_histogram", "_started")
+
+    def __init__(self, histogram: _HistogramChild):
+        self._histogram = histogram
+
+    def __enter__(self):
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self._histogram.observe(time.perf_counter() - self._started)
+
+
+class _Family:
+    """A named metric and its children, one per combination of label values"""
+
+    kind = ""
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.help = help
+        self.labelnames = tuple(labelnames)
+        self._children: Dict[tuple, object] = {}
+        self._lock = threading.Lock()
+        if not self.labelnames:
+            self._default = self.labels()
+
+    def labels(self, *values):
+        child = self._children.get(values)
+        if child is None:
+            if len(values) != len(self.labelnames):
+                raise ValueError(f"{self.name} expects labels {self.labelnames}")
+            with self._lock:
+                child = self._children.setdefault(values, self._new_child())
+        return child
+
+    def _new_child(self):
+        raise NotImplementedError
+
+    def _label_text(self, values: tuple, extra: str = "") -> str:
+        pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(self.labelnames, values)]
+        if extra:
+            pairs.append(extra)
+        return "{" + ",".join(pairs) + "}" if pairs else ""
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+        for values, child in sorted(list(self._children.items()), key=lambda item: tuple(map(str, item[0]))):
+            lines.extend(self._render_child(values, child))
+        return lines
+
+
+class Counter(_Family):
+    kind = "counter"
+
+    def _new_child(self):
+        return _CounterChild()
+
+    def inc(self, amount: float = 1):
+        self._default.inc(amount)
+
+    def _render_child(self, values, child):
+        return [f"{self.name}{self._label_text(values)} {_number(child.value())}"]
+
+
+class Histogram(_Family):
+    kind = "histogram"
+
+    def __init__(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: List[float] = None):
+        self.buckets = buckets or log_linear_buckets()
+        super().__init__(name, help, labelnames)
+
+    def _new_child(self):
+        return _HistogramChild(self.buckets)
+
+    def observe(self, value: float):
+        self._default.observe(value)
+
+    def time(self) -> _Timer:
+        return self._default.time()
+
+    def _render_child(self, values, child):
+        counts, total = child.snapshot()
+        lines = []
+        cumulative = 0
+        for bound, count in zip(self.buckets + [float("inf")], counts):
+            cumulative += count
+            le = 'le="+Inf"' if bound == float("inf") else f'le="{_number(bound)}"'
+            lines.append(f"{self.name}_bucket{self._label_text(values, le)} {cumulative}")
+        lines.append(f"{self.name}_sum{self._label_text(values)} {_number(total)}")
+        lines.append(f"{self.name}_count{self._label_text(values)} {cumulative}")
+        return lines
+
+
+class GaugeFunc:
+    """Gauge read from a callback at scrape time, e.g. the session store size"""
+
+    def __init__(self, name: str, help: str, read: Callable[[], float]):
+        self.name = name
+        self.help = help
+        self.read = read
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} gauge",
+                f"{self.name} {_number(self.read())}"]
+
+
+class Registry:
+    """Named metrics rendered together in the Prometheus text format"""
+
+    def __init__(self):
+        self._metrics: Dict[str, object] = {}
+        self._lock = threading.Lock()
+
+    def _register(self, metric):
+        with self._lock:
+            # Re-registering (e.g. two apps in one process) keeps the existing series;
+            # a gauge takes the newest callback
+            existing = self._metrics.get(metric.name)
+            if existing is not None and type(existing) is type(metric) and not isinstance(metric, GaugeFunc):
+                return existing
+            self._metrics[metric.name] = metric
+            return metric
+
+    def counter(self, name: str, help: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self._register(Counter(name, help, labelnames))
+
+    def histogram(self, name: str, help: str, labelnames: Sequence[str] = (), buckets: List[float] = None) -> Histogram:
+        return self._register(Histogram(name, help, labelnames, buckets))
+
+    def gauge_func(self, name: str, help: str, read: Callable[[], float]) -> GaugeFunc:
+        return self._register(GaugeFunc(name, help, read))
+
+    def render(self) -> str:
+        lines = []
+        for name in sorted(self._metrics):
+            lines.extend(self._metrics[name].render())
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _number(value: float) -> str:
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+# Global registry shared by every module
+metrics = Registry()
+
+http_requests = metrics.counter("http_requests_total", "HTTP requests by route and status", ("method", "route", "status"))
+http_latency = metrics.histogram("http_request_duration_seconds", "HTTP request latency by route", ("method", "route"))
+llm_calls = metrics.counter("llm_calls_total", "LLM calls by method and outcome (ok, hedged, error, unavailable)", ("method", "outcome"))
+llm_latency = metrics.histogram("llm_call_duration_seconds", "LLM call latency by method, late calls included", ("method",))
+pdf_render = metrics.histogram("pdf_render_duration_seconds", "Roadmap PDF render time")
+cache_lookups = metrics.counter("cache_lookups_total", "Cache lookups by cache and result (hit, miss)", ("cache", "result"))
+intent_routing = metrics.counter("intent_routing_total", "Second-stage intent model decisions (kept, overruled, unsure)", ("outcome",))
+feedback_records = metrics.counter("feedback_records_total", "Feedback records by outcome (written, dropped, failed)", ("outcome",))
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request counts and latency per route
+    Routes are labelled by their path template, so /session/{session_id}
+    is one series rather than one per session
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        status = 500
+        started = time.perf_counter()
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = route_template(scope)
+            http_latency.labels(scope["method"], route).observe(time.perf_counter() - started)
+            http_requests.labels(scope["method"], route, status).inc()
+
+
+_templates: Dict[object, str] = {}
+
+
+def route_template(scope) -> str:
+    """Path template of the route that served a request, once routing has run"""
+    # The router leaves the matched endpoint in the scope
+    endpoint = scope.get("endpoint")
+    if endpoint is None:
+        return "unmatched"
+    template = _templates.get(endpoint)
+    if template is None:
+        template = next((route.path for route in getattr(scope.get("app"), "routes", ())
+                         if getattr(route, "endpoint", None) is endpoint), "unmatched")
+        _templates[endpoint] = template
+    return template
@@ -0,0 +1,226 @@
+import functools
+import hmac
+import inspect
+import itertools
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+
+from metrics import route_template
+
+# The sampler profiling the current request; copied into threadpool workers with the context
+_profiled_by: ContextVar[Optional["StackSampler"]] = ContextVar("profiled_by", default=None)
+
+
+class RouteProfile:
+    """Stack samples collected while one route's endpoint was on the stack"""
+
+    def __init__(self):
+        self.requests = 0
+        self.samples = 0
+        self.self_samples = Counter()
+        self.total_samples = Counter()
+
+    def add(self, stack):
+        self.samples += 1
+        self.self_samples[stack[0]] += 1
+        # A recursive function counts once per sample
+        self.total_samples.update(set(stack))
+
+    def top(self, limit: int, interval: float):
+        rows = []
+        for code, total in self.total_samples.most_common(limit):
+            rows.append({
+                "function": code.co_name,
+                "file": os.path.relpath(code.co_filename) if code.co_filename.startswith(os.getcwd()) else code.co_filename,
+                "line": code.co_firstlineno,
+                "self_ms": round(self.self_samples[code] * interval * 1000, 1),
+                "total_ms": round(total * interval * 1000, 1),
+                "total_pct": round(100.0 * total / self.samples, 1),
+            })
+        return rows
+
+
+class StackSampler:
+    """
+    Low-overhead sampling profiler
+    While at least one profiled request is in flight, a background thread
+    reads the stacks of the threads serving profiled requests at a fixed
+    interval: the event loop thread from begin() to end(), and a threadpool
+    worker while it runs a profiled request's sync endpoint. A stack is
+    attributed to a route when it contains that route's endpoint function.
+    Idle, the thread just waits on an event
+    """
+
+    def __init__(self, interval: float = 0.005):
+        self.interval = interval
+        self.profiles: Dict[str, RouteProfile] = {}
+        self._endpoints: Dict[object, str] = {}
+        # Thread ident → profiled requests running on it
+        self._threads: Counter = Counter()
+        self._active = 0
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def register_routes(self, app):
+        """
+        Map each endpoint's code object to its route path, and wrap sync
+        endpoints so the worker thread running one is tracked while it does
+        """
+        for route in getattr(app, "routes", ()):
+            endpoint = getattr(route, "endpoint", None)
+            code = getattr(inspect.unwrap(endpoint), "__code__", None) if endpoint else None
+            if code is not None:
+                self._endpoints.setdefault(code, route.path)
+            dependant = getattr(route, "dependant", None)
+            call = getattr(dependant, "call", None)
+            # FastAPI calls dependant.call on each request, in the threadpool unless it is a coroutine
+            if call is not None and not inspect.iscoroutinefunction(call) and not hasattr(call, "_profiled_by"):
+                dependant.call = self._tracked(call)
+
+    def _tracked(self, call):
+        @functools.wraps(call)
+        def tracked(*args, **kwargs):
+            if _profiled_by.get() is not self:
+                return call(*args, **kwargs)
+            with self.track_thread():
+                return call(*args, **kwargs)
+        tracked._profiled_by = self
+        return tracked
+
+    @contextmanager
+    def track_thread(self):
+        """Sample the calling thread for the duration of the block"""
+        ident = threading.get_ident()
+        with self._lock:
+            self._threads[ident] += 1
+        try:
+            yield
+        finally:
+            self._release(ident)
+
+    def _release(self, ident: int):
+        with self._lock:
+            self._threads[ident] -= 1
+            if self._threads[ident] <= 0:
+                del self._threads[ident]
+
+    def begin(self):
+        """Start profiling a request on the calling (event loop) thread"""
+        with self._lock:
+            self._threads[threading.get_ident()] += 1
+            self._active += 1
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+                self._thread.start()
+            self._wake.set()
+
+    def end(self, route: str):
+        self._release(threading.get_ident())
+        with self._lock:
+            self.profiles.setdefault(route, RouteProfile()).requests += 1
+            self._active -= 1
+            if self._active == 0:
+                self._wake.clear()
+
+    def report(self, route: Optional[str] = None, limit: int = 20):
+        with self._lock:
+            routes = {name: profile for name, profile in self.profiles.items() if route in (None, name)}
+            return {
+                name: {
+                    "requests": profile.requests,
+                    "samples": profile.samples,
+                    "interval_ms": self.interval * 1000,
+                    "top": profile.top(limit, self.interval),
+                }
+                for name, profile in routes.items()
+            }
+
+    def reset(self):
+        with self._lock:
+            self.profiles.clear()
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            started = time.perf_counter()
+            self._sample()
+            time.sleep(max(0.0, self.interval - (time.perf_counter() - started)))
+
+    def _sample(self):
+        endpoints = self._endpoints
+        with self._lock:
+            threads = list(self._threads)
+        frames = sys._current_frames()
+        for ident in threads:
+            frame = frames.get(ident)
+            stack = []
+            route = None
+            # Walk from the leaf up to the endpoint; frames above it are server plumbing
+            while frame is not None:
+                code = frame.f_code
+                stack.append(code)
+                route = endpoints.get(code)
+                if route is not None:
+                    break
+                frame = frame.f_back
+            if route is not None:
+                with self._lock:
+                    self.profiles.setdefault(route, RouteProfile()).add(stack)
+
+
+def admin_token_matches(token: Optional[str]) -> bool:
+    """Constant-time check of a supplied token against ADMIN_TOKEN"""
+    expected = os.getenv("ADMIN_TOKEN")
+    return bool(expected) and isinstance(token, str) and hmac.compare_digest(token.encode(), expected.encode())
+
+
+class ProfilingMiddleware:
+    """
+    Pure ASGI middleware profiling 1-in-N requests (PROFILE_SAMPLE_EVERY), or
+    any request carrying the X-Admin-Token header
+    With neither configured every request passes straight through
+    """
+
+    def __init__(self, app, sampler: Optional[StackSampler] = None, sample_every: Optional[int] = None):
+        self.app = app
+        self.sampler = sampler or profiler
+        self.sample_every = sample_every if sample_every is not None else int(os.getenv("PROFILE_SAMPLE_EVERY", "0"))
+        self.enabled = self.sample_every > 0 or bool(os.getenv("ADMIN_TOKEN"))
+        self._counter = itertools.count(1)
+        self._registered = False
+
+    async def __call__(self, scope, receive, send):
+        if not self.enabled or scope["type"] != "http" or not self._selected(scope):
+            await self.app(scope, receive, send)
+            return
+
+        if not self._registered:
+            self.sampler.register_routes(scope.get("app"))
+            self._registered = True
+
+        self.sampler.begin()
+        token = _profiled_by.set(self.sampler)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _profiled_by.reset(token)
+            self.sampler.end(route_template(scope))
+
+    def _selected(self, scope) -> bool:
+        if self.sample_every and next(self._counter) % self.sample_every == 0:
+            return True
+        for name, value in scope["headers"]:
+            if name == b"x-admin-token":
+                return admin_token_matches(value.decode("latin-1"))
+        return False
+
+
+# Global instance, shared by the middleware and the admin endpoint
+profiler = StackSampler(interval=float(os.getenv("PROFILE_INTERVAL_MS", "5")) / 1000.0)
@@ -0,0 +1,212 @@
+import math
+import os
+import time
+from typing import Callable, Dict, Optional, Tuple
+
+import orjson
+
+# Route class -> (tokens per second, burst)
+DEFAULT_LIMITS = {
+    "cheap": (20.0, 40.0),
+    "llm": (1.0, 5.0),
+    "pdf": (0.2, 2.0),
+}
+
+
+def limits_from_env() -> Dict[str, Tuple[float, float]]:
+    """Read RATE_LIMIT_<CLASS>=rate,burst overrides, e.g. RATE_LIMIT_LLM=0.5,3"""
+    limits = dict(DEFAULT_LIMITS)
+    for route_class in limits:
+        raw = os.getenv(f"RATE_LIMIT_{route_class.upper()}")
+        if raw:
+            rate, _, burst = raw.partition(",")
+            limits[route_class] = (float(rate), float(burst or rate))
+    return limits
+
+
+class _Bucket:
+    __slots__ = ("tokens", "stamp", "expires")
+
+    def __init__(self, tokens: float, stamp: float):
+        self.tokens = tokens
+        self.stamp = stamp
+        self.expires = stamp
+
+
+class TokenBucketTable:
+    """
+    Token buckets for many keys sharing one rate and burst
+    A bucket that has refilled to the burst is indistinguishable from a new
+    one, so it is dropped by a timing wheel once it gets there. Buckets are
+    filed under the wheel slot of their expiry when created and only re-filed
+    when the wheel reaches them, so a request never moves a bucket around
+    """
+
+    def __init__(self, rate: float, burst: float, tick: float = 1.0, slots: int = 64):
+        self.rate = rate
+        self.burst = burst
+        self.tick = tick
+        self._buckets: Dict[str, _Bucket] = {}
+        self._wheel = [[] for _ in range(slots)]
+        self._cursor: Optional[int] = None
+
+    def take(self, key: str, now: float) -> float:
+        """Spend one token for key; returns 0 if allowed, else seconds until a token is available"""
+        current = int(now / self.tick)
+        if current != self._cursor:
+            self._turn(current, now)
+
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = self._buckets[key] = _Bucket(self.burst, now)
+            self._file(key, now + 1.0 / self.rate)
+        else:
+            bucket.tokens = min(self.burst, bucket.tokens + (now - bucket.stamp) * self.rate)
+            bucket.stamp = now
+
+        if bucket.tokens >= 1.0:
+            bucket.tokens -= 1.0
+            retry_after = 0.0
+        else:
+            retry_after = (1.0 - bucket.tokens) / self.rate
+        bucket.expires = now + (self.burst - bucket.tokens) / self.rate
+        return retry_after
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+    def _file(self, key: str, expires: float):
+        # Strictly after the current tick, so the slot is not one already swept
+        self._wheel[(int(expires / self.tick) + 1) % len(self._wheel)].append(key)
+
+    def _turn(self, current: int, now: float):
+        if self._cursor is None:
+            self._cursor = current
+            return
+        # After a long pause every slot is due, but each only needs sweeping once
+        start = max(self._cursor + 1, current - len(self._wheel) + 1)
+        self._cursor = current
+        for tick in range(start, current + 1):
+            index = tick % len(self._wheel)
+            due, self._wheel[index] = self._wheel[index], []
+            for key in due:
+                bucket = self._buckets.get(key)
+                if bucket is None:
+                    continue
+                if bucket.expires <= now:
+                    del self._buckets[key]
+                else:
+                    self._file(key, bucket.expires)
+
+
+def client_address(scope, proxy_hops: int) -> str:
+    """
+    The client's address as seen by the outermost of proxy_hops trusted
+    proxies: the proxy_hops-th X-Forwarded-For entry from the right, since
+    everything to its left was sent by the client and can be forged.
+    With no trusted proxies, the peer address
+    """
+    if proxy_hops:
+        forwarded = b",".join(value for name, value in scope.get("headers", ()) if name == b"x-forwarded-for")
+        hops = [hop.strip() for hop in forwarded.decode("latin-1").split(",") if hop.strip()]
+        if hops:
+            return hops[-min(proxy_hops, len(hops))]
+    client = scope.get("client")
+    return client[0] if client else ""
+
+
+class RateLimitMiddleware:
+    """
+    Pure ASGI middleware limiting requests per client and, on LLM and PDF
+    routes, per session
+    Buckets are only touched from the event loop thread, so no locking is needed
+    Routes not listed in `routes` are treated as cheap
+    Off unless RATE_LIMIT_ENABLED=1. Behind a reverse proxy every request
+    comes from the proxy, so set RATE_LIMIT_PROXY_HOPS to the number of
+    proxies in front of the app to key clients on X-Forwarded-For instead
+    """
+
+    def __init__(self, app, routes: Dict[str, str],
+                 limits: Optional[Dict[str, Tuple[float, float]]] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.app = app
+        self.routes = routes
+        self.clock = clock
+        self.enabled = os.getenv("RATE_LIMIT_ENABLED", "0") == "1"
+        self.proxy_hops = int(os.getenv("RATE_LIMIT_PROXY_HOPS", "0"))
+        limits = limits or limits_from_env()
+        self.clients = {route_class: TokenBucketTable(rate, burst) for route_class, (rate, burst) in limits.items()}
+        self.sessions = {route_class: TokenBucketTable(rate, burst) for route_class, (rate, burst) in limits.items()}
+
+    async def __call__(self, scope, receive, send):
+        if not self.enabled or scope["type"] not in ("http", "websocket"):
+            await self.app(scope, receive, send)
+            return
+
+        route_class = self.routes.get(scope["path"], "cheap")
+        now = self.clock()
+        retry_after = self.clients[route_class].take(client_address(scope, self.proxy_hops), now)
+
+        if not retry_after and route_class != "cheap" and scope["type"] == "http":
+            session_id, receive = await _peek_session_id(scope, receive)
+            if session_id:
+                retry_after = self.sessions[route_class].take(session_id, now)
+
+        if retry_after:
+            await _reject(scope, send, retry_after)
+            return
+        await self.app(scope, receive, send)
+
+
+async def _peek_session_id(scope, receive):
+    """Session id from the query string or JSON body, with a receive that replays the body"""
+    for pair in scope.get("query_string", b"").split(b"&"):
+        name, _, value = pair.partition(b"=")
+        if name == b"session_id" and value:
+            return value.decode("latin-1"), receive
+
+    chunks = []
+    while True:
+        message = await receive()
+        if message["type"] != "http.request":
+            # Client went away mid-body; let the app see the disconnect
+            async def replay_disconnect(message=message):
+                return message
+            return None, replay_disconnect
+        chunks.append(message.get("body", b""))
+        if not message.get("more_body", False):
+            break
+    body = b"".join(chunks)
+
+    replayed = False
+
+    async def replay():
+        nonlocal replayed
+        if replayed:
+            return await receive()
+        replayed = True
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    try:
+        payload = orjson.loads(body) if body else None
+    except orjson.JSONDecodeError:
+        payload = None
+    session_id = payload.get("session_id") if isinstance(payload, dict) else None
+    return (session_id if isinstance(session_id, str) else None), replay
+
+
+async def _reject(scope, send, retry_after: float):
+    if scope["type"] == "websocket":
+        await send({"type": "websocket.close", "code": 1008})
+        return
+    body = orjson.dumps({"detail": "Too many requests, please slow down."})
+    await send({
+        "type": "http.response.start",
+        "status": 429,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            (b"retry-after", str(math.ceil(retry_after)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,71 @@
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from typing import Callable, Dict, List
+
+from latency_budget import turn_remaining
+from metrics import cache_lookups
+from state import ConversationState
+
+prefetch_hits = cache_lookups.labels("rephrase_prefetch", "hit")
+prefetch_misses = cache_lookups.labels("rephrase_prefetch", "miss")
+
+
+class RephrasePrefetcher:
+    """
+    Speculatively rephrases upcoming assessment questions
+    The question plan is known once a domain is chosen, so while question k
+    is on screen questions k+1..k+lookahead are rephrased on a worker pool
+    and kept on the session for the next turn to pick up
+
+    A prefetch is only worth waiting for while it runs: one still queued
+    behind other sessions' prefetches is cancelled and the question is
+    rephrased directly, and a running one is waited for no longer than the
+    turn's remaining budget (max_wait outside a turn)
+    """
+
+    def __init__(self, rephrase: Callable[[str, str], str], lookahead: int = 2, max_workers: int = 4,
+                 max_wait: float = 1.5):
+        self._rephrase = rephrase
+        self.lookahead = lookahead
+        self.max_wait = max_wait
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="prefetch")
+
+    def schedule(self, state: ConversationState, question_plan: List[str], current_index: int, domain: str):
+        """Start rephrasing the questions that follow current_index"""
+        pending = self._pending(state)
+        for question in question_plan[current_index + 1:current_index + 1 + self.lookahead]:
+            if question not in pending:
+                pending[question] = self._executor.submit(self._rephrase, question, domain)
+
+    def take(self, state: ConversationState, question: str, domain: str) -> str:
+        """Return the prefetched rephrasing, falling back to a direct call"""
+        future = self._pending(state).pop(question, None)
+        if future is None or future.cancel():
+            prefetch_misses.inc()
+            return self._rephrase(question, domain)
+
+        wait = turn_remaining()
+        try:
+            rephrased = future.result(timeout=max(0.0, self.max_wait if wait is None else wait))
+        except FutureTimeout:
+            prefetch_misses.inc()
+            return self._rephrase(question, domain)
+        except Exception as e:
+            print(f"Warning: Prefetched rephrasing failed: {e}")
+            prefetch_misses.inc()
+            return self._rephrase(question, domain)
+        prefetch_hits.inc()
+        return rephrased
+
+    def discard(self, state: ConversationState):
+        """Drop any outstanding prefetches for a session"""
+        for future in self._pending(state).values():
+            future.cancel()
+        self._pending(state).clear()
+
+    def _pending(self, state: ConversationState) -> Dict[str, Future]:
+        # Transient, so kept under an underscore name on the session
+        pending = getattr(state, "_prefetched_rephrasings", None)
+        if pending is None:
+            pending = {}
+            state._prefetched_rephrasings = pending
+        return pending
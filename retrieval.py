@@ -0,0 +1,165 @@
+import math
+import re
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from domain_content import DETAILED_ROADMAPS, DOMAIN_QUESTIONS
+
+# Function words and chat filler: they say nothing about which snippet answers
+STOPWORDS = frozenset("""
+a about after all also am an and any are as at be been being but by can could do does did for from
+get give had has have how i if in into is it its just like me mean means more most my need of on
+or our should so some tell than that the their them then there these they this to up us use using
+want was we what when where which who why will with would you your
+explain learn know please start next better good best improve focus study recommend suggest
+help guide tutorial skill skills question questions thing things ok okay yes no thank thanks
+""".split())
+
+_TOKEN = re.compile(r"[a-z0-9+#]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercased content words, with a plain plural "s" dropped"""
+    tokens = []
+    for token in _TOKEN.findall(text.lower()):
+        if token in STOPWORDS:
+            continue
+        if len(token) > 3 and token.endswith("s") and not token.endswith("ss"):
+            token = token[:-1]
+        tokens.append(token)
+    return tokens
+
+
+class Snippet(NamedTuple):
+    domain: str
+    source: str
+    answer: str
+    docs: List[Dict[str, str]]
+
+
+class Hit(NamedTuple):
+    snippet: Snippet
+    score: float
+    confidence: float
+
+
+class BM25Index:
+    """
+    Okapi BM25 over short snippets, scored with NumPy
+    Postings are stored flat per term with their BM25 weight precomputed,
+    so a query is one vectorised add per query term and an argpartition
+    """
+
+    def __init__(self, snippets: Sequence[Snippet], texts: Sequence[str], k1: float = 1.2, b: float = 0.75):
+        self.snippets = list(snippets)
+        documents = [tokenize(text) for text in texts]
+        lengths = np.array([len(tokens) for tokens in documents], dtype=np.float64)
+        average = lengths.mean() if len(documents) else 1.0
+
+        postings: Dict[str, Dict[int, int]] = {}
+        for doc_id, tokens in enumerate(documents):
+            for token in tokens:
+                counts = postings.setdefault(token, {})
+                counts[doc_id] = counts.get(doc_id, 0) + 1
+
+        self.terms: Dict[str, int] = {}
+        self.idf = np.zeros(len(postings), dtype=np.float64)
+        offsets = [0]
+        doc_ids: List[int] = []
+        weights: List[float] = []
+        for term_id, (term, counts) in enumerate(postings.items()):
+            self.terms[term] = term_id
+            self.idf[term_id] = math.log(1 + (len(documents) - len(counts) + 0.5) / (len(counts) + 0.5))
+            for doc_id, tf in counts.items():
+                norm = k1 * (1 - b + b * lengths[doc_id] / average)
+                doc_ids.append(doc_id)
+                weights.append(self.idf[term_id] * tf * (k1 + 1) / (tf + norm))
+            offsets.append(len(doc_ids))
+
+        self._offsets = np.array(offsets, dtype=np.int64)
+        self._doc_ids = np.array(doc_ids, dtype=np.int32)
+        self._weights = np.array(weights, dtype=np.float64)
+        # An unseen query word is as informative as the rarest indexed one
+        self._unseen_idf = float(self.idf.max()) if len(self.idf) else 1.0
+        self._domains = np.array([snippet.domain for snippet in self.snippets])
+
+    def search(self, query: str, k: int = 3, domain: Optional[str] = None) -> List[Hit]:
+        """
+        Top k snippets for the query, optionally only from one domain
+        Confidence is the top score over that of an average-length snippet
+        containing every query word once, capped at 1
+        """
+        terms = dict.fromkeys(tokenize(query))
+        if not terms or not self.snippets:
+            return []
+
+        scores = np.zeros(len(self.snippets), dtype=np.float64)
+        ideal = 0.0
+        for term in terms:
+            term_id = self.terms.get(term)
+            if term_id is None:
+                ideal += self._unseen_idf
+                continue
+            ideal += self.idf[term_id]
+            start, end = self._offsets[term_id], self._offsets[term_id + 1]
+            scores[self._doc_ids[start:end]] += self._weights[start:end]
+        if domain is not None:
+            scores[self._domains != domain] = 0.0
+
+        k = min(k, len(scores))
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [Hit(self.snippets[i], float(scores[i]), min(1.0, float(scores[i] / ideal)))
+                for i in top if scores[i] > 0]
+
+    def best(self, query: str, domain: Optional[str] = None, min_confidence: float = 0.5) -> Optional[Hit]:
+        """
+        The top snippet if retrieval is confident about it. The session's domain
+        is searched first, the others only for queries of two or more words:
+        one word ("weather") out of context matches too much
+        """
+        scopes = [domain] if domain else []
+        if not domain or len(set(tokenize(query))) > 1:
+            scopes.append(None)
+        for scope in scopes:
+            hits = self.search(query, 1, scope)
+            if hits and hits[0].confidence >= min_confidence:
+                return hits[0]
+        return None
+
+
+def build_chat_index() -> BM25Index:
+    """Index the question explanations and every roadmap step, overview, career list and tips"""
+    snippets, texts = [], []
+
+    def add(domain, source, answer, text, docs=()):
+        snippets.append(Snippet(domain, source, answer, list(docs)))
+        texts.append(text)
+
+    for domain, questions in DOMAIN_QUESTIONS.items():
+        for question in questions:
+            add(domain, "explanation", question["exp"], f"{question['q']} {question['exp']}")
+
+    for domain, roadmap in DETAILED_ROADMAPS.items():
+        add(domain, "overview",
+            f"{roadmap['description']}. It takes {roadmap['duration']}; prerequisites: {roadmap['prerequisites']}.",
+            f"{roadmap['title']} {roadmap['description']} {roadmap['prerequisites']} {roadmap['duration']} how long time")
+        for step in roadmap['steps']:
+            topics = ", ".join(step['topics'])
+            projects = ", ".join(step['projects'])
+            add(domain, "roadmap",
+                f"Step {step['step']} of the {roadmap['title']}, {step['title']} ({step['duration']}), covers {topics}. "
+                f"Practice projects: {projects}.",
+                f"{step['title']} {topics} {projects} {' '.join(resource['title'] for resource in step['resources'])}",
+                step['resources'])
+        # The words people ask with are rarely in the lists themselves
+        add(domain, "careers", f"Typical roles: {', '.join(roadmap['career_paths'])}.",
+            f"career careers job jobs role position hire {' '.join(roadmap['career_paths'])}")
+        add(domain, "tips", f"Tips: {'; '.join(roadmap['tips'])}.", f"tip advice {' '.join(roadmap['tips'])}")
+
+    return BM25Index(snippets, texts)
+
+
+# Global instance, built once at startup
+chat_index = build_chat_index()
@@ -1,9 +1,36 @@
-import os
-import google.generativeai as genai
+import threading
+from collections import OrderedDict
 from typing import Optional
-from dotenv import load_dotenv
 
-load_dotenv()
+from gemini_client import gemini_client
+from latency_budget import llm_scheduler
+from metrics import cache_lookups, llm_calls
+
+class _WarmCache:
+    """Small bounded LRU filled by late LLM results"""
+
+    def __init__(self, name: str, maxsize: int = 512):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = cache_lookups.labels(name, "hit")
+        self._misses = cache_lookups.labels(name, "miss")
+
+    def get(self, key):
+        with self._lock:
+            value = self._data.get(key)
+            if value is not None:
+                self._data.move_to_end(key)
+        (self._misses if value is None else self._hits).inc()
+        return value
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
 
 class SafeGeminiWrapper:
     """
@@ -12,29 +39,43 @@ class SafeGeminiWrapper:
     """
     
     def __init__(self):
-        self.api_key = os.getenv("GEMINI_API_KEY")
+        self.api_key = gemini_client.api_key
         self.model = None
         
-        if self.api_key:
+        if gemini_client.is_configured():
             try:
-                genai.configure(api_key=self.api_key)
-                self.model = genai.GenerativeModel('gemini-pro')
+                self.model = gemini_client.get_model('gemini-pro')
             except Exception as e:
                 print(f"Warning: Failed to initialize Gemini API: {e}")
                 self.model = None
+        
+        # Late results from hedged calls land here for the next request
+        self._rephrase_cache = _WarmCache("rephrase")
+        self._acknowledgment_cache = _WarmCache("acknowledgment")
     
     def is_available(self) -> bool:
         """Check if Gemini API is available"""
         return self.model is not None
     
+    def _generate(self, prompt: str) -> str:
+        """Single blocking model call, run by the latency budget scheduler"""
+        response = self.model.generate_content(prompt)
+        return response.text.strip()
+    
     def rephrase_question(self, original_question: str, domain: str) -> str:
         """
         Safely rephrase assessment questions
         ONLY for making questions more conversational
         """
         if not self.is_available():
+            llm_calls.labels("rephrase", "unavailable").inc()
             return original_question
         
+        cache_key = (original_question, domain)
+        cached = self._rephrase_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = f"""
             STRICT INSTRUCTIONS:
@@ -52,14 +93,19 @@ class SafeGeminiWrapper:
             Rephrased question:
             """
             
-            response = self.model.generate_content(prompt)
-            rephrased = response.text.strip()
-            
-            # Safety check - if response is too different, use original
-            if len(rephrased) > len(original_question) * 2:
-                return original_question
+            def call():
+                rephrased = self._generate(prompt)
+                
+                # Safety check - if response is too different, use original
+                if len(rephrased) > len(original_question) * 2:
+                    return original_question
+                
+                return rephrased
             
-            return rephrased
+            return llm_scheduler.run(
+                "rephrase", call, fallback=original_question,
+                on_late=lambda text: self._rephrase_cache.put(cache_key, text)
+            )
             
         except Exception as e:
             print(f"Warning: Question rephrasing failed: {e}")
@@ -71,8 +117,14 @@ class SafeGeminiWrapper:
         ONLY for natural conversation flow
         """
         if not self.is_available():
+            llm_calls.labels("acknowledgment", "unavailable").inc()
             return self._get_fallback_acknowledgment(answer_type)
         
+        cache_key = (user_answer.lower().strip(), answer_type)
+        cached = self._acknowledgment_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             prompt = f"""
             STRICT INSTRUCTIONS:
@@ -90,14 +142,21 @@ class SafeGeminiWrapper:
             Brief acknowledgment:
             """
             
-            response = self.model.generate_content(prompt)
-            acknowledgment = response.text.strip()
+            fallback = self._get_fallback_acknowledgment(answer_type)
             
-            # Safety check - ensure it's brief
-            if len(acknowledgment) > 100:
-                return self._get_fallback_acknowledgment(answer_type)
+            def call():
+                acknowledgment = self._generate(prompt)
+                
+                # Safety check - ensure it's brief
+                if len(acknowledgment) > 100:
+                    return fallback
+                
+                return acknowledgment
             
-            return acknowledgment
+            return llm_scheduler.run(
+                "acknowledgment", call, fallback=fallback,
+                on_late=lambda text: self._acknowledgment_cache.put(cache_key, text)
+            )
             
         except Exception as e:
             print(f"Warning: Acknowledgment generation failed: {e}")
@@ -109,6 +168,7 @@ class SafeGeminiWrapper:
         ONLY for brief explanations during assessment
         """
         if not self.is_available():
+            llm_calls.labels("clarification", "unavailable").inc()
             return "That's a great question! Let me continue with the assessment and we can discuss this more at the end."
         
         try:
@@ -128,14 +188,19 @@ class SafeGeminiWrapper:
             Brief answer:
             """
             
-            response = self.model.generate_content(prompt)
-            answer = response.text.strip()
-            
-            # Ensure it ends with continuation prompt
-            if "continue with the assessment" not in answer.lower():
-                answer += " Now, let's continue with the assessment question."
+            def call():
+                answer = self._generate(prompt)
+                
+                # Ensure it ends with continuation prompt
+                if "continue with the assessment" not in answer.lower():
+                    answer += " Now, let's continue with the assessment question."
+                
+                return answer
             
-            return answer
+            return llm_scheduler.run(
+                "clarification", call,
+                fallback="That's a great question! Let me continue with the assessment and we can discuss this more at the end."
+            )
             
         except Exception as e:
             print(f"Warning: Clarification answer failed: {e}")
@@ -148,6 +213,7 @@ class SafeGeminiWrapper:
         ONLY used at the end of assessment
         """
         if not self.is_available():
+            llm_calls.labels("recommendation", "unavailable").inc()
             return self._get_fallback_recommendation(user_name, domain, level)
         
         try:
@@ -171,8 +237,10 @@ class SafeGeminiWrapper:
             Personalized recommendation:
             """
             
-            response = self.model.generate_content(prompt)
-            return response.text.strip()
+            return llm_scheduler.run(
+                "recommendation", lambda: self._generate(prompt),
+                fallback=self._get_fallback_recommendation(user_name, domain, level)
+            )
             
         except Exception as e:
             print(f"Warning: Recommendation generation failed: {e}")
@@ -1,2 +1,2 @@
 #!/bin/bash
-uvicorn main:app --host 0.0.0.0 --port $PORT
\ No newline at end of file
+uvicorn main:app --host 0.0.0.0 --port $PORT --timeout-graceful-shutdown 10
\ No newline at end of file
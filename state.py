@@ -1,6 +1,6 @@
 #State.py
 from enum import Enum
-from typing import Dict, Optional
+from typing import Any, Dict, Optional
 
 
 class ConversationStage(str, Enum):
@@ -12,6 +12,14 @@ class ConversationStage(str, Enum):
     RESULT = "result"
 
 
+# Position of each stage in the flow; StateController indexes its dispatch table by it
+for _ordinal, _stage in enumerate(ConversationStage):
+    _stage.ordinal = _ordinal
+
+# Value lookup without going through EnumMeta.__call__, for bulk restores
+_STAGES = {stage.value: stage for stage in ConversationStage}
+
+
 class UserLevel(str, Enum):
     BEGINNER = "Beginner"
     INTERMEDIATE = "Intermediate"
@@ -35,6 +43,39 @@ class ConversationState:
         self.score: int = 0
         self.answers: Dict[str, str] = {}
 
+    # ---------- SERIALISATION ----------
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Public attributes as plain data; underscore attributes (caches, locks) are runtime only"""
+        data = {key: value for key, value in self.__dict__.items() if not key.startswith("_")}
+        data["stage"] = self.stage.value
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "ConversationState":
+        state = cls()
+        state.__dict__.update(data)
+        state.stage = _STAGES[data.get("stage", "ask_name")]
+        return state
+
+    # ---------- ASSESSMENT PROGRESS (main_v2) ----------
+
+    def add_answer(self, question_id: str, answer: str):
+        self.answers[question_id] = answer
+
+    @property
+    def current_score(self) -> int:
+        return self.score
+
+    @property
+    def max_possible_score(self) -> int:
+        # Every question is worth one point
+        return getattr(self, "total_questions", 0)
+
+    def get_progress_percentage(self) -> float:
+        total = getattr(self, "total_questions", 0)
+        return round(self.current_question_index / total * 100, 1) if total else 0.0
+
     # ---------- ENTITY EXTRACTION (NO RAW STORAGE) ----------
 
     def extract_name(self, text: str) -> bool:
@@ -1,41 +1,104 @@
 #State Controller.py
-from typing import Tuple
+from string import Formatter
+from typing import Callable, List, NamedTuple, Optional, Tuple
 from state import ConversationState, ConversationStage
 
 
-class StateController:
-    def get_current_question(self, state: ConversationState) -> str:
-        if state.stage == ConversationStage.ASK_NAME:
-            return "Let's start with some basic information. What's your name?"
+class Transition(NamedTuple):
+    """One row of the flow: how a stage's input is checked and stored, and where it leads"""
+    name: str
+    prompt: str                                                   # str.format template over state attributes
+    validator: Optional[Callable[[str], bool]] = None             # cheap check on the raw text
+    extractor: Optional[Callable[[ConversationState, str], bool]] = None  # stores the slot, False if it can't
+    next_stage: Optional[ConversationStage] = None
+    retry: str = "Invalid state."
+
+
+def _has_text(text: str) -> bool:
+    return bool(text and not text.isspace())
+
+
+CONTINUE = "Let's continue with your assessment."
+
+# Stages without an extractor are driven by the app (domain choice, assessment,
+# results); advance() refuses them
+TRANSITIONS = {
+    ConversationStage.ASK_NAME: Transition(
+        "Personal info: name",
+        "Let's start with some basic information. What's your name?",
+        _has_text, ConversationState.extract_name, ConversationStage.ASK_LOCATION,
+        "Please tell me your name using letters only."),
+    ConversationStage.ASK_LOCATION: Transition(
+        "Personal info: location",
+        "Nice to meet you, {user_name}! Where are you located?",
+        _has_text, ConversationState.extract_location, ConversationStage.ASK_EDUCATION,
+        "Please tell me your city or country."),
+    ConversationStage.ASK_EDUCATION: Transition(
+        "Personal info: education",
+        "What's your educational background or field of study?",
+        _has_text, ConversationState.extract_education, ConversationStage.DOMAIN_SELECTION,
+        "Please tell me your educational background."),
+    ConversationStage.DOMAIN_SELECTION: Transition(
+        "Domain selection",
+        "Which tech domain are you interested in? (Frontend, Backend, DevOps, ML, etc.)"),
+    ConversationStage.DOMAIN_EVALUATION: Transition("Assessment", CONTINUE),
+    ConversationStage.RESULT: Transition("Results", CONTINUE),
+}
+
+PERSONAL_INFO_STAGES = tuple(stage for stage, row in TRANSITIONS.items() if row.extractor)
+
+
+def _compile_prompt(template: str) -> Callable[[ConversationState], str]:
+    """Constant prompts return their string; templates read only the fields they name"""
+    fields = [field for _, field, _, _ in Formatter().parse(template) if field]
+    if not fields:
+        return lambda state: template
+    return lambda state: template.format(**{field: getattr(state, field) for field in fields})
 
-        if state.stage == ConversationStage.ASK_LOCATION:
-            return f"Nice to meet you, {state.user_name}! Where are you located?"
 
-        if state.stage == ConversationStage.ASK_EDUCATION:
-            return "What's your educational background or field of study?"
+def _compile_step(row: Transition) -> Callable[[ConversationState, str], Tuple[bool, str]]:
+    if row.extractor is None:
+        result = (False, row.retry)
+        return lambda state, text: result
 
-        if state.stage == ConversationStage.DOMAIN_SELECTION:
-            return "Which tech domain are you interested in? (Frontend, Backend, DevOps, ML, etc.)"
+    validator, extractor, next_stage = row.validator, row.extractor, row.next_stage
+    rejected = (False, row.retry)
+    next_question = _compile_prompt(TRANSITIONS[next_stage].prompt)
 
-        return "Let's continue with your assessment."
+    def step(state: ConversationState, text: str) -> Tuple[bool, str]:
+        if (validator is None or validator(text)) and extractor(state, text):
+            state.stage = next_stage
+            return True, next_question(state)
+        return rejected
+    return step
+
+
+def _compile(transitions) -> Tuple[List, List, List]:
+    """Dispatch arrays indexed by stage ordinal: prompt, step and name per stage"""
+    missing = [stage for stage in ConversationStage if stage not in transitions]
+    if missing:
+        raise ValueError(f"No transition for stages: {', '.join(stage.value for stage in missing)}")
+    questions, steps, names = [], [], []
+    for stage in ConversationStage:
+        row = transitions[stage]
+        questions.append(_compile_prompt(row.prompt))
+        steps.append(_compile_step(row))
+        names.append(row.name)
+    return questions, steps, names
+
+
+_QUESTIONS, _STEPS, _NAMES = _compile(TRANSITIONS)
+
+
+class StateController:
+    def get_current_question(self, state: ConversationState) -> str:
+        return _QUESTIONS[state.stage.ordinal](state)
 
     def advance(self, state: ConversationState, user_input: str) -> Tuple[bool, str]:
-        if state.stage == ConversationStage.ASK_NAME:
-            if state.extract_name(user_input):
-                state.stage = ConversationStage.ASK_LOCATION
-                return True, self.get_current_question(state)
-            return False, "Please tell me your name using letters only."
-
-        if state.stage == ConversationStage.ASK_LOCATION:
-            if state.extract_location(user_input):
-                state.stage = ConversationStage.ASK_EDUCATION
-                return True, self.get_current_question(state)
-            return False, "Please tell me your city or country."
-
-        if state.stage == ConversationStage.ASK_EDUCATION:
-            if state.extract_education(user_input):
-                state.stage = ConversationStage.DOMAIN_SELECTION
-                return True, self.get_current_question(state)
-            return False, "Please tell me your educational background."
-
-        return False, "Invalid state."
+        return _STEPS[state.stage.ordinal](state, user_input)
+
+    def get_stage_name(self, state: ConversationState) -> str:
+        return _NAMES[state.stage.ordinal]
+
+    def is_complete(self, state: ConversationState) -> bool:
+        return state.stage is ConversationStage.RESULT
@@ -0,0 +1,121 @@
+"""
+Test script for the streaming assessment analytics
+Checks the aggregates against a scan of the sessions and that snapshots stay consistent under concurrent updates
+"""
+
+import sys
+import os
+import random
+import tempfile
+import threading
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+
+import main
+from analytics import FUNNEL, AssessmentAnalytics, analytics
+from feedback_log import feedback_log
+from state import ConversationState
+
+
+def _run_sessions(rng):
+    """A mix of abandoned, partial and finished assessments over the HTTP handlers"""
+    session_ids = []
+    for n in range(60):
+        session_id = main.start_conversation()["session_id"]
+        session_ids.append(session_id)
+        if n % 5 == 0:
+            continue
+        main.submit_personal_info(main.PersonalInfoRequest(session_id=session_id, name="Asha", location="Pune", education="BSc"))
+        if n % 5 == 1:
+            continue
+        main.submit_answer(main.UserAnswerRequest(session_id=session_id, answer=rng.choice(main.VALID_DOMAINS)))
+        for _ in range(6 if n % 5 > 2 else rng.randrange(1, 6)):
+            main.submit_answer(main.UserAnswerRequest(session_id=session_id, answer=rng.choice(["yes", "no"])))
+        if n % 5 == 4:
+            main.submit_feedback(main.FeedbackRequest(session_id=session_id, feedback="useful"))
+    return session_ids
+
+
+def test_aggregates_match_a_scan():
+    """Funnel, levels, scores and per-question tallies equal those counted from the sessions"""
+    analytics.reset()
+    original = feedback_log.path
+    with tempfile.TemporaryDirectory() as directory:
+        feedback_log.path = os.path.join(directory, "feedback.jsonl")
+        try:
+            session_ids = _run_sessions(random.Random(5))
+        finally:
+            feedback_log.close()
+            feedback_log.path = original
+    report = TestClient(main.app).get("/analytics").json()
+    states = [main.sessions[session_id] for session_id in session_ids]
+
+    answered = [state for state in states if getattr(state, 'question_count', 0)]
+    completed = [state for state in answered if state.question_count >= 6]
+    reached = [len(states), sum(state.user_name is not None for state in states),
+               sum(state.selected_domain is not None for state in states), len(answered), len(completed)]
+    assert [stage["reached"] for stage in report["funnel"]] == reached
+    assert sum(stage["stopped_here"] for stage in report["funnel"]) == len(states)
+
+    for domain, summary in report["domains"].items():
+        finished = [state for state in completed if state.selected_domain == domain]
+        assert summary["completed"] == len(finished)
+        assert summary["scores"] == [sum(state.score == s for state in finished) for s in range(7)]
+        asked = [answer for state in answered if state.selected_domain == domain for answer in state.answers]
+        for question in summary["questions"]:
+            mine = [answer["answer"] for answer in asked if answer["question"] == question["question"]]
+            assert (question["yes"], question["no"]) == (mine.count("Yes"), mine.count("No")), question
+    assert report["feedback"]["total"] == sum(1 for n in range(60) if n % 5 == 4)
+    print(f"✓ aggregates match a scan ({' → '.join(f'{s}:{r}' for s, r in zip(FUNNEL, reached))})")
+
+
+def test_result_counted_once():
+    """Submitting the batch again, or results regenerated for a session, do not count it twice"""
+    analytics.reset()
+    client = TestClient(main.app)
+    session_id = client.post("/start").json()["session_id"]
+    client.post("/plan", json={"session_id": session_id, "domain": "backend"})
+    for _ in range(2):
+        client.post("/answers/batch", json={"session_id": session_id, "answers": ["yes"] * 6})
+        client.post("/answers/batch", json={"session_id": session_id, "answers": []})
+    main._generate_detailed_results(main.sessions[session_id], main._get_session_questions(session_id, "backend"))
+
+    report = analytics.snapshot()
+    backend = report["domains"]["backend"]
+    assert report["funnel"][FUNNEL.index("completed")]["reached"] == 1
+    assert backend["completed"] == 1 and backend["levels"]["Advanced"] == 1 and backend["scores"][6] == 1
+    print("✓ a finished session is counted once")
+
+
+def test_snapshot_is_consistent():
+    """Completions counted in the funnel and in the level tallies never disagree in a snapshot"""
+    stats = AssessmentAnalytics()
+    stop = threading.Event()
+
+    def finish_assessments():
+        while not stop.is_set():
+            state = ConversationState()
+            state.selected_domain = "backend"
+            state.score = 4
+            stats.record_result(state, "Intermediate")
+
+    writers = [threading.Thread(target=finish_assessments) for _ in range(3)]
+    for writer in writers:
+        writer.start()
+    try:
+        for _ in range(300):
+            report = stats.snapshot()
+            completed = report["funnel"][FUNNEL.index("completed")]["reached"]
+            assert completed == report["domains"]["backend"]["completed"] == report["domains"]["backend"]["scores"][4]
+    finally:
+        stop.set()
+        for writer in writers:
+            writer.join()
+    print(f"✓ 300 snapshots consistent under concurrent updates ({completed} results)")
+
+
+if __name__ == "__main__":
+    test_aggregates_match_a_scan()
+    test_result_counted_once()
+    test_snapshot_is_consistent()
@@ -0,0 +1,73 @@
+"""
+Test script for the answer normaliser
+Checks word-boundary matching, multi-word phrases, negations and weak openers
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from answer_normalizer import Verdict, normalize_answer
+from engine import classify_answer
+from intent_detector import IntentDetector
+
+
+CASES = [
+    ("yes", Verdict.YES),
+    ("Y", Verdict.YES),
+    ("yes, I have used it at work", Verdict.YES),
+    ("done", Verdict.YES),
+    ("no", Verdict.NO),
+    ("nope", Verdict.NO),
+    ("not really", Verdict.NO),
+    ("not at all", Verdict.NO),
+    ("haven't used it", Verdict.NO),
+    ("definitely not", Verdict.NO),
+    ("not familiar", Verdict.NO),
+    ("kind of, a little bit", Verdict.PARTIAL),
+    ("not sure", Verdict.PARTIAL),
+    ("3 projects with React", Verdict.NUMERIC),
+    # "i have" / "i do" open the clause but the rest of it decides
+    ("I do", Verdict.YES),
+    ("I have used it a lot", Verdict.YES),
+    ("I have never used it", Verdict.NO),
+    ("i have no idea", Verdict.NO),
+    ("I do sometimes", Verdict.PARTIAL),
+    ("I dont think so", Verdict.NO),
+    # Their bare negative forms are a no, but not when more words follow
+    ("I don't", Verdict.NO),
+    ("i dont", Verdict.NO),
+    ("I haven't", Verdict.NO),
+    ("I don't, sorry", Verdict.NO),
+    ("I haven't used it", Verdict.NO),
+    ("I don't know", Verdict.UNCLEAR),
+    ("i don't understand", Verdict.UNCLEAR),
+    ("that's right", Verdict.YES),
+    ("right now I am learning", Verdict.UNCLEAR),
+    # Substrings of other words are not answers
+    ("I know", Verdict.UNCLEAR),
+    ("nobody taught me", Verdict.UNCLEAR),
+    ("is that right?", Verdict.UNCLEAR),
+]
+
+
+def test_verdicts():
+    """Each answer gets the expected verdict"""
+    wrong = [(text, normalize_answer(text), expected) for text, expected in CASES if normalize_answer(text) is not expected]
+    for text, expected in CASES:
+        print(f"{'✓' if normalize_answer(text) is expected else '✗'} {text!r} → {normalize_answer(text).name}")
+    assert not wrong
+
+
+def test_callers_agree():
+    """engine.classify_answer and classify_answer_type are views of the same verdict"""
+    detector = IntentDetector()
+    for text, expected in CASES:
+        assert detector.classify_answer_type(text) == expected.value
+        assert classify_answer(text) == {Verdict.YES: "YES", Verdict.NO: "NO"}.get(expected, "UNKNOWN")
+    print("✓ engine and IntentDetector agree with the normaliser")
+
+
+if __name__ == "__main__":
+    test_verdicts()
+    test_callers_agree()
@@ -0,0 +1,100 @@
+"""
+Test script for the one-round-trip assessment endpoints
+Checks /plan and /answers/batch over HTTP: the happy path, a wrong number
+of answers, answers that are not yes/no, and a batch for a finished session
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+
+import main
+
+client = TestClient(main.app)
+
+
+def _planned_session(domain="backend"):
+    session_id = client.post("/start").json()["session_id"]
+    plan = client.post("/plan", json={"session_id": session_id, "domain": domain}).json()
+    return session_id, plan
+
+
+def test_plan_selects_domain():
+    """/plan picks the domain and returns the six questions /answer would ask, in order"""
+    session_id, plan = _planned_session("Data Analytics")
+    assert plan["domain"] == "data analytics" and plan["answered"] == 0
+    assert plan["questions"] == [q["q"] for q in main._get_session_questions(session_id, "data analytics")]
+    assert client.post("/plan", json={"session_id": session_id}).json() == plan
+
+    unknown = client.post("/start").json()["session_id"]
+    assert client.post("/plan", json={"session_id": unknown, "domain": "cooking"}).json() == {
+        "message": "Please select from the available domains only."}
+    assert client.post("/plan", json={"session_id": "missing"}).json() == {"message": "Session not found"}
+    print(f"✓ /plan returns {len(plan['questions'])} questions for data analytics")
+
+
+def test_batch_completes_assessment():
+    """A full batch scores every answer and returns the results"""
+    session_id, plan = _planned_session()
+    answers = ["yes", "no", "yeah", "nope", "yes", "I have never used it"]
+    reply = client.post("/answers/batch", json={"session_id": session_id, "answers": answers}).json()
+    assert reply["completed"] is True
+    assert reply["recommendations"]["score"] == "3/6" and reply["recommendations"]["level"] == "Intermediate"
+    missed = [area["question"] for area in reply["recommendations"]["areas_to_improve"]]
+    assert missed == [plan["questions"][i] for i in (1, 3, 5)]
+    print(f"✓ batch scored {reply['recommendations']['score']}")
+
+
+def test_batch_after_some_answers():
+    """The batch covers only the questions not yet answered one by one"""
+    session_id, plan = _planned_session("devops")
+    client.post("/answer", json={"session_id": session_id, "answer": "yes"})
+    client.post("/answer", json={"session_id": session_id, "answer": "yes"})
+    reply = client.post("/answers/batch", json={"session_id": session_id, "answers": ["yes"] * 4}).json()
+    assert reply["completed"] is True and reply["recommendations"]["score"] == "6/6"
+    print("✓ batch finishes a half-done assessment")
+
+
+def test_batch_length_mismatch():
+    """Too few or too many answers are refused and change nothing"""
+    session_id, _ = _planned_session()
+    for answers in (["yes"] * 5, ["yes"] * 7):
+        reply = client.post("/answers/batch", json={"session_id": session_id, "answers": answers}).json()
+        assert reply == {"message": f"Expected 6 answers, got {len(answers)}.", "completed": False}
+    assert main.sessions[session_id].question_count == 0
+    print("✓ wrong number of answers refused")
+
+
+def test_batch_invalid_answers():
+    """Answers that are not a clear yes or no are reported by position; none are recorded"""
+    session_id, _ = _planned_session()
+    answers = ["yes", "maybe", "no", "what is a REST API?", "yes", "no"]
+    reply = client.post("/answers/batch", json={"session_id": session_id, "answers": answers}).json()
+    assert reply["completed"] is False and reply["invalid_answers"] == [1, 3]
+    assert main.sessions[session_id].question_count == 0 and main.sessions[session_id].answers == []
+
+    no_domain = client.post("/start").json()["session_id"]
+    reply = client.post("/answers/batch", json={"session_id": no_domain, "answers": ["yes"] * 6}).json()
+    assert reply == {"message": "Please select a domain before submitting answers.", "completed": False}
+    print("✓ invalid answers refused by position")
+
+
+def test_batch_for_completed_session():
+    """Once finished, even an empty batch is refused rather than re-scored"""
+    session_id, _ = _planned_session()
+    client.post("/answers/batch", json={"session_id": session_id, "answers": ["yes"] * 6})
+    for answers in ([], ["yes"]):
+        reply = client.post("/answers/batch", json={"session_id": session_id, "answers": answers}).json()
+        assert reply == {"message": "This assessment is already complete.", "completed": True}
+    print("✓ finished assessment not scored twice")
+
+
+if __name__ == "__main__":
+    test_plan_selects_domain()
+    test_batch_completes_assessment()
+    test_batch_after_some_answers()
+    test_batch_length_mismatch()
+    test_batch_invalid_answers()
+    test_batch_for_completed_session()
@@ -0,0 +1,125 @@
+"""
+Test script for the fuzzy domain resolver
+Checks the edit distance, delete-index lookups, aliases, typos and Data/*.json coverage
+"""
+
+import sys
+import os
+import glob
+import json
+import random
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from domain_resolver import DOMAIN_ALIASES, DeleteIndex, domain_resolver, levenshtein
+
+
+def _reference_distance(a, b):
+    previous = list(range(len(b) + 1))
+    for i, char_a in enumerate(a, 1):
+        current = [i]
+        for j, char_b in enumerate(b, 1):
+            current.append(min(previous[j] + 1, current[j - 1] + 1, previous[j - 1] + (char_a != char_b)))
+        previous = current
+    return previous[-1]
+
+
+def test_levenshtein_matches_dynamic_programming():
+    """The bit-parallel distance agrees with the textbook table on random strings"""
+    rng = random.Random(7)
+    for _ in range(5000):
+        a = "".join(rng.choice("abcd ") for _ in range(rng.randrange(0, 20)))
+        b = "".join(rng.choice("abcd ") for _ in range(rng.randrange(0, 20)))
+        assert levenshtein(a, b) == _reference_distance(a, b), (a, b)
+    print("✓ levenshtein agrees with the DP reference")
+
+
+def _typo(rng, word, edits):
+    """word with edits random insertions, deletions, substitutions or transpositions"""
+    chars = list(word)
+    for _ in range(edits):
+        position = rng.randrange(len(chars) + 1)
+        kind = rng.choice("idst") if len(chars) > 1 else "i"
+        if kind == "i":
+            chars.insert(position, rng.choice("aeiost x"))
+        elif kind == "d":
+            del chars[min(position, len(chars) - 1)]
+        elif kind == "s":
+            chars[min(position, len(chars) - 1)] = rng.choice("aeiost x")
+        else:
+            position = min(position, len(chars) - 2)
+            chars[position], chars[position + 1] = chars[position + 1], chars[position]
+    return "".join(chars)
+
+
+def test_delete_index_search_is_exhaustive():
+    """Every word within the bound is found, and nothing further away"""
+    words = list(dict.fromkeys(alias for aliases in DOMAIN_ALIASES.values() for alias in aliases))
+    index = DeleteIndex(words)
+    rng = random.Random(3)
+    for _ in range(2000):
+        query = _typo(rng, rng.choice(words), rng.randrange(0, 4))
+        for max_distance in (1, 2):
+            expected = sorted((levenshtein(query, word), word) for word in words
+                              if levenshtein(query, word) <= max_distance)
+            assert index.search(query, max_distance) == expected, (query, max_distance)
+    print("✓ delete index search matches a linear scan")
+
+
+CASES = [
+    ("backend", "backend"),
+    ("bakend", "backend"),
+    ("I want to do machine learning", "machine learning"),
+    ("machne lerning", "machine learning"),
+    ("ML", "machine learning"),
+    ("dsa", "algorithms"),
+    ("DS & A", "algorithms"),
+    ("sec", "cybersecurity"),
+    ("cyber security", "cybersecurity"),
+    ("infra", "devops"),
+    ("web dev", "frontend"),
+    ("game dev", "game development"),
+    ("mobile apps", "mobile development"),
+    # The longest alias wins over a shorter one earlier in the sentence
+    ("ai or maybe data structures and algorithms", "algorithms"),
+    # Exact aliases are found however long the answer; typos only in its first words
+    ("well " * 20 + "backend", "backend"),
+    # Too short or too vague to mean a domain
+    ("a", None),
+    ("data", None),
+    ("hello", None),
+]
+
+
+def test_resolutions():
+    """Aliases and typos resolve; fragments do not"""
+    for text, expected in CASES:
+        match = domain_resolver.resolve(text)
+        got = match.domain if match else None
+        print(f"{'✓' if got == expected else '✗'} {text!r} → {got}" + (f" ({match.confidence:.2f})" if match else ""))
+        assert got == expected
+
+
+def test_confidence_ranks_exact_above_typos():
+    """An exact alias is certain; a typo is not"""
+    assert domain_resolver.resolve("backend").confidence == 1.0
+    assert 0.75 <= domain_resolver.resolve("bakend").confidence < 1.0
+    print("✓ exact aliases outrank typos")
+
+
+def test_covers_every_data_domain():
+    """Each question bank's domain name resolves exactly"""
+    root = os.path.dirname(os.path.abspath(__file__))
+    for path in sorted(glob.glob(os.path.join(root, "Data", "*.json"))):
+        with open(path) as f:
+            name = json.load(f)["domain"]
+        match = domain_resolver.resolve(name)
+        print(f"{'✓' if match and match.confidence == 1.0 else '✗'} {name} → {match.domain if match else None}")
+        assert match and match.confidence == 1.0
+
+
+if __name__ == "__main__":
+    test_levenshtein_matches_dynamic_programming()
+    test_delete_index_search_is_exhaustive()
+    test_resolutions()
+    test_confidence_ranks_exact_above_typos()
+    test_covers_every_data_domain()
@@ -0,0 +1,100 @@
+"""
+Test script for the append-only feedback log
+Checks records reach the file, rotation by size and age, and dropping when the queue is full
+"""
+
+import sys
+import os
+import json
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from feedback_log import FeedbackLog, records_dropped
+from feedback_log import feedback_log as global_feedback_log
+
+
+def _read(path):
+    with open(path) as f:
+        return [json.loads(line) for line in f]
+
+
+def test_records_are_written():
+    """Queued feedback is batched to JSONL by the writer thread"""
+    with tempfile.TemporaryDirectory() as directory:
+        log = FeedbackLog(os.path.join(directory, "feedback.jsonl"), flush_interval=0.05)
+        for n in range(10):
+            assert log.submit(f"s{n}", "backend", "Beginner", f"feedback {n}")
+        deadline = time.time() + 5
+        while time.time() < deadline and not os.path.exists(log.path):
+            time.sleep(0.02)
+        log.close()
+        records = _read(log.path)
+    assert [record["feedback"] for record in records] == [f"feedback {n}" for n in range(10)]
+    assert records[0]["session_id"] == "s0" and records[0]["level"] == "Beginner" and records[0]["ts"].endswith("+00:00")
+    print(f"✓ {len(records)} records written")
+
+
+def test_rotation():
+    """The log rolls over to numbered backups by size and by age"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "feedback.jsonl")
+        log = FeedbackLog(path, batch_size=1, max_bytes=300, backups=2)
+        for n in range(12):
+            log.submit("s", "devops", None, "x" * 100)
+            log.close()
+        files = sorted(os.listdir(directory))
+        assert files == ["feedback.jsonl", "feedback.jsonl.1", "feedback.jsonl.2"]
+        assert all(len(_read(os.path.join(directory, name))) == 2 for name in files[1:])
+
+        aged = FeedbackLog(os.path.join(directory, "aged.jsonl"), rotate_seconds=0)
+        aged.submit("s", None, None, "first")
+        aged.close()
+        aged.submit("s", None, None, "second")
+        aged.close()
+        assert [r["feedback"] for r in _read(os.path.join(directory, "aged.jsonl.1"))] == ["first"]
+    print("✓ rotation by size keeps 2 backups, by age rolls every write")
+
+
+def test_full_queue_drops():
+    """Past max_queue, records are dropped and counted instead of blocking"""
+    with tempfile.TemporaryDirectory() as directory:
+        log = FeedbackLog(os.path.join(directory, "feedback.jsonl"), max_queue=3, flush_interval=60)
+        log._writer = object()  # a writer that never drains
+        before = records_dropped.value()
+        accepted = [log.submit("s", None, None, str(n)) for n in range(5)]
+        log._writer = None
+        log.close()
+        assert accepted == [True, True, True, False, False]
+        assert records_dropped.value() - before == 2
+        assert len(_read(log.path)) == 3
+    print("✓ overflow dropped and counted")
+
+
+def test_feedback_endpoint_logs():
+    """/feedback records the session's domain and, once assessed, its level"""
+    with tempfile.TemporaryDirectory() as directory:
+        original = global_feedback_log.path
+        global_feedback_log.close()
+        global_feedback_log.path = os.path.join(directory, "feedback.jsonl")
+        try:
+            session_id = main.start_conversation()["session_id"]
+            main.get_question_plan(main.PlanRequest(session_id=session_id, domain="frontend"))
+            main.submit_answers_batch(main.BatchAnswerRequest(session_id=session_id, answers=["yes"] * 6))
+            main.submit_feedback(main.FeedbackRequest(session_id=session_id, feedback="Loved it"))
+            main.submit_feedback(main.FeedbackRequest(session_id="unknown", feedback="Lost session"))
+            global_feedback_log.close()
+            records = _read(global_feedback_log.path)
+        finally:
+            global_feedback_log.path = original
+    assert [(r["domain"], r["level"], r["feedback"]) for r in records] == [
+        ("frontend", "Advanced", "Loved it"), (None, None, "Lost session")]
+    print("✓ /feedback writes to the log")
+
+
+if __name__ == "__main__":
+    test_records_are_written()
+    test_rotation()
+    test_full_queue_drops()
+    test_feedback_endpoint_logs()
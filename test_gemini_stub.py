@@ -0,0 +1,65 @@
+"""
+Test script for the local Gemini stub
+Checks deterministic sampling, templated responses and streaming
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from gemini_stub import StubBehaviour, StubModel, StubError
+
+
+def test_templated_responses():
+    """Prompt fields are substituted into the matching template"""
+    model = StubModel("gemini-pro", StubBehaviour())
+    prompt = """
+    Domain: backend
+    Original question: Have you used Docker?
+
+    Rephrased question:
+    """
+    text = model.generate_content(prompt).text
+    print(f"{'✓' if text == 'Have you used Docker?' else '✗'} rephrase template → {text}")
+    assert text == "Have you used Docker?"
+
+
+def test_sampling_is_deterministic():
+    """The same seed yields the same latencies and failures"""
+    first = StubBehaviour(latency="lognormal:200:0.5", error_rate=0.3, seed=7)
+    second = StubBehaviour(latency="lognormal:200:0.5", error_rate=0.3, seed=7)
+    draws = [first.draw() for _ in range(50)]
+    same = draws == [second.draw() for _ in range(50)]
+    failures = sum(fail for _, fail in draws)
+    print(f"{'✓' if same else '✗'} seeded draws repeat ({failures}/50 failures)")
+    assert same
+    assert 0 < failures < 50
+
+
+def test_error_injection():
+    """An error rate of 1 always raises"""
+    model = StubModel("gemini-pro", StubBehaviour(error_rate=1.0))
+    try:
+        model.generate_content("Brief acknowledgment:")
+        raised = False
+    except StubError:
+        raised = True
+    print(f"{'✓' if raised else '✗'} injected failure raised")
+    assert raised
+
+
+def test_streaming():
+    """Streamed chunks join back into the full response"""
+    model = StubModel("gemini-pro", StubBehaviour())
+    chunks = [chunk.text for chunk in model.generate_content("Brief acknowledgment:", stream=True)]
+    joined = "".join(chunks)
+    print(f"{'✓' if len(chunks) > 1 else '✗'} {len(chunks)} chunks → {joined}")
+    assert len(chunks) > 1
+    assert joined == "Thanks for sharing, that's helpful to know."
+
+
+if __name__ == "__main__":
+    test_templated_responses()
+    test_sampling_is_deterministic()
+    test_error_injection()
+    test_streaming()
@@ -0,0 +1,108 @@
+"""
+Test script for idempotent retries
+Checks that a repeated Idempotency-Key is answered from the stored response
+without running the handler again, that racing retries wait for the
+original, and that each session keeps only its recent request ids
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+
+import main
+from idempotency import RecentResponses, idempotent, replay_hits
+from state import ConversationState
+
+client = TestClient(main.app)
+
+
+def _assessing_session():
+    session_id = client.post("/start").json()["session_id"]
+    client.post("/answer", json={"session_id": session_id, "answer": "backend"})
+    return session_id
+
+
+def test_retry_replays_stored_response():
+    """The same key returns the first response; the answer is recorded once"""
+    session_id = _assessing_session()
+    body = {"session_id": session_id, "answer": "yes"}
+    hits = replay_hits.value()
+    first = client.post("/answer", json=body, headers={"Idempotency-Key": "k-1"})
+    retry = client.post("/answer", json=body, headers={"Idempotency-Key": "k-1"})
+    state = main.sessions[session_id]
+    assert retry.json() == first.json()
+    assert state.question_count == 1 and state.score == 1
+    assert replay_hits.value() - hits == 1
+
+    # A new key is a new answer
+    client.post("/answer", json=body, headers={"Idempotency-Key": "k-2"})
+    assert state.question_count == 2
+    print("✓ retried /answer replayed, answer recorded once")
+
+
+def test_request_id_in_body():
+    """Without the header, request_id in the body is the key (as WebSocket frames send it)"""
+    session_id = _assessing_session()
+    body = {"session_id": session_id, "answer": "no", "request_id": "r-1"}
+    replies = [client.post("/answer", json=body).json() for _ in range(3)]
+    assert replies[0] == replies[1] == replies[2]
+    assert main.sessions[session_id].question_count == 1
+    print("✓ request_id deduplicates like the header")
+
+
+def test_racing_retries_wait_for_original():
+    """Concurrent requests with one key run the handler once and all get its response"""
+    state = ConversationState()
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.05)
+        return {"message": f"call {len(calls)}"}
+
+    results = []
+    threads = [threading.Thread(target=lambda: results.append(idempotent(state, "same", compute))) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert len(calls) == 1 and results == [{"message": "call 1"}] * 8
+
+    # No key: processed every time, one at a time
+    idempotent(state, None, compute)
+    idempotent(state, None, compute)
+    assert len(calls) == 3
+    print("✓ 8 racing retries ran the handler once")
+
+
+def test_recent_responses_bounded():
+    """Only the last maxsize request ids are kept"""
+    recent = RecentResponses(maxsize=3)
+    for n in range(5):
+        recent.put(f"r-{n}", n)
+    assert len(recent) == 3
+    assert [recent.get(f"r-{n}") for n in range(5)] == [None, None, 2, 3, 4]
+    print("✓ oldest request ids evicted")
+
+
+def test_replayed_id_survives_eviction():
+    """A request id read back is kept over ids stored after it"""
+    recent = RecentResponses(maxsize=3)
+    for n in range(3):
+        recent.put(f"r-{n}", n)
+    assert recent.get("r-0") == 0
+    recent.put("r-3", 3)
+    assert recent.get("r-0") == 0 and recent.get("r-1") is None
+    print("✓ least recently used request id evicted")
+
+
+if __name__ == "__main__":
+    test_retry_replays_stored_response()
+    test_request_id_in_body()
+    test_racing_retries_wait_for_original()
+    test_recent_responses_bounded()
+    test_replayed_id_survives_eviction()
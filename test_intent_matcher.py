@@ -0,0 +1,94 @@
+"""
+Test script for the compiled intent matcher
+Checks detect_intent against the original pattern-by-pattern implementation
+and the batch API against single calls
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import itertools
+import re
+
+from intent_detector import IntentDetector, UserIntent, TECH_KEYWORDS, classify_many
+
+CORPUS = [
+    "yes", "no", "Yes, I have", "nope", "hi", "Hello there!", "hey, what's up", "good morning",
+    "how are you?", "nice to meet you", "huh", "huh?", "what", "What.", "eh", "i'm lost",
+    "I don't understand", "not sure what you mean", "what do you mean by caching?", "confused",
+    "What is an API?", "how does docker work", "why?", "tell me about kubernetes",
+    "can you explain recursion", "could you repeat that", "when should I use a database?",
+    "who invented python", "where is the server hosted", "would you recommend react",
+    "what's the weather", "explain the offside rule", "is it raining?", "I explain things at work",
+    "I like pizza?", "ml", "machine learning?", "cybersecurity", "ai?", "said what?", "whatever",
+    "somewhat", "  Hi  ", "HELLO", "What\nis this?", "ok\nwhat", "", "?", "data?",
+]
+
+
+class LegacyIntentDetector(IntentDetector):
+    """detect_intent as it was before the compiled matchers, kept as the reference"""
+
+    def detect_intent(self, user_input: str, context: str = "") -> UserIntent:
+        user_input_lower = user_input.lower().strip()
+        if self._legacy_matches(user_input_lower, self.greeting_patterns):
+            return UserIntent.GREETING
+        if self._legacy_matches(user_input_lower, self.confusion_patterns):
+            return UserIntent.CONFUSED
+        if self._legacy_matches(user_input_lower, self.question_patterns):
+            if self._legacy_is_tech_related(user_input_lower) or 'assessment' in context.lower():
+                return UserIntent.CLARIFICATION_QUESTION
+            return UserIntent.OFF_TOPIC
+        return UserIntent.ANSWER
+
+    def _legacy_matches(self, text, patterns):
+        return any(re.search(pattern, text, re.IGNORECASE) for pattern in patterns)
+
+    def _legacy_is_tech_related(self, text):
+        return any(word in text for word in self.tech_domains + TECH_KEYWORDS)
+
+
+def test_detect_intent_matches_legacy():
+    """Same intent as the reference on the corpus, with and without assessment context"""
+    detector, legacy = IntentDetector(), LegacyIntentDetector()
+    mismatches = [(text, context) for text in CORPUS for context in ("", "assessment")
+                  if detector.detect_intent(text, context) != legacy.detect_intent(text, context)]
+    print(f"{'✓' if not mismatches else '✗'} {len(CORPUS) * 2} inputs, mismatches: {mismatches}")
+    assert not mismatches
+
+
+def test_tech_matcher_matches_substring_scan():
+    """The trie regex agrees with plain substring checks, including words inside words"""
+    detector, legacy = IntentDetector(), LegacyIntentDetector()
+    fragments = ["explain", "data", "base", "dev", "ops", "a", "i", " ", "mobile", "ml", "sa", "x"]
+    texts = ["".join(parts) for parts in itertools.product(fragments, repeat=3)]
+    mismatches = [text for text in texts if detector._is_tech_related(text) != legacy._legacy_is_tech_related(text)]
+    print(f"{'✓' if not mismatches else '✗'} {len(texts)} generated texts, mismatches: {mismatches[:5]}")
+    assert not mismatches
+
+
+def test_classify_many_matches_single_calls():
+    """Batch results come back in order and equal one call per text, pooled or not"""
+    detector = IntentDetector()
+    texts = CORPUS * 20
+    expected = [(detector.detect_intent(text, "assessment"), detector.classify_answer_type(text)) for text in texts]
+    pooled = list(classify_many(texts, "assessment", chunk_size=37, max_workers=2))
+    inline = list(classify_many(iter(texts), "assessment", chunk_size=37, max_workers=1))
+    print(f"{'✓' if pooled == expected == inline else '✗'} {len(texts)} texts classified in batches")
+    assert pooled == expected
+    assert inline == expected
+
+
+def test_classify_many_is_lazy():
+    """Results stream out before an endless input is exhausted"""
+    endless = itertools.cycle(["yes", "tell me a joke"])
+    first = list(itertools.islice(classify_many(endless, max_workers=1, chunk_size=10), 4))
+    print(f"{'✓' if len(first) == 4 else '✗'} first results from an endless input: {[intent.value for intent, _ in first]}")
+    assert first[1] == (UserIntent.OFF_TOPIC, "unclear")
+
+
+if __name__ == "__main__":
+    test_detect_intent_matches_legacy()
+    test_tech_matcher_matches_substring_scan()
+    test_classify_many_matches_single_calls()
+    test_classify_many_is_lazy()
@@ -0,0 +1,93 @@
+"""
+Test script for the local intent model
+Checks feature hashing, training, the saved artefact and second-stage routing
+"""
+
+import sys
+import os
+import tempfile
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from intent_detector import UserIntent
+from intent_model import IntentModel, features, load_corpus, load_intent_model, seed_examples
+from interruption_handler import InterruptionHandler
+
+
+def _model():
+    return IntentModel.fit(*zip(*(load_corpus() + seed_examples())))
+
+
+def test_features_are_stable():
+    """Feature ids do not depend on the process (no hash() randomisation)"""
+    assert features("What is Docker?") == features("what is docker?")
+    assert features("what is docker?") == sorted(set(features("what is docker?")))
+    assert features("") == []
+    print(f"✓ 'what is docker?' → {len(features('what is docker?'))} hashed features")
+
+
+def test_docs_seed_the_corpus():
+    """Inputs from both examples docs are labelled"""
+    seeded = dict(seed_examples())
+    assert seeded["I prefer tea over coffee"] == UserIntent.OFF_TOPIC.value
+    assert seeded["what is Docker?"] == UserIntent.CLARIFICATION_QUESTION.value
+    assert seeded["My name is John Smith"] == UserIntent.ANSWER.value
+    print(f"✓ {len(seeded)} examples seeded from the docs")
+
+
+def test_predictions():
+    """Unseen turns of each kind land in the right class"""
+    model = _model()
+    cases = [
+        ("i played cricket last weekend", UserIntent.OFF_TOPIC),
+        ("hey, good evening", UserIntent.GREETING),
+        ("what is a message queue?", UserIntent.CLARIFICATION_QUESTION),
+        ("sorry, I'm lost", UserIntent.CONFUSED),
+        ("I used it in my last project", UserIntent.ANSWER),
+    ]
+    for text, expected in cases:
+        intent, confidence = model.predict(text)
+        print(f"{'✓' if intent == expected else '✗'} {text!r} → {intent.value} ({confidence:.2f})")
+        assert intent == expected
+
+
+def test_artefact_round_trip():
+    """A saved model predicts exactly what the fitted one did"""
+    model = _model()
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "model.npz")
+        model.save(path)
+        loaded = load_intent_model(path)
+        size = os.path.getsize(path)
+    for text in ["what is docker?", "hello", "I prefer tea over coffee"]:
+        assert loaded.predict(text) == model.predict(text)
+    assert load_intent_model(os.path.join(tempfile.gettempdir(), "missing-intent-model.npz")) is None
+    print(f"✓ artefact round trip ({size} bytes)")
+
+
+def test_second_stage_routing():
+    """The model overrules the rules only where they were unsure and it is confident"""
+    handler = InterruptionHandler()
+    handler.intent_model = _model()
+    handler.intent_threshold = 0.9
+
+    # Rules default to an answer; the model knows small talk
+    assert handler.intent_detector.detect_intent("I prefer tea over coffee") == UserIntent.ANSWER
+    assert handler.classify_intent("I prefer tea over coffee") == UserIntent.OFF_TOPIC
+    # "what" makes the rules call it confusion, which would rephrase through Gemini
+    assert handler.intent_detector.detect_intent("yes, I know what docker is") == UserIntent.CONFUSED
+    assert handler.classify_intent("yes, I know what docker is") == UserIntent.ANSWER
+    # Clear answers and greetings never reach the model
+    assert handler.classify_intent("yes") == UserIntent.ANSWER
+    assert handler.classify_intent("hello") == UserIntent.GREETING
+
+    handler.intent_threshold = 1.01
+    assert handler.classify_intent("I prefer tea over coffee") == UserIntent.ANSWER
+    print("✓ second stage overrules the rules only when confident")
+
+
+if __name__ == "__main__":
+    test_features_are_stable()
+    test_docs_seed_the_corpus()
+    test_predictions()
+    test_artefact_round_trip()
+    test_second_stage_routing()
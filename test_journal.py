@@ -0,0 +1,142 @@
+"""
+Test script for the event-sourced session journal
+Runs conversations through the handlers and checks replay rebuilds every session exactly,
+that an idle journal still reaches disk and that compaction keeps replay exact
+"""
+
+import sys
+import os
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import main
+from journal import SessionJournal, compact, journal, read_records, replay
+from state import ConversationStage, ConversationState
+
+
+def _conversation(answers, chats=()):
+    session_id = main.start_conversation()["session_id"]
+    main.submit_personal_info(main.PersonalInfoRequest(session_id=session_id, name="Asha", location="Pune", education="BSc"))
+    main.submit_answer(main.UserAnswerRequest(session_id=session_id, answer="devops"))
+    for answer in answers:
+        main.submit_answer(main.UserAnswerRequest(session_id=session_id, answer=answer))
+    for message in chats:
+        main.chat(main.ChatRequest(session_id=session_id, message=message))
+    return session_id
+
+
+def test_state_round_trip():
+    """to_dict/from_dict keep public attributes and drop runtime ones"""
+    state = ConversationState()
+    state.stage = ConversationStage.DOMAIN_EVALUATION
+    state.question_count = 2
+    state._recent_responses = object()
+    data = state.to_dict()
+    assert data["stage"] == "domain_evaluation" and "_recent_responses" not in data
+    restored = ConversationState.from_dict(data)
+    assert restored.stage is ConversationStage.DOMAIN_EVALUATION and restored.to_dict() == data
+    print("✓ state round trip skips underscore attributes")
+
+
+def test_replay_rebuilds_sessions():
+    """Every session replayed from the journal equals the live one"""
+    with tempfile.TemporaryDirectory() as directory:
+        journal.path = os.path.join(directory, "sessions.journal")
+        journal.snapshot_every = 4
+        try:
+            session_ids = [
+                _conversation(["yes", "no", "maybe", "yes", "no", "yes", "no"],
+                              ["what is docker?", "how do I start", "how do I start", "I like backend", "yes"]),
+                _conversation(["no", "yes"]),
+                _conversation([]),
+            ]
+            batch = main.start_conversation()["session_id"]
+            main.get_question_plan(main.PlanRequest(session_id=batch, domain="algorithms"))
+            main.submit_answers_batch(main.BatchAnswerRequest(session_id=batch, answers=["yes", "no", "y", "n", "yes", "no"]))
+            session_ids.append(batch)
+            journal.flush()
+
+            replayed = replay(journal.path)
+            for session_id in session_ids:
+                assert replayed[session_id].to_dict() == main.sessions[session_id].to_dict(), session_id
+                alone = replay(journal.path, session_id)
+                assert alone[session_id].to_dict() == main.sessions[session_id].to_dict(), session_id
+            snapshots = sum(record[2] == "snapshot" for record in read_records(journal.path))
+        finally:
+            journal.close()
+            journal.path = None
+            journal.snapshot_every = 16
+    assert snapshots > 0
+    print(f"✓ {len(session_ids)} sessions replayed exactly ({snapshots} snapshots)")
+
+
+def test_replay_starts_at_latest_snapshot():
+    """A session's replay ignores events the snapshot already covers"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sessions.journal")
+        log = SessionJournal(path, snapshot_every=3)
+        state = ConversationState()
+        for kind, *args in [("start",), ("personal_info", "A", "B", "C"), ("domain", "backend"),
+                            ("answer", 0, True), ("answer", 1, False)]:
+            log.record("s1", state, kind, *args)
+        log.close()
+        # Corrupt the events the snapshot covers: replay must not need them
+        lines = open(path, "rb").read().splitlines()
+        lines[1] = b'["s1",2,"personal_info","X","Y","Z"]'
+        open(path, "wb").write(b"\n".join(lines) + b"\n")
+        replayed = replay(path, "s1")["s1"]
+    assert replayed.to_dict() == state.to_dict() and replayed.user_name == "A"
+    assert replayed._journal_seq == 5
+    print("✓ single-session replay starts from the latest snapshot")
+
+
+def test_idle_journal_reaches_disk():
+    """Events are written within flush_interval even when no further events arrive"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sessions.journal")
+        log = SessionJournal(path, flush_interval=0.1)
+        state = ConversationState()
+        log.record("s1", state, "start")
+        log.record("s1", state, "domain", "backend")
+        time.sleep(0.3)
+        written = list(read_records(path)) if os.path.exists(path) else []
+        log.close()
+    assert written == [["s1", 1, "start"], ["s1", 2, "domain", "backend"]]
+    print("✓ idle journal flushed by the writer thread")
+
+
+def test_compaction_keeps_replay_exact():
+    """Past max_bytes the file keeps each session's latest snapshot onwards, and replays the same"""
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sessions.journal")
+        log = SessionJournal(path, snapshot_every=4, max_bytes=8192)
+        states = {}
+        for n in range(200):
+            for sid in ("s1", "s2", "s3"):
+                state = states.setdefault(sid, ConversationState())
+                if n == 0:
+                    log.record(sid, state, "start")
+                    log.record(sid, state, "domain", "backend")
+                    log.record(sid, state, "answer", 0, True)
+                else:
+                    log.record(sid, state, "chat")
+            log.flush()
+        log.close()
+        size = os.path.getsize(path)
+        replayed = replay(path)
+        records = list(read_records(path))
+        # Compacting a compacted file changes nothing
+        assert compact(path) == size
+    assert size < 8192
+    assert all(replayed[sid].to_dict() == state.to_dict() for sid, state in states.items())
+    assert all(records[[r[0] for r in records].index(sid)][2] == "snapshot" for sid in states)
+    print(f"✓ journal compacted to {size} bytes, replay unchanged")
+
+
+if __name__ == "__main__":
+    test_state_round_trip()
+    test_replay_rebuilds_sessions()
+    test_replay_starts_at_latest_snapshot()
+    test_idle_journal_reaches_disk()
+    test_compaction_keeps_replay_exact()
@@ -0,0 +1,76 @@
+"""
+Test script for the LLM latency budget scheduler
+Checks that slow calls are hedged with the fallback and late results are kept
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from latency_budget import LatencyBudgetScheduler, MethodBudget
+
+
+def _slow(result, seconds):
+    def call():
+        time.sleep(seconds)
+        return result
+    return call
+
+
+def test_fast_call_returns_result():
+    """Calls inside the budget return the model result"""
+    scheduler = LatencyBudgetScheduler({"rephrase": MethodBudget(budget_ms=500)})
+    result = scheduler.run("rephrase", _slow("rephrased", 0.01), fallback="original")
+    print(f"{'✓' if result == 'rephrased' else '✗'} fast call → {result}")
+    assert result == "rephrased"
+
+
+def test_slow_call_serves_fallback_and_warms():
+    """Calls past the hedge point serve the fallback and deliver the late result"""
+    scheduler = LatencyBudgetScheduler({"acknowledgment": MethodBudget(budget_ms=50)})
+    late = []
+    delivered = threading.Event()
+
+    def on_late(text):
+        late.append(text)
+        delivered.set()
+
+    started = time.perf_counter()
+    result = scheduler.run("acknowledgment", _slow("late ack", 0.3), fallback="fallback ack", on_late=on_late)
+    elapsed = time.perf_counter() - started
+    delivered.wait(2)
+
+    print(f"{'✓' if result == 'fallback ack' else '✗'} slow call → {result} after {elapsed * 1000:.0f}ms")
+    print(f"{'✓' if late == ['late ack'] else '✗'} late result delivered → {late}")
+    assert result == "fallback ack"
+    assert elapsed < 0.25
+    assert late == ["late ack"]
+
+
+def test_hedge_point_follows_percentile():
+    """Once enough samples exist the hedge point tracks the observed percentile"""
+    budget = MethodBudget(budget_ms=2000, hedge_percentile=90, min_hedge_ms=10, min_samples=10)
+    for i in range(100):
+        budget.observe((i + 1) / 1000.0)
+    hedge_ms = budget.hedge_point() * 1000
+    print(f"{'✓' if 85 <= hedge_ms <= 95 else '✗'} p90 hedge point → {hedge_ms:.0f}ms")
+    assert 85 <= hedge_ms <= 95
+
+
+def test_turn_deadline_caps_wait():
+    """An exhausted turn budget skips the call entirely"""
+    scheduler = LatencyBudgetScheduler({"rephrase": MethodBudget(budget_ms=1000)})
+    with scheduler.turn(budget_ms=20):
+        first = scheduler.run("rephrase", _slow("first", 0.1), fallback="fallback")
+        second = scheduler.run("rephrase", _slow("second", 0.0), fallback="fallback")
+    print(f"{'✓' if (first, second) == ('fallback', 'fallback') else '✗'} turn budget → {first}, {second}")
+    assert (first, second) == ("fallback", "fallback")
+
+
+if __name__ == "__main__":
+    test_fast_call_returns_result()
+    test_slow_call_serves_fallback_and_warms()
+    test_hedge_point_follows_percentile()
+    test_turn_deadline_caps_wait()
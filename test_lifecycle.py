@@ -0,0 +1,186 @@
+"""
+Test script for the shutdown drain and warm session restore
+Checks the snapshot round trip, that a restarted app carries on mid-assessment,
+and that draining turns away new sessions and waits for in-flight requests,
+both directly and under a real uvicorn process sent SIGTERM
+"""
+
+import sys
+import os
+import asyncio
+import json
+import signal
+import socket
+import subprocess
+import tempfile
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+
+import main
+from lifecycle import SessionDrain, dump_sessions, load_sessions, restore_sessions
+
+
+def test_snapshot_round_trip():
+    """Dumped sessions load back equal, and the snapshot is consumed"""
+    session_id = main.start_conversation()["session_id"]
+    main.submit_answer(main.UserAnswerRequest(session_id=session_id, answer="backend"))
+    main.submit_answer(main.UserAnswerRequest(session_id=session_id, answer="yes"))
+    live = {session_id: main.sessions[session_id], "fresh": main.ConversationState()}
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "sessions.snapshot")
+        assert dump_sessions(live, path) == 2
+        assert [sid for sid, _ in load_sessions(path)] == [session_id, "fresh"]
+        restored = {}
+        assert restore_sessions(restored, path) == 2
+        assert not os.path.exists(path)
+        assert restore_sessions(restored, path) == 0
+    for sid, state in live.items():
+        assert restored[sid].to_dict() == state.to_dict()
+    print("✓ snapshot round trip")
+
+
+def test_question_plan_is_stable_across_processes():
+    """The session's question sample does not depend on hash randomisation"""
+    session_id = "3f1c9a52-7a0e-4bd4-9d55-0c1e6f2b8a11"
+    expected = [question["q"] for question in main._get_session_questions(session_id, "backend")]
+    script = ("import main; print([q['q'] for q in main._get_session_questions("
+              f"{session_id!r}, 'backend')])")
+    root = os.path.dirname(os.path.abspath(__file__))
+    for seed in ("1", "2"):
+        output = subprocess.run([sys.executable, "-c", script], cwd=root, capture_output=True, text=True,
+                                env={**os.environ, "PYTHONHASHSEED": seed, "RATE_LIMIT_ENABLED": "0"}).stdout
+        assert output.strip().splitlines()[-1] == str(expected), seed
+    print("✓ question plan is the same in every process")
+
+
+def test_restart_resumes_assessment():
+    """Sessions survive a shutdown and startup of the app mid-assessment"""
+    with tempfile.TemporaryDirectory() as directory:
+        main.SNAPSHOT_PATH = os.path.join(directory, "sessions.snapshot")
+        try:
+            with TestClient(main.app) as client:
+                session_id = client.post("/start").json()["session_id"]
+                client.post("/answer", json={"session_id": session_id, "answer": "devops"})
+                client.post("/answer", json={"session_id": session_id, "answer": "yes"})
+                plan = client.post("/plan", json={"session_id": session_id}).json()
+            assert os.path.exists(main.SNAPSHOT_PATH)
+
+            main.sessions.clear()
+            with TestClient(main.app) as client:
+                resumed = client.post("/plan", json={"session_id": session_id}).json()
+                reply = client.post("/answer", json={"session_id": session_id, "answer": "no"}).json()
+        finally:
+            main.SNAPSHOT_PATH = None
+            main.session_drain.draining = False
+    assert resumed == plan and resumed["answered"] == 1
+    assert reply["question"] == plan["questions"][2]
+    print("✓ restarted app continues the assessment at question 3")
+
+
+def test_drain():
+    """Draining rejects new sessions, keeps serving others and waits for in-flight work"""
+    client = TestClient(main.app)
+    session_id = client.post("/start").json()["session_id"]
+    main.session_drain.draining = True
+    try:
+        rejected = client.post("/start")
+        served = client.post("/answer", json={"session_id": session_id, "answer": "backend"})
+    finally:
+        main.session_drain.draining = False
+    assert rejected.status_code == 503 and rejected.headers["retry-after"] == "1"
+    assert served.status_code == 200
+
+    async def drain_with_request(duration, timeout):
+        drain = SessionDrain()
+        drain.in_flight = 1
+
+        async def finish():
+            await asyncio.sleep(duration)
+            drain.in_flight -= 1
+        task = asyncio.ensure_future(finish())
+        drained = await drain.drain(timeout)
+        task.cancel()
+        return drained, drain.draining
+
+    assert asyncio.run(drain_with_request(0.1, 2.0)) == (True, True)
+    assert asyncio.run(drain_with_request(1.0, 0.2)) == (False, True)
+    print("✓ drain waits for in-flight requests and turns away new sessions")
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _request(port, method, path, body=b""):
+    """One HTTP/1.1 request on a fresh connection; returns (status, raw response)"""
+    with socket.create_connection(("127.0.0.1", port), timeout=5) as conn:
+        conn.sendall(f"{method} {path} HTTP/1.1\r\nHost: test\r\nContent-Type: application/json\r\n"
+                     f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body)
+        response = b""
+        while chunk := conn.recv(65536):
+            response += chunk
+    return int(response.split(b" ", 2)[1]), response
+
+
+def test_sigterm_drains_real_server():
+    """
+    SIGTERM to uvicorn main:app refuses /start with a 503, lets a request
+    that is still sending its body finish, then exits and saves the sessions
+    """
+    root = os.path.dirname(os.path.abspath(__file__))
+    port = _free_port()
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot = os.path.join(directory, "sessions.snapshot")
+        env = {**os.environ, "SESSION_SNAPSHOT_PATH": snapshot, "SHUTDOWN_DRAIN_SECONDS": "5",
+               "SESSION_JOURNAL_PATH": "", "RATE_LIMIT_ENABLED": "0"}
+        server = subprocess.Popen([sys.executable, "-m", "uvicorn", "main:app", "--port", str(port)],
+                                  cwd=root, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        try:
+            deadline = time.monotonic() + 30
+            while True:
+                try:
+                    _, response = _request(port, "POST", "/start")
+                    break
+                except OSError:
+                    assert time.monotonic() < deadline, "server did not start"
+                    time.sleep(0.1)
+            session_id = json.loads(response.split(b"\r\n\r\n", 1)[1])["session_id"]
+
+            # An /answer whose body is still arriving is in flight when SIGTERM lands
+            body = f'{{"session_id": "{session_id}", "answer": "backend"}}'.encode()
+            in_flight = socket.create_connection(("127.0.0.1", port), timeout=5)
+            in_flight.sendall(f"POST /answer HTTP/1.1\r\nHost: test\r\nContent-Type: application/json\r\n"
+                              f"Content-Length: {len(body)}\r\nConnection: close\r\n\r\n".encode() + body[:10])
+            time.sleep(0.3)
+            server.send_signal(signal.SIGTERM)
+            time.sleep(0.3)
+
+            refused, response = _request(port, "POST", "/start")
+            assert refused == 503 and b"retry-after: 1" in response.lower()
+
+            in_flight.sendall(body[10:])
+            response = b""
+            while chunk := in_flight.recv(65536):
+                response += chunk
+            in_flight.close()
+            assert response.startswith(b"HTTP/1.1 200")
+            assert server.wait(timeout=15) == 0
+        finally:
+            if server.poll() is None:
+                server.kill()
+        saved = dict(load_sessions(snapshot))
+    assert saved[session_id].selected_domain == "backend"
+    print("✓ SIGTERM drained a live uvicorn: /start refused, in-flight answer finished, sessions saved")
+
+
+if __name__ == "__main__":
+    test_snapshot_round_trip()
+    test_question_plan_is_stable_across_processes()
+    test_restart_resumes_assessment()
+    test_drain()
+    test_sigterm_drains_real_server()
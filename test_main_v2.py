@@ -0,0 +1,74 @@
+"""
+Smoke test for the v2 app (main_v2.py)
+Walks the personal-info stages through the transition table, then a domain,
+six answers, the results, post-assessment chat and the session status
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+
+import main_v2
+from state import ConversationStage
+
+client = TestClient(main_v2.app)
+
+
+def _answer(session_id, text):
+    response = client.post("/answer", json={"session_id": session_id, "answer": text})
+    assert response.status_code == 200, response.text
+    return response.json()
+
+
+def test_personal_info_stages():
+    """Name, location and education each advance one stage; invalid input stays put"""
+    start = client.post("/start").json()
+    session_id = start["session_id"]
+    assert start["question"] == "Let's start with some basic information. What's your name?"
+
+    retry = _answer(session_id, "12345")
+    assert retry["stage"] == ConversationStage.ASK_NAME.value
+
+    stages = []
+    for text in ["Asha", "Pune", "Computer Science"]:
+        reply = _answer(session_id, text)
+        stages.append(reply["stage"])
+    assert stages == ["ask_location", "ask_education", "domain_selection"]
+    assert reply["question"].startswith("Which tech domain")
+
+    state = main_v2.sessions[session_id]
+    assert (state.user_name, state.user_location, state.user_education) == ("Asha", "Pune", "Computer Science")
+    status = client.get(f"/session/{session_id}").json()
+    assert status["stage_name"] == "Domain selection" and status["completed"] is False
+    print(f"✓ personal info walked through {len(stages)} stages")
+
+
+def test_assessment_to_results():
+    """A domain, six answers and the results, then chat and a completed session"""
+    session_id = client.post("/start").json()["session_id"]
+    for text in ["Asha", "Pune", "Computer Science"]:
+        _answer(session_id, text)
+
+    reply = _answer(session_id, "bakend")
+    assert reply["stage"] == "domain_evaluation" and reply["question"]
+    for text in ["yes", "yes", "no", "yes", "yes"]:
+        reply = _answer(session_id, text)
+        assert reply["completed"] is False and reply["question"]
+    reply = _answer(session_id, "yes")
+
+    assert reply["completed"] is True
+    assert reply["recommendations"]["score"] == "5/6" and reply["recommendations"]["level"] == "Advanced"
+    assert reply["recommendations"]["topics"]
+
+    chat = client.post("/chat", json={"session_id": session_id, "answer": "what should I learn next?"}).json()
+    assert chat["completed"] is True and chat["message"]
+    status = client.get(f"/session/{session_id}").json()
+    assert status["completed"] is True and status["progress"] == 100.0
+    print(f"✓ v2 assessment scored {reply['recommendations']['score']}")
+
+
+if __name__ == "__main__":
+    test_personal_info_stages()
+    test_assessment_to_results()
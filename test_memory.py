@@ -0,0 +1,37 @@
+"""
+Test script for the memory report helpers
+Checks deep sizing of nested session state
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from memory import deep_sizeof
+from state import ConversationState
+
+
+def test_deep_size_grows_with_contents():
+    """Answers held by a session add to its deep size"""
+    empty = ConversationState()
+    filled = ConversationState()
+    filled.answers = [{"question": f"Question {i}?", "answer": "Yes", "explanation": None} for i in range(50)]
+    small, large = deep_sizeof(empty), deep_sizeof(filled)
+    print(f"{'✓' if large > small + 50 * sys.getsizeof({}) else '✗'} empty {small} B, 50 answers {large} B")
+    assert large > small + 50 * sys.getsizeof({})
+
+
+def test_shared_objects_counted_once():
+    """A shared seen set counts an object reachable from two roots once"""
+    shared = ["x" * 1000]
+    first, second = {"plan": shared}, {"plan": shared}
+    seen = set()
+    together = deep_sizeof(first, seen) + deep_sizeof(second, seen)
+    apart = deep_sizeof(first) + deep_sizeof(second)
+    print(f"{'✓' if apart - together > 1000 else '✗'} shared {together} B vs separate {apart} B")
+    assert apart - together > 1000
+
+
+if __name__ == "__main__":
+    test_deep_size_grows_with_contents()
+    test_shared_objects_counted_once()
@@ -0,0 +1,53 @@
+"""
+Test script for the metrics registry
+Checks sharded counters under threads and histogram exposition
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from concurrent.futures import ThreadPoolExecutor
+
+from metrics import Registry
+
+
+def test_counter_across_threads():
+    """Increments from many threads all add up"""
+    registry = Registry()
+    counter = registry.counter("test_total", "test", ("route",))
+
+    def work(_):
+        child = counter.labels("/answer")
+        for _ in range(10000):
+            child.inc()
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(work, range(16)))
+    total = counter.labels("/answer").value()
+    print(f"{'✓' if total == 160000 else '✗'} 16 x 10000 increments → {total}")
+    assert total == 160000
+
+
+def test_histogram_exposition():
+    """Buckets are cumulative and le is inclusive"""
+    registry = Registry()
+    histogram = registry.histogram("test_seconds", "test", buckets=[0.1, 0.2, 0.5])
+    for value in (0.05, 0.1, 0.3, 2.0):
+        histogram.observe(value)
+    text = registry.render()
+    expected = [
+        'test_seconds_bucket{le="0.1"} 2',
+        'test_seconds_bucket{le="0.2"} 2',
+        'test_seconds_bucket{le="0.5"} 3',
+        'test_seconds_bucket{le="+Inf"} 4',
+        'test_seconds_count 4',
+    ]
+    missing = [line for line in expected if line not in text.splitlines()]
+    print(f"{'✓' if not missing else '✗'} histogram lines {missing or 'all present'}")
+    assert not missing
+
+
+if __name__ == "__main__":
+    test_counter_across_threads()
+    test_histogram_exposition()
@@ -0,0 +1,103 @@
+"""
+Test script for the sampling profiler
+Checks that samples taken in worker threads are attributed to the endpoint,
+and that only threads serving profiled requests are sampled
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+import threading
+import time
+
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from profiling import ProfilingMiddleware, StackSampler
+
+
+def _busy_helper(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+def fake_endpoint():
+    _busy_helper(0.2)
+
+
+class _Route:
+    path = "/fake"
+    endpoint = staticmethod(fake_endpoint)
+
+
+class _App:
+    routes = [_Route()]
+
+
+def test_samples_attributed_to_endpoint():
+    """Work done under the endpoint in another thread shows up under its route"""
+    sampler = StackSampler(interval=0.002)
+    sampler.register_routes(_App())
+
+    def tracked_endpoint():
+        with sampler.track_thread():
+            fake_endpoint()
+
+    sampler.begin()
+    worker = threading.Thread(target=tracked_endpoint)
+    worker.start()
+    worker.join()
+    sampler.end("/fake")
+
+    report = sampler.report("/fake")["/fake"]
+    functions = [row["function"] for row in report["top"]]
+    print(f"{'✓' if '_busy_helper' in functions else '✗'} {report['samples']} samples, top: {functions[:3]}")
+    assert report["requests"] == 1
+    assert report["samples"] > 10
+    assert "_busy_helper" in functions
+    assert "run" not in functions
+
+
+def test_untracked_threads_not_sampled():
+    """A thread no profiled request registered is never sampled, whatever it runs"""
+    sampler = StackSampler(interval=0.002)
+    sampler.register_routes(_App())
+
+    sampler.begin()
+    worker = threading.Thread(target=fake_endpoint)
+    worker.start()
+    worker.join()
+    sampler.end("/fake")
+
+    report = sampler.report("/fake")["/fake"]
+    print(f"{'✓' if report['samples'] == 0 else '✗'} untracked thread: {report['samples']} samples")
+    assert report["requests"] == 1 and report["samples"] == 0
+
+
+def test_sync_endpoint_tracked_through_middleware():
+    """The threadpool worker running a profiled sync endpoint is sampled"""
+    sampler = StackSampler(interval=0.002)
+    app = FastAPI()
+    app.add_middleware(ProfilingMiddleware, sampler=sampler, sample_every=1)
+
+    @app.get("/busy")
+    def busy():
+        _busy_helper(0.2)
+        return {}
+
+    with TestClient(app) as client:
+        assert client.get("/busy").status_code == 200
+
+    report = sampler.report("/busy")["/busy"]
+    functions = [row["function"] for row in report["top"]]
+    print(f"{'✓' if '_busy_helper' in functions else '✗'} /busy: {report['samples']} samples, top: {functions[:3]}")
+    assert report["requests"] == 1 and report["samples"] > 10
+    assert "_busy_helper" in functions and not sampler._threads
+
+
+if __name__ == "__main__":
+    test_samples_attributed_to_endpoint()
+    test_untracked_threads_not_sampled()
+    test_sync_endpoint_tracked_through_middleware()
@@ -0,0 +1,67 @@
+"""
+Test script for the token-bucket rate limiter
+Checks refill, per-key isolation, timing-wheel eviction and client keys behind a proxy
+"""
+
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from rate_limit import TokenBucketTable, client_address
+
+
+def test_burst_then_refill():
+    """A key gets its burst, is refused, then gets a token back after 1/rate seconds"""
+    table = TokenBucketTable(rate=2.0, burst=3.0)
+    allowed = [table.take("client", 100.0) == 0 for _ in range(4)]
+    retry_after = table.take("client", 100.0)
+    refilled = table.take("client", 100.5) == 0
+    print(f"{'✓' if allowed == [True, True, True, False] else '✗'} burst of 3 → {allowed}, retry after {retry_after:.2f}s")
+    assert allowed == [True, True, True, False]
+    assert abs(retry_after - 0.5) < 1e-9
+    assert refilled
+
+
+def test_keys_are_independent():
+    """One client running dry does not affect another"""
+    table = TokenBucketTable(rate=1.0, burst=1.0)
+    table.take("noisy", 10.0)
+    noisy = table.take("noisy", 10.0)
+    quiet = table.take("quiet", 10.0)
+    print(f"{'✓' if noisy and not quiet else '✗'} noisy refused, quiet allowed")
+    assert noisy > 0
+    assert quiet == 0
+
+
+def test_full_buckets_are_evicted():
+    """Buckets disappear once refilled, busy ones survive"""
+    table = TokenBucketTable(rate=1.0, burst=5.0, tick=1.0, slots=8)
+    for i in range(1000):
+        table.take(f"client-{i}", 0.0)
+    now = 0.0
+    while now < 30.0:
+        now += 0.5
+        table.take("busy", now)
+        table.take("busy", now)
+    print(f"{'✓' if len(table) == 1 else '✗'} {len(table)} bucket(s) left after 30s")
+    assert len(table) == 1
+
+
+def test_client_behind_proxy():
+    """With trusted proxies, the client is the X-Forwarded-For entry the outermost one added"""
+    scope = {"client": ("10.0.0.9", 443), "headers": [(b"x-forwarded-for", b"6.6.6.6, 203.0.113.7"),
+                                                      (b"x-forwarded-for", b"10.0.0.2")]}
+    assert client_address(scope, 0) == "10.0.0.9"
+    assert client_address(scope, 1) == "10.0.0.2"
+    assert client_address(scope, 2) == "203.0.113.7"
+    # More hops configured than present: the leftmost is as far as we can go
+    assert client_address(scope, 5) == "6.6.6.6"
+    assert client_address({"client": ("10.0.0.9", 443), "headers": []}, 1) == "10.0.0.9"
+    print("✓ client keyed on the trusted X-Forwarded-For hop")
+
+
+if __name__ == "__main__":
+    test_burst_then_refill()
+    test_keys_are_independent()
+    test_full_buckets_are_evicted()
+    test_client_behind_proxy()
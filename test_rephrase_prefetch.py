@@ -0,0 +1,117 @@
+"""
+Test script for the speculative rephrase prefetcher
+Checks that a finished prefetch is picked up, and that a missing, queued,
+late or failed one falls back to rephrasing directly within the turn budget
+"""
+
+import sys
+import os
+import threading
+import time
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from gemini_stub import StubBehaviour, StubModel
+from latency_budget import LatencyBudgetScheduler
+from rephrase_prefetch import RephrasePrefetcher, prefetch_hits, prefetch_misses
+from state import ConversationState
+
+PLAN = ["Have you used Docker?", "Have you written a REST API?", "Have you used SQL joins?"]
+RULES = [{"match": "Rephrased question:", "template": "So, {original_question}"}]
+
+
+class _Rephraser:
+    """Rephrases with one StubModel on the prefetch workers and another on the request thread"""
+
+    def __init__(self, prefetch_latency="fixed:0", prefetch_error_rate=0.0):
+        self.prefetch = StubModel("gemini-pro", StubBehaviour(prefetch_latency, prefetch_error_rate, rules=RULES))
+        self.direct = StubModel("gemini-pro", StubBehaviour(rules=RULES))
+        self.direct_calls = []
+
+    def __call__(self, question, domain):
+        if threading.current_thread().name.startswith("prefetch"):
+            model = self.prefetch
+        else:
+            model = self.direct
+            self.direct_calls.append(question)
+        return model.generate_content(f"Domain: {domain}\nOriginal question: {question}\n\nRephrased question:").text
+
+
+def _wait_for_prefetches(state):
+    for future in list(state._prefetched_rephrasings.values()):
+        future.result()
+
+
+def test_finished_prefetch_is_used():
+    """The next turn picks up the rephrasing done in the background"""
+    rephrase = _Rephraser()
+    prefetcher = RephrasePrefetcher(rephrase)
+    state = ConversationState()
+    hits = prefetch_hits.value()
+    prefetcher.schedule(state, PLAN, 0, "backend")
+    _wait_for_prefetches(state)
+    assert prefetcher.take(state, PLAN[1], "backend") == "So, Have you written a REST API?"
+    assert rephrase.direct_calls == [] and prefetch_hits.value() - hits == 1
+    print("✓ finished prefetch served without a direct call")
+
+
+def test_missing_prefetch_rephrases_directly():
+    """A question that was never prefetched is rephrased on the request thread"""
+    rephrase = _Rephraser()
+    prefetcher = RephrasePrefetcher(rephrase)
+    misses = prefetch_misses.value()
+    assert prefetcher.take(ConversationState(), PLAN[0], "backend") == "So, Have you used Docker?"
+    assert rephrase.direct_calls == [PLAN[0]] and prefetch_misses.value() - misses == 1
+    print("✓ missing prefetch rephrased directly")
+
+
+def test_queued_prefetch_is_not_waited_for():
+    """A prefetch still queued behind other work is cancelled rather than waited for"""
+    rephrase = _Rephraser(prefetch_latency="fixed:300")
+    prefetcher = RephrasePrefetcher(rephrase, max_workers=1)
+    state = ConversationState()
+    prefetcher.schedule(state, PLAN, 0, "backend")
+    queued = state._prefetched_rephrasings[PLAN[2]]
+
+    started = time.perf_counter()
+    assert prefetcher.take(state, PLAN[2], "backend") == "So, Have you used SQL joins?"
+    elapsed = time.perf_counter() - started
+    assert queued.cancelled() and rephrase.direct_calls == [PLAN[2]] and elapsed < 0.1
+    print(f"✓ queued prefetch cancelled, direct call took {elapsed * 1000:.1f} ms")
+
+
+def test_slow_prefetch_bounded_by_turn_budget():
+    """A running prefetch is waited for no longer than the turn has left"""
+    rephrase = _Rephraser(prefetch_latency="fixed:500")
+    prefetcher = RephrasePrefetcher(rephrase)
+    state = ConversationState()
+    prefetcher.schedule(state, PLAN, 0, "backend")
+    time.sleep(0.02)
+
+    started = time.perf_counter()
+    with LatencyBudgetScheduler({}).turn(budget_ms=50):
+        rephrased = prefetcher.take(state, PLAN[1], "backend")
+    elapsed = time.perf_counter() - started
+    assert rephrased == "So, Have you written a REST API?" and rephrase.direct_calls == [PLAN[1]]
+    assert 0.04 < elapsed < 0.2
+    print(f"✓ slow prefetch abandoned after {elapsed * 1000:.0f} ms of a 50 ms turn budget")
+
+
+def test_failed_prefetch_rephrases_directly():
+    """A prefetch that raised is replaced by a direct call"""
+    rephrase = _Rephraser(prefetch_error_rate=1.0)
+    prefetcher = RephrasePrefetcher(rephrase)
+    state = ConversationState()
+    prefetcher.schedule(state, PLAN, 0, "backend")
+    for future in list(state._prefetched_rephrasings.values()):
+        future.exception()
+    assert prefetcher.take(state, PLAN[1], "backend") == "So, Have you written a REST API?"
+    assert rephrase.direct_calls == [PLAN[1]]
+    print("✓ failed prefetch replaced by a direct call")
+
+
+if __name__ == "__main__":
+    test_finished_prefetch_is_used()
+    test_missing_prefetch_rephrases_directly()
+    test_queued_prefetch_is_not_waited_for()
+    test_slow_prefetch_bounded_by_turn_budget()
+    test_failed_prefetch_rephrases_directly()
@@ -0,0 +1,77 @@
+"""
+Test script for BM25 chat retrieval
+Checks scoring against a direct BM25 computation and answers over the roadmap content
+"""
+
+import sys
+import os
+import math
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from retrieval import BM25Index, Snippet, chat_index, tokenize
+
+
+def test_tokenize():
+    """Stopwords and chat filler go, plain plurals are folded"""
+    assert tokenize("What are Docker containers?") == ["docker", "container"]
+    assert tokenize("what should I learn next") == []
+    assert tokenize("class access") == ["class", "access"]
+    print("✓ tokenizer drops filler and folds plurals")
+
+
+def test_scores_match_bm25():
+    """Vectorised scores equal the BM25 formula computed directly"""
+    texts = ["docker containers docker", "kubernetes orchestrates containers", "react hooks and state"]
+    snippets = [Snippet("d", "test", text, []) for text in texts]
+    index = BM25Index(snippets, texts)
+
+    documents = [tokenize(text) for text in texts]
+    average = sum(map(len, documents)) / len(documents)
+    query = ["docker", "container"]
+
+    def bm25(document):
+        total = 0.0
+        for term in query:
+            containing = sum(term in doc for doc in documents)
+            idf = math.log(1 + (len(documents) - containing + 0.5) / (containing + 0.5))
+            tf = document.count(term)
+            total += idf * tf * 2.2 / (tf + 1.2 * (0.25 + 0.75 * len(document) / average))
+        return total
+
+    hits = index.search("docker containers", k=3)
+    expected = sorted(((bm25(doc), i) for i, doc in enumerate(documents) if bm25(doc) > 0), reverse=True)
+    assert [hit.snippet.answer for hit in hits] == [texts[i] for _, i in expected]
+    for hit, (score, _) in zip(hits, expected):
+        assert abs(hit.score - score) < 1e-9
+    print(f"✓ BM25 scores match ({', '.join(f'{hit.score:.3f}' for hit in hits)})")
+
+
+def test_answers_from_content():
+    """Questions about indexed topics are answered from the right domain"""
+    cases = [
+        ("what is docker?", "devops", "devops"),
+        ("what jobs can I get", "backend", "backend"),
+        ("explain dynamic programming", "algorithms", "algorithms"),
+        # Two or more words may be answered from another domain
+        ("how does kafka stream processing work", "frontend", "data engineering"),
+    ]
+    for text, domain, expected in cases:
+        hit = chat_index.best(text, domain)
+        print(f"{'✓' if hit and hit.snippet.domain == expected else '✗'} {text!r} → "
+              f"{hit.snippet.source + ' ' + hit.snippet.domain if hit else None}")
+        assert hit and hit.snippet.domain == expected and hit.confidence >= 0.5
+
+
+def test_low_confidence_escalates():
+    """Filler, off-topic and single out-of-domain words get no answer"""
+    for text, domain in [("ok cool", "backend"), ("what is the weather", "backend"),
+                         ("what should I learn next", "frontend"), ("what is kafka", "frontend")]:
+        assert chat_index.best(text, domain) is None, text
+    print("✓ unsure retrievals are left to the fallback")
+
+
+if __name__ == "__main__":
+    test_tokenize()
+    test_scores_match_bm25()
+    test_answers_from_content()
+    test_low_confidence_escalates()
@@ -0,0 +1,98 @@
+"""
+Test script for the table-driven StateController
+Walks every input path from every stage and checks it against the original if-chain
+"""
+
+import sys
+import os
+import itertools
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from state import ConversationState, ConversationStage
+from state_controller import PERSONAL_INFO_STAGES, TRANSITIONS, StateController
+
+
+class ReferenceController:
+    """The hand-written if-chain the table replaced"""
+
+    def get_current_question(self, state):
+        if state.stage == ConversationStage.ASK_NAME:
+            return "Let's start with some basic information. What's your name?"
+        if state.stage == ConversationStage.ASK_LOCATION:
+            return f"Nice to meet you, {state.user_name}! Where are you located?"
+        if state.stage == ConversationStage.ASK_EDUCATION:
+            return "What's your educational background or field of study?"
+        if state.stage == ConversationStage.DOMAIN_SELECTION:
+            return "Which tech domain are you interested in? (Frontend, Backend, DevOps, ML, etc.)"
+        return "Let's continue with your assessment."
+
+    def advance(self, state, user_input):
+        if state.stage == ConversationStage.ASK_NAME:
+            if state.extract_name(user_input):
+                state.stage = ConversationStage.ASK_LOCATION
+                return True, self.get_current_question(state)
+            return False, "Please tell me your name using letters only."
+        if state.stage == ConversationStage.ASK_LOCATION:
+            if state.extract_location(user_input):
+                state.stage = ConversationStage.ASK_EDUCATION
+                return True, self.get_current_question(state)
+            return False, "Please tell me your city or country."
+        if state.stage == ConversationStage.ASK_EDUCATION:
+            if state.extract_education(user_input):
+                state.stage = ConversationStage.DOMAIN_SELECTION
+                return True, self.get_current_question(state)
+            return False, "Please tell me your educational background."
+        return False, "Invalid state."
+
+
+# Accepted and rejected inputs for each personal-info slot
+INPUTS = ["Alex", "R2D2", "New York", "x", "Computer Science", "", "   ", "12"]
+
+
+def _snapshot(state):
+    return state.stage, state.user_name, state.user_location, state.user_education
+
+
+def test_every_stage_is_compiled():
+    """The table has a row for each stage and the personal-info rows chain forward"""
+    assert set(TRANSITIONS) == set(ConversationStage)
+    assert PERSONAL_INFO_STAGES == (ConversationStage.ASK_NAME, ConversationStage.ASK_LOCATION,
+                                    ConversationStage.ASK_EDUCATION)
+    for stage in PERSONAL_INFO_STAGES:
+        assert TRANSITIONS[stage].next_stage.ordinal == stage.ordinal + 1
+    print(f"✓ {len(TRANSITIONS)} stages compiled")
+
+
+def test_all_paths_match_reference():
+    """Every 4-turn input sequence from every stage behaves like the if-chain"""
+    controller, reference = StateController(), ReferenceController()
+    paths = 0
+    for start in ConversationStage:
+        for path in itertools.product(INPUTS, repeat=4):
+            state, expected = ConversationState(), ConversationState()
+            state.stage = expected.stage = start
+            for text in path:
+                assert controller.get_current_question(state) == reference.get_current_question(expected)
+                assert controller.advance(state, text) == reference.advance(expected, text), (start, path)
+                assert _snapshot(state) == _snapshot(expected), (start, path)
+            paths += 1
+    print(f"✓ {paths} paths match the reference controller")
+
+
+def test_stage_names_and_completion():
+    """Only the result stage is complete, and each stage has its own name"""
+    controller = StateController()
+    state = ConversationState()
+    names = set()
+    for stage in ConversationStage:
+        state.stage = stage
+        names.add(controller.get_stage_name(state))
+        assert controller.is_complete(state) == (stage == ConversationStage.RESULT)
+    assert len(names) == len(ConversationStage)
+    print(f"✓ stage names: {', '.join(sorted(names))}")
+
+
+if __name__ == "__main__":
+    test_every_stage_is_compiled()
+    test_all_paths_match_reference()
+    test_stage_names_and_completion()
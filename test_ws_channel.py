@@ -0,0 +1,150 @@
+"""
+Test script for the WebSocket conversation channel
+Checks a whole assessment over /ws, frame dispatch and errors, heartbeats
+and the idle timeout, and that the bounded outbox holds back a stalled client
+"""
+
+import sys
+import os
+import asyncio
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from fastapi.testclient import TestClient
+from starlette.websockets import WebSocketDisconnect
+
+import main
+from ws_channel import ConversationChannel
+
+client = TestClient(main.app)
+
+
+def _receive_until(ws, *types):
+    """Frames up to and including the first of one of these types"""
+    frames = []
+    while not frames or frames[-1]["type"] not in types:
+        frames.append(ws.receive_json())
+    return frames
+
+
+def test_conversation_over_socket():
+    """start, personal info, domain and six answers as message frames end in streamed results"""
+    with client.websocket_connect("/ws") as ws:
+        ws.send_json({"type": "start", "id": 1})
+        session = ws.receive_json()
+        assert session["type"] == "session" and session["id"] == 1
+        assert ws.receive_json()["type"] == "question"
+
+        for text in ["Asha", "Pune", "BSc Computer Science", "backend"]:
+            ws.send_json({"type": "message", "text": text, "id": text})
+            assert _receive_until(ws, "question", "error")[-1]["type"] == "question"
+        for n in range(6):
+            ws.send_json({"type": "message", "text": "yes", "id": n})
+            frames = _receive_until(ws, "question", "completed")
+            assert frames[0] == {"type": "acknowledgment", "message": frames[0]["message"], "id": n}
+
+    sections = {frame["section"]: frame["value"] for frame in frames if frame["type"] == "recommendation"}
+    assert frames[-1] == {"type": "completed", "id": 5}
+    assert sections["score"] == "6/6" and sections["level"] == "Advanced"
+    assert main.sessions[session["session_id"]].stage == main.ConversationStage.RESULT
+    print(f"✓ assessment over one socket, {len(sections)} result sections streamed")
+
+
+def test_frame_dispatch():
+    """Typed frames go to their WS_HANDLERS entry; bad frames get an error and the socket stays open"""
+    with client.websocket_connect("/ws") as ws:
+        ws.send_json({"type": "message", "text": "hi"})
+        assert ws.receive_json() == {"type": "error", "message": "Send a start frame first."}
+
+        ws.send_json({"type": "start"})
+        session_id = ws.receive_json()["session_id"]
+        ws.receive_json()
+
+        ws.send_json({"type": "plan", "domain": "devops", "id": "p"})
+        plan = ws.receive_json()
+        assert plan["type"] == "plan" and plan["id"] == "p" and plan["data"]["domain"] == "devops"
+        assert plan["data"]["questions"] == [q["q"] for q in main._get_session_questions(session_id, "devops")]
+
+        ws.send_json({"type": "answers/batch", "answers": ["yes", "maybe"] + ["no"] * 4, "id": "b"})
+        frames = _receive_until(ws, "error")
+        assert frames[-1]["invalid_answers"] == [1] and frames[-1]["id"] == "b"
+
+        ws.send_json({"type": "teleport", "id": 7})
+        assert ws.receive_json() == {"type": "error", "message": "Unknown frame type: teleport", "id": 7}
+        ws.send_json({"type": "answer"})
+        invalid = ws.receive_json()
+        assert invalid["message"] == "Invalid answer frame" and invalid["details"]
+        ws.send_text("not json")
+        assert ws.receive_json() == {"type": "error", "message": "Frames must be JSON objects."}
+        ws.send_json(["a", "list"])
+        assert ws.receive_json() == {"type": "error", "message": "Frames must be JSON objects."}
+
+        ws.send_json({"type": "resume", "session_id": "missing"})
+        assert ws.receive_json() == {"type": "error", "message": "Session not found"}
+    print("✓ frames dispatched, bad frames answered with errors")
+
+
+def test_heartbeat_and_idle_timeout():
+    """A silent client gets pings, then a close frame once the idle timeout passes"""
+    os.environ["WS_HEARTBEAT_SECONDS"], os.environ["WS_IDLE_TIMEOUT_SECONDS"] = "0.1", "0.35"
+    try:
+        with client.websocket_connect("/ws") as ws:
+            frames = _receive_until(ws, "close")
+            try:
+                ws.receive_json()
+                closed = False
+            except WebSocketDisconnect:
+                closed = True
+    finally:
+        del os.environ["WS_HEARTBEAT_SECONDS"], os.environ["WS_IDLE_TIMEOUT_SECONDS"]
+    assert frames[-1] == {"type": "close", "reason": "idle timeout"}
+    assert len(frames) >= 3 and all(frame == {"type": "ping"} for frame in frames[:-1])
+    assert closed
+    print(f"✓ {len(frames) - 1} pings, then closed for idling")
+
+
+class _StalledSocket:
+    """Server side of a client that stops reading until released, or has gone away"""
+
+    def __init__(self, gone=False):
+        self.gone = gone
+        self.sent = []
+        self.release = asyncio.Event()
+
+    async def send_text(self, text):
+        if self.gone:
+            raise RuntimeError("disconnected")
+        await self.release.wait()
+        self.sent.append(text)
+
+
+def test_outbox_is_bounded():
+    """Pushes wait once max_pending frames are queued, and are dropped for a client that has gone"""
+    async def scenario(socket):
+        channel = ConversationChannel(socket, None, max_pending=4)
+        sender = asyncio.create_task(channel._send_loop())
+        pushed = []
+
+        async def producer():
+            for n in range(20):
+                await channel.push({"n": n})
+                pushed.append(n)
+        task = asyncio.create_task(producer())
+        await asyncio.sleep(0.05)
+        held = len(pushed)
+        socket.release.set()
+        await asyncio.wait_for(task, timeout=1)
+        await channel.push(None)
+        await asyncio.wait_for(sender, timeout=1)
+        return held, len(socket.sent)
+
+    # The sender holds one frame while the outbox fills up
+    assert asyncio.run(scenario(_StalledSocket())) == (5, 20)
+    assert asyncio.run(scenario(_StalledSocket(gone=True))) == (20, 0)
+    print("✓ stalled client holds back the dispatcher at 4 queued frames")
+
+
+if __name__ == "__main__":
+    test_conversation_over_socket()
+    test_frame_dispatch()
+    test_heartbeat_and_idle_timeout()
+    test_outbox_is_bounded()
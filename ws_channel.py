@@ -0,0 +1,103 @@
+import asyncio
+import os
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import orjson
+from starlette.websockets import WebSocket, WebSocketDisconnect, WebSocketState
+
+Frame = Dict[str, Any]
+
+
+class ConversationChannel:
+    """
+    One persistent WebSocket connection carrying a whole conversation
+    Inbound frames are handed to a dispatcher one at a time; outbound frames
+    go through a bounded queue, so a client that stops reading blocks the
+    dispatcher instead of letting pushed messages pile up in memory
+    """
+
+    def __init__(self, websocket: WebSocket,
+                 dispatch: Callable[["ConversationChannel", Frame], Awaitable[None]],
+                 heartbeat_interval: Optional[float] = None,
+                 idle_timeout: Optional[float] = None,
+                 max_pending: int = 32):
+        self.websocket = websocket
+        self.dispatch = dispatch
+        self.heartbeat_interval = heartbeat_interval or float(os.getenv("WS_HEARTBEAT_SECONDS", "20"))
+        self.idle_timeout = idle_timeout or float(os.getenv("WS_IDLE_TIMEOUT_SECONDS", "300"))
+        self.session_id: Optional[str] = None
+        self._outbox: asyncio.Queue = asyncio.Queue(maxsize=max_pending)
+        self._closed = False
+
+    async def run(self):
+        """Serve the connection until the client leaves or goes idle"""
+        await self.websocket.accept()
+        sender = asyncio.create_task(self._send_loop())
+        heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+        try:
+            while True:
+                try:
+                    raw = await asyncio.wait_for(self.websocket.receive_text(), timeout=self.idle_timeout)
+                except asyncio.TimeoutError:
+                    await self.push({"type": "close", "reason": "idle timeout"})
+                    break
+                except WebSocketDisconnect:
+                    break
+
+                try:
+                    frame = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    await self.push({"type": "error", "message": "Frames must be JSON objects."})
+                    continue
+                if not isinstance(frame, dict):
+                    await self.push({"type": "error", "message": "Frames must be JSON objects."})
+                    continue
+
+                if frame.get("type") == "pong":
+                    continue
+                await self.dispatch(self, frame)
+        finally:
+            heartbeat.cancel()
+            # Let queued frames drain, then stop the sender
+            try:
+                if not self._closed:
+                    await asyncio.wait_for(self._outbox.put(None), timeout=5)
+                await asyncio.wait_for(sender, timeout=5)
+            except asyncio.TimeoutError:
+                sender.cancel()
+            if self.websocket.client_state == WebSocketState.CONNECTED:
+                try:
+                    await self.websocket.close()
+                except RuntimeError:
+                    pass
+
+    async def push(self, frame: Frame):
+        """Queue a frame for the client, waiting while the outbox is full"""
+        if not self._closed:
+            await self._outbox.put(frame)
+
+    async def reply(self, request: Frame, frame: Frame):
+        """Push a frame tagged with the id of the request it answers"""
+        if "id" in request:
+            frame["id"] = request["id"]
+        await self.push(frame)
+
+    async def _send_loop(self):
+        while True:
+            frame = await self._outbox.get()
+            if frame is None:
+                return
+            try:
+                await self.websocket.send_text(orjson.dumps(frame).decode())
+            except Exception:
+                # Client is gone: release anyone blocked on a full outbox
+                self._closed = True
+                while not self._outbox.empty():
+                    self._outbox.get_nowait()
+                return
+
+    async def _heartbeat_loop(self):
+        while True:
+            await asyncio.sleep(self.heartbeat_interval)
+            await self.push({"type": "ping"})